@@ -1,9 +1,14 @@
 from jose import JWTError, jwt
+from uuid import UUID
 from fastapi import Depends, HTTPException, status, Request
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select
 from sqlalchemy.orm import Session
-from app.database import SessionLocal
+from app.database import SessionLocal, AsyncSessionLocal, DB_MODE
 from app.models.user import User
 from app.core.security import decode_access_token
+from app.core.config import settings
+from app.core.principal_cache import principal_cache
 
 
 def get_db():
@@ -13,10 +18,22 @@ def get_db():
     finally:
         db.close()
 
-def get_current_user(
-    request: Request,
-    db: Session = Depends(get_db)
-):
+def load_user_sync(user_id: UUID):
+    db = SessionLocal()
+    try:
+        return db.query(User).filter(User.id == user_id, User.deletion_started_at.is_(None)).first()
+    finally:
+        db.close()
+
+async def load_user(user_id: UUID):
+    if DB_MODE == "async":
+        async with AsyncSessionLocal() as db:
+            return (await db.execute(
+                select(User).where(User.id == user_id, User.deletion_started_at.is_(None))
+            )).scalar_one_or_none()
+    return await run_in_threadpool(load_user_sync, user_id)
+
+async def get_current_user(request: Request):
     token = request.cookies.get("access_token")
     if not token:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
@@ -26,16 +43,25 @@ def get_current_user(
         user_id: str = payload.get("sub")
         if user_id is None:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
-    except JWTError:
+        user_id = UUID(user_id)
+    except (JWTError, ValueError):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
 
-    user = db.query(User).filter(User.id == user_id).first()
-    if user is None:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
+    principal = principal_cache.get(user_id)
+    if principal is None and settings.TRUST_TOKEN_CLAIMS and not principal_cache.was_invalidated(user_id):
+        if "email" in payload and "is_admin" in payload:
+            principal = principal_cache.set(user_id, payload["email"], payload["is_admin"])
+
+    if principal is None:
+        user = await load_user(user_id)
+        if user is None:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
+        principal = principal_cache.set(user.id, user.email, user.is_admin)
 
-    return user
+    # A detached User carrying only the cached fields; handlers read id, email and is_admin.
+    return User(**principal)
 
-def get_current_admin(current_user: User = Depends(get_current_user)):
+async def get_current_admin(current_user: User = Depends(get_current_user)):
     if not current_user.is_admin:
         raise HTTPException(status_code=403, detail="Admin access required")
     return current_user
\ No newline at end of file
@@ -0,0 +1,160 @@
+import gzip
+import threading
+from typing import Dict, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip covers every client we serve
+    brotli = None
+
+COMPRESSIBLE_TYPES = ("application/json", "text/", "application/javascript", "application/xml")
+
+
+def parse_accept_encoding(header: str) -> Dict[str, float]:
+    """Map each coding in an Accept-Encoding header to its q-value."""
+    accepted = {}
+    for part in header.split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[coding] = q
+    return accepted
+
+
+def choose_encoding(header: str) -> Optional[str]:
+    accepted = parse_accept_encoding(header)
+    wildcard = accepted.get("*", 0.0)
+    candidates = (["br"] if brotli is not None else []) + ["gzip"]
+    ranked = [(accepted.get(coding, wildcard), coding) for coding in candidates]
+    # Highest q wins; ties go to the earlier (denser) coding.
+    best_q, best = max(ranked, key=lambda item: (item[0], -candidates.index(item[1])))
+    return best if best_q > 0 else None
+
+
+class CompressionStats:
+    """Process-local byte counters, exposed through GET /admin/metrics."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = {"compressed": 0, "skipped": 0, "bytes_in": 0, "bytes_out": 0}
+        self._by_encoding: Dict[str, int] = {}
+
+    def record_compressed(self, encoding: str, size_in: int, size_out: int) -> None:
+        with self._lock:
+            self._counts["compressed"] += 1
+            self._counts["bytes_in"] += size_in
+            self._counts["bytes_out"] += size_out
+            self._by_encoding[encoding] = self._by_encoding.get(encoding, 0) + 1
+
+    def record_skipped(self) -> None:
+        with self._lock:
+            self._counts["skipped"] += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            saved = self._counts["bytes_in"] - self._counts["bytes_out"]
+            return {
+                **self._counts,
+                "bytes_saved": saved,
+                "ratio": round(self._counts["bytes_out"] / self._counts["bytes_in"], 3) if self._counts["bytes_in"] else None,
+                "by_encoding": dict(self._by_encoding),
+                "brotli_available": brotli is not None,
+            }
+
+
+compression_stats = CompressionStats()
+
+
+class CompressionMiddleware:
+    """
+    gzip/brotli compression for complete, compressible response bodies.
+
+    Only responses sent as a single body message are considered, so streams
+    (SSE, exports) pass through untouched. Bodies under `minimum_size`,
+    non-text content types and responses that are already encoded are left
+    alone.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 5,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        start_message: Optional[Message] = None
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start_message, passthrough
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            if start_message is None:
+                await send(message)
+                return
+            start, start_message = start_message, None
+            headers = MutableHeaders(raw=start["headers"])
+            body = message.get("body", b"")
+
+            if message.get("more_body", False):
+                # Streaming response: send it as it comes.
+                passthrough = True
+                compression_stats.record_skipped()
+                await send(start)
+                await send(message)
+                return
+
+            compressible = (
+                start["status"] not in (204, 304)
+                and "content-encoding" not in headers
+                and headers.get("content-type", "").startswith(COMPRESSIBLE_TYPES)
+            )
+            if compressible:
+                headers.add_vary_header("Accept-Encoding")
+            if not compressible or encoding is None or len(body) < self.minimum_size:
+                compression_stats.record_skipped()
+                await send(start)
+                await send(message)
+                return
+
+            compressed = self.compress(body, encoding)
+            compression_stats.record_compressed(encoding, len(body), len(compressed))
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(compressed))
+            await send(start)
+            await send({"type": "http.response.body", "body": compressed, "more_body": False})
+
+        await self.app(scope, receive, send_wrapper)
+
+    def compress(self, body: bytes, encoding: str) -> bytes:
+        if encoding == "br":
+            return brotli.compress(body, quality=self.brotli_quality)
+        return gzip.compress(body, compresslevel=self.gzip_level, mtime=0)
@@ -10,6 +10,40 @@ class Settings(BaseSettings):
     ALGORITHM: str
     ACCESS_TOKEN_EXPIRE_MINUTES: int
     FRONTEND_URL: str
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 60
+    PRINCIPAL_CACHE_MAX_SIZE: int = 10000
+    TRUST_TOKEN_CLAIMS: bool = False
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_EXECUTOR: str = "process"
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_QUEUE: int = 64
+    SYNC_TOMBSTONE_RETENTION_DAYS: int = 30
+    SYNC_COMPACTION_INTERVAL_SECONDS: int = 3600
+    EVENTS_BACKEND: str = "local"
+    SSE_MAX_CONNECTIONS_PER_USER: int = 5
+    SSE_QUEUE_SIZE: int = 100
+    SSE_HEARTBEAT_SECONDS: int = 15
+    COMPRESSION_MIN_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 5
+    IMPORT_MAX_BYTES: int = 50 * 1024 * 1024
+    # 0 keeps application history forever
+    ACTIVITY_RETENTION_MONTHS: int = 0
+    ACTIVITY_PARTITIONS_AHEAD: int = 2
+    ACTIVITY_MAINTENANCE_INTERVAL_SECONDS: int = 86400
+    # Rows per transaction when an account is deleted in the background
+    ACCOUNT_DELETE_CHUNK_SIZE: int = 1000
+    # Job worker tasks inside each web process; 0 when a separate
+    # `python -m app.worker` process does the work
+    JOB_WORKERS_IN_PROCESS: int = 1
+    JOB_POLL_INTERVAL_SECONDS: int = 5
+    JOB_MAX_ATTEMPTS: int = 5
+    JOB_RETRY_BASE_SECONDS: int = 30
+    JOB_RETRY_MAX_SECONDS: int = 3600
+    # A running job whose worker has held it this long is assumed dead
+    JOB_LOCK_TIMEOUT_SECONDS: int = 3600
+    # 0 keeps finished jobs forever
+    JOB_RETENTION_DAYS: int = 14
 
     class Config:
         env_file = ".env"
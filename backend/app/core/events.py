@@ -0,0 +1,239 @@
+import asyncio
+import json
+import logging
+import select
+import threading
+from typing import Dict, List, Optional, Set
+
+from fastapi import HTTPException
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+NOTIFY_CHANNEL = "jobtracker_events"
+# Postgres rejects NOTIFY payloads of 8000 bytes or more.
+MAX_NOTIFY_PAYLOAD = 7900
+
+
+class Subscription:
+    """
+    One live connection's mailbox, bound to the event loop that serves it.
+
+    The queue is bounded: a client that stops reading is not allowed to make
+    the worker buffer events without limit. When it overflows the backlog is
+    dropped and the client gets a single `resync` event instead, telling it
+    to catch up through GET /applications/changes.
+    """
+
+    def __init__(self, user_id: str, queue_size: int):
+        self.user_id = user_id
+        self.loop = asyncio.get_running_loop()
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.behind = False
+        self.dropped = 0
+
+    def offer(self, message: dict) -> None:
+        # Runs on self.loop.
+        if self.behind:
+            # A resync is already waiting; it covers this event too.
+            self.dropped += 1
+            return
+        if self.queue.full():
+            self.dropped += self.queue.qsize() + 1
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait({"type": "resync"})
+            self.behind = True
+            return
+        self.queue.put_nowait(message)
+
+    async def get(self) -> dict:
+        message = await self.queue.get()
+        if message["type"] == "resync":
+            self.behind = False
+        return message
+
+
+class EventBroker:
+    """
+    Fans change events out to the SSE connections held by this worker.
+
+    Publishing is thread-safe and never blocks: each event is handed to the
+    subscriber's own event loop. Connections are capped per user so one
+    account cannot hold an unbounded number of streams open on a worker.
+    """
+
+    def __init__(self, max_connections_per_user: int, queue_size: int):
+        self.max_connections_per_user = max_connections_per_user
+        self.queue_size = queue_size
+        self._subscribers: Dict[str, Set[Subscription]] = {}
+        self._lock = threading.Lock()
+        self._published = 0
+        self._rejected = 0
+
+    def subscribe(self, user_id) -> Subscription:
+        key = str(user_id)
+        with self._lock:
+            current = self._subscribers.setdefault(key, set())
+            if len(current) >= self.max_connections_per_user:
+                self._rejected += 1
+                raise HTTPException(status_code=429, detail="Too many open live-update connections")
+            subscription = Subscription(key, self.queue_size)
+            current.add(subscription)
+            return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            current = self._subscribers.get(subscription.user_id)
+            if current is not None:
+                current.discard(subscription)
+                if not current:
+                    del self._subscribers[subscription.user_id]
+
+    def dispatch(self, user_id, message: dict) -> None:
+        with self._lock:
+            targets = list(self._subscribers.get(str(user_id), ()))
+            self._published += 1
+        for subscription in targets:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.offer, message)
+            except RuntimeError:
+                # The subscriber's loop has already shut down.
+                self.unsubscribe(subscription)
+
+    def stats(self) -> dict:
+        with self._lock:
+            subscriptions = [s for subs in self._subscribers.values() for s in subs]
+            return {
+                "backend": settings.EVENTS_BACKEND,
+                "users": len(self._subscribers),
+                "connections": len(subscriptions),
+                "published": self._published,
+                "rejected": self._rejected,
+                "dropped": sum(s.dropped for s in subscriptions),
+            }
+
+
+broker = EventBroker(
+    max_connections_per_user=settings.SSE_MAX_CONNECTIONS_PER_USER,
+    queue_size=settings.SSE_QUEUE_SIZE,
+)
+
+
+class LocalBackend:
+    """Delivers events to this worker's connections only, after commit."""
+
+    def before_commit(self, session: Session, events: List[dict]) -> None:
+        pass
+
+    def after_commit(self, session: Session, events: List[dict]) -> None:
+        for message in events:
+            broker.dispatch(message["user_id"], message["event"])
+
+    def start(self) -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
+
+
+class PostgresNotifyBackend:
+    """
+    Fans events out across workers with LISTEN/NOTIFY.
+
+    pg_notify runs inside the mutating transaction, so Postgres only delivers
+    it if the transaction commits. Each worker keeps one listening connection
+    on a background thread and hands what it hears to the local broker.
+    """
+
+    def __init__(self):
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+
+    def before_commit(self, session: Session, events: List[dict]) -> None:
+        for message in events:
+            payload = json.dumps(message, default=str)
+            if len(payload.encode()) > MAX_NOTIFY_PAYLOAD:
+                payload = json.dumps({"user_id": str(message["user_id"]), "event": {"type": "resync"}})
+            session.execute(text("SELECT pg_notify(:channel, :payload)"), {"channel": NOTIFY_CHANNEL, "payload": payload})
+
+    def after_commit(self, session: Session, events: List[dict]) -> None:
+        pass
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._stopping.clear()
+            self._thread = threading.Thread(target=self._listen_forever, name="events-listener", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stopping.set()
+        self._thread = None
+
+    def _listen_forever(self) -> None:
+        from app.database import engine
+
+        while not self._stopping.is_set():
+            try:
+                connection = engine.raw_connection()
+                # A LISTEN connection lives in autocommit mode for good; keep
+                # it out of the pool.
+                connection.detach()
+                try:
+                    self._listen(connection.driver_connection)
+                finally:
+                    connection.close()
+            except Exception:
+                logger.exception("Event listener lost its connection; reconnecting")
+                self._stopping.wait(1)
+
+    def _listen(self, conn) -> None:
+        conn.autocommit = True
+        with conn.cursor() as cursor:
+            cursor.execute(f"LISTEN {NOTIFY_CHANNEL}")
+        while not self._stopping.is_set():
+            if select.select([conn], [], [], 1.0) == ([], [], []):
+                continue
+            conn.poll()
+            while conn.notifies:
+                notify = conn.notifies.pop(0)
+                try:
+                    message = json.loads(notify.payload)
+                    broker.dispatch(message["user_id"], message["event"])
+                except (ValueError, KeyError):
+                    logger.warning(f"Ignoring malformed event payload: {notify.payload!r}")
+
+
+backend = PostgresNotifyBackend() if settings.EVENTS_BACKEND == "postgres" else LocalBackend()
+
+
+def emit_event(db: Session, user_id, event_type: str, **data) -> None:
+    """
+    Queue a change event on the session; it is published only if the
+    session's transaction commits.
+    """
+    db.info.setdefault("pending_events", []).append(
+        {"user_id": str(user_id), "event": {"type": event_type, **data}}
+    )
+
+
+@event.listens_for(Session, "before_commit")
+def _publish_before_commit(session: Session) -> None:
+    events = session.info.get("pending_events")
+    if events:
+        backend.before_commit(session, events)
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_after_commit(session: Session) -> None:
+    events = session.info.pop("pending_events", None)
+    if events:
+        backend.after_commit(session, events)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_on_rollback(session: Session) -> None:
+    session.info.pop("pending_events", None)
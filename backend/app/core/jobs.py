@@ -0,0 +1,290 @@
+"""
+Background jobs, queued in the `jobs` table.
+
+Handlers register under a kind with `@job_handler("kind")` and are called
+as `handler(db, payload)` with a session of their own; whatever they return
+(a JSON-able dict, or None) is stored as the job's result. A handler that
+raises is retried with exponential backoff until the job's attempts run
+out. While a handler runs its worker keeps refreshing the job's lock;
+handlers should still be idempotent, since a job whose worker died mid-run
+is picked up again once its lock times out.
+
+Workers run inside the web process (JOB_WORKERS_IN_PROCESS asyncio tasks,
+started with the app) or as a process of their own:
+
+    cd backend
+    python -m app.worker
+
+Either way they claim work with SELECT ... FOR UPDATE SKIP LOCKED, so any
+number of them can poll the same table without queueing behind each
+other's locks.
+"""
+import asyncio
+import logging
+import os
+import socket
+import threading
+import traceback
+from datetime import timedelta
+from typing import Callable, Dict, Optional
+from uuid import UUID, uuid4
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.database import SessionLocal
+from app.models.application import utcnow
+from app.models.job import Job
+
+logger = logging.getLogger(__name__)
+
+QUEUED, RUNNING, SUCCEEDED, FAILED = "queued", "running", "succeeded", "failed"
+JOB_STATUSES = (QUEUED, RUNNING, SUCCEEDED, FAILED)
+# Longest traceback kept in last_error
+MAX_ERROR_LENGTH = 4000
+# How often an idle worker requeues stale jobs and prunes old ones
+TIDY_INTERVAL = timedelta(minutes=1)
+
+JobHandler = Callable[[Session, dict], Optional[dict]]
+JOB_HANDLERS: Dict[str, JobHandler] = {}
+
+def job_handler(kind: str):
+    def register(fn: JobHandler) -> JobHandler:
+        JOB_HANDLERS[kind] = fn
+        return fn
+    return register
+
+def worker_name() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+
+def retry_delay(attempts: int) -> timedelta:
+    """Backoff after the `attempts`-th failure: base, 2x base, 4x base, ... capped."""
+    seconds = settings.JOB_RETRY_BASE_SECONDS * 2 ** max(attempts - 1, 0)
+    return timedelta(seconds=min(seconds, settings.JOB_RETRY_MAX_SECONDS))
+
+def enqueue_job(
+    db: Session,
+    kind: str,
+    payload: Optional[dict] = None,
+    created_by: Optional[UUID] = None,
+    max_attempts: Optional[int] = None,
+) -> Job:
+    """Add a job in the caller's transaction; it becomes visible to workers on commit."""
+    if kind not in JOB_HANDLERS:
+        raise ValueError(f"Unknown job kind '{kind}'")
+    job = Job(
+        id=uuid4(),
+        kind=kind,
+        payload=payload or {},
+        status=QUEUED,
+        attempts=0,
+        max_attempts=max_attempts or settings.JOB_MAX_ATTEMPTS,
+        run_at=utcnow(),
+        created_at=utcnow(),
+        created_by=created_by,
+    )
+    db.add(job)
+    db.flush()
+    return job
+
+def claim_job(db: Session, worker: str) -> Optional[Job]:
+    """
+    Take the next due job and mark it running. On Postgres, SKIP LOCKED lets
+    concurrent workers pass over a row another one is claiming. Databases
+    without row locks (SQLite in tests) ignore FOR UPDATE; there the status
+    check on the UPDATE is what stops two workers taking the same job.
+    """
+    now = utcnow()
+    job_id = db.execute(
+        select(Job.id)
+        .where(Job.status == QUEUED, Job.run_at <= now)
+        .order_by(Job.run_at)
+        .limit(1)
+        .with_for_update(skip_locked=True)
+    ).scalar()
+    if job_id is None:
+        db.rollback()
+        return None
+    claimed = db.execute(
+        update(Job)
+        .where(Job.id == job_id, Job.status == QUEUED)
+        .values(status=RUNNING, attempts=Job.attempts + 1, locked_by=worker, locked_at=now, started_at=now)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    db.commit()
+    return db.get(Job, job_id) if claimed else None
+
+def held_by(job_id: UUID, worker: str) -> tuple:
+    """
+    Conditions for writes that only the worker still holding the job may
+    make; a worker whose lock expired and was taken over matches nothing.
+    """
+    return (Job.id == job_id, Job.status == RUNNING, Job.locked_by == worker)
+
+def heartbeat_job(db: Session, job_id: UUID, worker: str) -> bool:
+    """Refresh the lock on a running job; False once the worker no longer holds it."""
+    held = db.execute(
+        update(Job)
+        .where(*held_by(job_id, worker))
+        .values(locked_at=utcnow())
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    db.commit()
+    return bool(held)
+
+def finish_job(db: Session, job_id: UUID, worker: str, result: Optional[dict]) -> bool:
+    finished = db.execute(
+        update(Job)
+        .where(*held_by(job_id, worker))
+        .values(status=SUCCEEDED, result=result, finished_at=utcnow(), locked_by=None, locked_at=None)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    db.commit()
+    return bool(finished)
+
+def fail_job(db: Session, job_id: UUID, worker: str, attempts: int, max_attempts: int, error: str) -> bool:
+    """Requeue the job after a backoff, or fail it for good once it is out of attempts."""
+    now = utcnow()
+    values = {"last_error": error[-MAX_ERROR_LENGTH:], "locked_by": None, "locked_at": None}
+    if attempts < max_attempts:
+        values.update(status=QUEUED, run_at=now + retry_delay(attempts))
+    else:
+        values.update(status=FAILED, finished_at=now)
+    failed = db.execute(
+        update(Job).where(*held_by(job_id, worker)).values(**values).execution_options(synchronize_session=False)
+    ).rowcount
+    db.commit()
+    return bool(failed)
+
+def heartbeat_interval() -> float:
+    # Several beats per lock timeout, so one slow beat doesn't lose the job.
+    return max(settings.JOB_LOCK_TIMEOUT_SECONDS / 4, 1)
+
+def keep_job_locked(job_id: UUID, worker: str, done: threading.Event) -> None:
+    """Heartbeat thread: refresh locked_at until the handler is done or the lock is lost."""
+    while not done.wait(heartbeat_interval()):
+        db = SessionLocal()
+        try:
+            if not heartbeat_job(db, job_id, worker):
+                logger.warning(f"Job {job_id} is no longer held by {worker}; stopping its heartbeat")
+                return
+        except Exception:
+            logger.exception(f"Heartbeat for job {job_id} failed")
+        finally:
+            db.close()
+
+def run_job(job: Job) -> None:
+    worker = job.locked_by
+    done = threading.Event()
+    heartbeat = threading.Thread(target=keep_job_locked, args=(job.id, worker, done), daemon=True)
+    heartbeat.start()
+
+    def stop_heartbeat():
+        done.set()
+        heartbeat.join()
+
+    db = SessionLocal()
+    try:
+        try:
+            handler = JOB_HANDLERS.get(job.kind)
+            if handler is None:
+                raise LookupError(f"No handler registered for job kind '{job.kind}'")
+            result = handler(db, dict(job.payload))
+            db.commit()
+        except Exception:
+            db.rollback()
+            stop_heartbeat()
+            logger.exception(f"Job {job.id} ({job.kind}) failed on attempt {job.attempts}/{job.max_attempts}")
+            if not fail_job(db, job.id, worker, job.attempts, job.max_attempts, traceback.format_exc()):
+                logger.warning(f"Job {job.id} was taken over by another worker; dropping this attempt's failure")
+            return
+        stop_heartbeat()
+        if not finish_job(db, job.id, worker, result):
+            logger.warning(f"Job {job.id} was taken over by another worker; dropping this attempt's result")
+            return
+    finally:
+        stop_heartbeat()
+        db.close()
+    logger.info(f"Job {job.id} ({job.kind}) succeeded on attempt {job.attempts}")
+
+def recover_stale_jobs(db: Session, lock_timeout_seconds: int) -> int:
+    """Put running jobs whose worker went silent back in the queue, or fail those out of attempts."""
+    now = utcnow()
+    stale = (Job.status == RUNNING, Job.locked_at < now - timedelta(seconds=lock_timeout_seconds))
+    released = {"locked_by": None, "locked_at": None, "last_error": f"Worker lock expired after {lock_timeout_seconds}s"}
+    requeued = db.execute(
+        update(Job)
+        .where(*stale, Job.attempts < Job.max_attempts)
+        .values(status=QUEUED, run_at=now, **released)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    failed = db.execute(
+        update(Job)
+        .where(*stale)
+        .values(status=FAILED, finished_at=now, **released)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    db.commit()
+    return requeued + failed
+
+def prune_jobs(db: Session, retention_days: int) -> int:
+    cutoff = utcnow() - timedelta(days=retention_days)
+    removed = db.execute(
+        delete(Job)
+        .where(Job.status.in_((SUCCEEDED, FAILED)), Job.finished_at < cutoff)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    db.commit()
+    return removed
+
+def work_once(worker: str) -> bool:
+    """Claim and run one job; False when there was nothing to do."""
+    db = SessionLocal()
+    try:
+        job = claim_job(db, worker)
+        if job is not None:
+            db.expunge(job)
+    finally:
+        db.close()
+    if job is None:
+        return False
+    run_job(job)
+    return True
+
+def tidy_jobs() -> None:
+    db = SessionLocal()
+    try:
+        recovered = recover_stale_jobs(db, settings.JOB_LOCK_TIMEOUT_SECONDS)
+        if recovered:
+            logger.warning(f"Released {recovered} jobs whose worker stopped responding")
+        if settings.JOB_RETENTION_DAYS > 0:
+            prune_jobs(db, settings.JOB_RETENTION_DAYS)
+    finally:
+        db.close()
+
+async def run_job_worker(worker: str) -> None:
+    logger.info(f"Job worker {worker} started")
+    last_tidy = None
+    while True:
+        try:
+            if await asyncio.to_thread(work_once, worker):
+                continue
+            if last_tidy is None or utcnow() - last_tidy >= TIDY_INTERVAL:
+                await asyncio.to_thread(tidy_jobs)
+                last_tidy = utcnow()
+        except Exception:
+            logger.exception(f"Job worker {worker} hit an error")
+        await asyncio.sleep(settings.JOB_POLL_INTERVAL_SECONDS)
+
+_worker_tasks = []
+
+def start_job_workers() -> None:
+    loop = asyncio.get_running_loop()
+    for _ in range(settings.JOB_WORKERS_IN_PROCESS):
+        _worker_tasks.append(loop.create_task(run_job_worker(worker_name())))
+
+def stop_job_workers() -> None:
+    for task in _worker_tasks:
+        task.cancel()
+    _worker_tasks.clear()
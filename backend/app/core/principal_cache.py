@@ -0,0 +1,81 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from app.core.config import settings
+
+
+class PrincipalCache:
+    """
+    Bounded, TTL-based, per-process cache of authenticated principals keyed
+    by user id, so authenticated requests can skip the users lookup.
+
+    Entries hold only what handlers read off current_user (id, email,
+    is_admin). Each worker process has its own cache, so a change made on
+    another worker is picked up at the latest when the entry's TTL runs out.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: int, invalidation_window_seconds: int):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.invalidation_window_seconds = invalidation_window_seconds
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._invalidated: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def get(self, user_id) -> Optional[dict]:
+        key = str(user_id)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, principal = entry
+            if expires_at <= now:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return principal
+
+    def set(self, user_id, email: str, is_admin) -> dict:
+        key = str(user_id)
+        principal = {"id": user_id, "email": email, "is_admin": is_admin}
+        if self.max_size <= 0 or self.ttl_seconds <= 0:
+            return principal
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, principal)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return principal
+
+    def invalidate(self, user_id) -> None:
+        """
+        Drop a user's entry and, for the lifetime of any token already issued,
+        stop trusting that user's token claims on this worker.
+        """
+        key = str(user_id)
+        now = time.monotonic()
+        with self._lock:
+            self._entries.pop(key, None)
+            self._invalidated[key] = now + self.invalidation_window_seconds
+            for stale in [k for k, until in self._invalidated.items() if until <= now]:
+                del self._invalidated[stale]
+
+    def was_invalidated(self, user_id) -> bool:
+        with self._lock:
+            until = self._invalidated.get(str(user_id))
+            return until is not None and until > time.monotonic()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._invalidated.clear()
+
+
+principal_cache = PrincipalCache(
+    max_size=settings.PRINCIPAL_CACHE_MAX_SIZE,
+    ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+    invalidation_window_seconds=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+)
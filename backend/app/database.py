@@ -1,6 +1,8 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
 import os
 
 DATABASE_URL = os.getenv("DATABASE_URL")
@@ -8,7 +10,62 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 if DATABASE_URL.startswith("postgres://"):
     DATABASE_URL = DATABASE_URL.replace("postgres://", "postgresql://", 1)
 
+# "sync" runs routes on the psycopg2 engine in Starlette's thread pool,
+# "async" serves them from the event loop through an AsyncSession.
+DB_MODE = os.getenv("DB_MODE", "sync").lower()
+
 engine = create_engine(DATABASE_URL, pool_pre_ping=True)
+
+def enforce_sqlite_foreign_keys(target_engine):
+    """
+    Deletes lean on ON DELETE CASCADE (the ORM relationships are passive),
+    which SQLite only honours with foreign key enforcement switched on.
+    """
+    if target_engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(target_engine, "connect")
+    def _enable_foreign_keys(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+enforce_sqlite_foreign_keys(engine)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
+
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+def to_async_url(url: str) -> str:
+    scheme, rest = url.split("://", 1)
+    return f"{ASYNC_DRIVERS.get(scheme, scheme)}://{rest}"
+
+async_engine = None
+AsyncSessionLocal = None
+
+if DB_MODE == "async":
+    from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+    async_engine = create_async_engine(to_async_url(DATABASE_URL), pool_pre_ping=True)
+    enforce_sqlite_foreign_keys(async_engine.sync_engine)
+    # Handlers return ORM rows that are serialized after the session is done
+    # with them, so attributes must not expire on commit.
+    AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+async def run_db(db, fn, *args):
+    """
+    Run a sync ORM function `fn(session, *args)` from an async handler with
+    either session type: on the event loop for an AsyncSession, in the
+    thread pool for a plain Session.
+    """
+    if isinstance(db, AsyncSession):
+        return await db.run_sync(fn, *args)
+    return await run_in_threadpool(fn, db, *args)
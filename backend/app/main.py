@@ -1,25 +1,63 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.database import engine, Base
 from app.models.user import User
 from app.models.application import Application
 from app.models.tag import Tag
+from app.models.sync_tombstone import SyncTombstone
+from app.models.tag_usage import TagUsage
+from app.models.status_transition import StatusTransition
+from app.models.status_rollup import StatusDailyRollup, StatusDwellRollup
+from app.models.application_activity import ApplicationActivity
+from app.models.job import Job
 from app.routes import applications
 from app.routes import auth
 from app.routes import tags
 from app.routes import admin
 from app.routes import admin_tools
+from app.routes import events
 from app.core.config import settings
+from app.database import DB_MODE
+from app.utils.async_routes import mirror_router_async
+from app.core.password_hasher import password_hasher
+from app.utils.sync import start_tombstone_compaction, stop_tombstone_compaction
+from app.utils.activity import start_activity_maintenance, stop_activity_maintenance
+from app.core.jobs import start_job_workers, stop_job_workers
+from app.core.events import backend as events_backend
+from app.utils.serialization import FastJSONResponse
+from app.core.compression import CompressionMiddleware
 
-Base.metadata.create_all(bind=engine)
+app = FastAPI(default_response_class=FastJSONResponse)
 
-app = FastAPI()
+routers = [
+    (auth.router, {"prefix": "/auth"}),
+    (applications.router, {"prefix": "/applications", "tags": ["Applications"]}),
+    (tags.router, {"prefix": "/tags", "tags": ["Tags"]}),
+    (events.router, {"prefix": "/events", "tags": ["Events"]}),
+    (admin.router, {}),
+    (admin_tools.router, {}),
+]
 
-app.include_router(auth.router, prefix="/auth")
-app.include_router(applications.router, prefix="/applications", tags=["Applications"])
-app.include_router(tags.router, prefix="/tags", tags=["Tags"])
-app.include_router(admin.router)
-app.include_router(admin_tools.router)
+for router, options in routers:
+    if DB_MODE == "async":
+        router = mirror_router_async(router)
+    app.include_router(router, **options)
+
+app.add_event_handler("startup", start_tombstone_compaction)
+app.add_event_handler("startup", start_activity_maintenance)
+app.add_event_handler("startup", events_backend.start)
+app.add_event_handler("startup", start_job_workers)
+app.add_event_handler("shutdown", stop_tombstone_compaction)
+app.add_event_handler("shutdown", stop_activity_maintenance)
+app.add_event_handler("shutdown", stop_job_workers)
+app.add_event_handler("shutdown", events_backend.stop)
+app.add_event_handler("shutdown", password_hasher.shutdown)
+
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.COMPRESSION_MIN_SIZE,
+    gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+    brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, Text, Boolean
+from sqlalchemy import Column, String, DateTime, ForeignKey, Text, Boolean, Integer, Index, text, DDL, event
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import uuid
@@ -10,11 +10,36 @@ from app.models.mixins import TimestampMixin
 def utcnow():
     return datetime.now(timezone.utc)
 
+ACTIVE_ROWS = text("is_deleted = false")
+DELETED_ROWS = text("is_deleted = true")
+
 class Application(Base, TimestampMixin):
     __tablename__ = "applications"
+    __table_args__ = (
+        # Board listing: active rows for a user, newest first, keyset on (created_at, id)
+        Index(
+            "ix_applications_user_active_created",
+            "user_id", "created_at", "id",
+            postgresql_where=ACTIVE_ROWS, sqlite_where=ACTIVE_ROWS
+        ),
+        # Board listing filtered by a single status column
+        Index(
+            "ix_applications_user_active_status_created",
+            "user_id", "status", "created_at", "id",
+            postgresql_where=ACTIVE_ROWS, sqlite_where=ACTIVE_ROWS
+        ),
+        # Trash listing: deleted rows for a user, most recently deleted first
+        Index(
+            "ix_applications_user_deleted_updated",
+            "user_id", "updated_at", "id",
+            postgresql_where=DELETED_ROWS, sqlite_where=DELETED_ROWS
+        ),
+        # Delta sync: rows a user changed after a given data_version
+        Index("ix_applications_user_change_seq", "user_id", "change_seq"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     company = Column(String, nullable=False)
     position = Column(String, nullable=False)
     status = Column(String, default="wishlist", nullable=False)
@@ -24,11 +49,43 @@ class Application(Base, TimestampMixin):
     created_at = Column(DateTime(timezone=True), default=utcnow, nullable=False)
     updated_at = Column(DateTime(timezone=True), default=utcnow, onupdate=utcnow, nullable=False)
     is_deleted = Column(Boolean, default=False, nullable=False)
+    # The owner's data_version at the row's last change (see app/utils/sync.py)
+    change_seq = Column(Integer, default=0, server_default="0", nullable=False)
 
     user = relationship("User", back_populates="applications")
 
     application_tags = relationship(
         "ApplicationTag",
         cascade="all, delete-orphan",
-        back_populates="application"
+        back_populates="application",
+        passive_deletes=True
     )
+
+# Full-text search column, Postgres only. It is a generated column so it can
+# never drift from the row; it is deliberately not mapped on the model, so
+# ordinary loads never pull it. SQLite databases go without it and search
+# falls back to LIKE matching (see app/utils/search.py).
+SEARCH_CONFIG = "english"
+SEARCH_VECTOR_SQL = (
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(company, '')), 'A') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(position, '')), 'A') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(location, '')), 'B') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(notes, '')), 'C')"
+)
+
+event.listen(
+    Application.__table__,
+    "after_create",
+    DDL(
+        "ALTER TABLE applications ADD COLUMN IF NOT EXISTS search_vector tsvector "
+        f"GENERATED ALWAYS AS ({SEARCH_VECTOR_SQL}) STORED"
+    ).execute_if(dialect="postgresql"),
+)
+event.listen(
+    Application.__table__,
+    "after_create",
+    DDL(
+        "CREATE INDEX IF NOT EXISTS ix_applications_search_vector "
+        "ON applications USING GIN (search_vector)"
+    ).execute_if(dialect="postgresql"),
+)
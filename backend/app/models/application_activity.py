@@ -0,0 +1,42 @@
+from sqlalchemy import Column, String, DateTime, Index, JSON, DDL, event
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+import uuid
+from app.database import Base
+from app.models.application import utcnow
+
+class ApplicationActivity(Base):
+    """
+    Append-only history of an application: one row per create, update,
+    delete or restore, holding only the fields that changed as
+    {field: [old, new]} (tags as {tag_id: [old field, new field]}).
+
+    On Postgres the table is range-partitioned by month on created_at, so
+    old history can be dropped a partition at a time instead of deleted row
+    by row; see app/utils/activity.py. No foreign keys, so nothing here has
+    to be touched when applications change.
+    """
+    __tablename__ = "application_activity"
+    __table_args__ = (
+        Index("ix_application_activity_app_created", "application_id", "created_at"),
+        Index("ix_application_activity_user", "user_id"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+
+    # The partition key has to be part of the primary key.
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    created_at = Column(DateTime(timezone=True), primary_key=True, default=utcnow)
+    application_id = Column(UUID(as_uuid=True), nullable=False)
+    user_id = Column(UUID(as_uuid=True), nullable=False)
+    action = Column(String, nullable=False)
+    changes = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=False)
+
+# A partitioned table accepts no rows until it has a partition; the default
+# one catches anything the monthly partitions created ahead of time miss.
+event.listen(
+    ApplicationActivity.__table__,
+    "after_create",
+    DDL(
+        "CREATE TABLE IF NOT EXISTS application_activity_default "
+        "PARTITION OF application_activity DEFAULT"
+    ).execute_if(dialect="postgresql"),
+)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, ForeignKey, String
+from sqlalchemy import Column, ForeignKey, String, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from app.database import Base
@@ -8,9 +8,15 @@ from app.models.mixins import TimestampMixin
 
 class ApplicationTag(Base, TimestampMixin):
     __tablename__ = "application_tags"
+    __table_args__ = (
+        # The composite primary key leads with application_id; tag deletes,
+        # reverse lookups and tag filters need their own path in from the tag
+        # side, and carrying field/application_id keeps filters index-only.
+        Index("ix_application_tags_tag_field_app", "tag_id", "field", "application_id"),
+    )
 
-    application_id = Column(UUID(as_uuid=True), ForeignKey("applications.id"), primary_key=True)
-    tag_id = Column(UUID(as_uuid=True), ForeignKey("tags.id"), primary_key=True)
+    application_id = Column(UUID(as_uuid=True), ForeignKey("applications.id", ondelete="CASCADE"), primary_key=True)
+    tag_id = Column(UUID(as_uuid=True), ForeignKey("tags.id", ondelete="CASCADE"), primary_key=True)
     field = Column(SqlEnum(TaggableField, name="tag_field_enum"), nullable=False)
 
     application = relationship("Application", back_populates="application_tags")
@@ -0,0 +1,40 @@
+from sqlalchemy import Column, String, DateTime, Integer, Text, Index, JSON, text
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+import uuid
+from app.database import Base
+from app.models.application import utcnow
+
+QUEUED_JOBS = text("status = 'queued'")
+
+class Job(Base):
+    """
+    A unit of background work, queued in the database and run by the job
+    workers (app/core/jobs.py): `kind` names the handler, `payload` is its
+    JSON input. Failed attempts are retried with backoff until
+    `max_attempts` is used up.
+    """
+    __tablename__ = "jobs"
+    __table_args__ = (
+        # Claiming: the next queued job that is due
+        Index("ix_jobs_queued_run_at", "run_at", postgresql_where=QUEUED_JOBS, sqlite_where=QUEUED_JOBS),
+        # Admin listing and pruning of finished jobs
+        Index("ix_jobs_status_created", "status", "created_at"),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    kind = Column(String, nullable=False)
+    payload = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=False, default=dict)
+    # queued -> running -> succeeded | failed (or back to queued for a retry)
+    status = Column(String, nullable=False, default="queued")
+    attempts = Column(Integer, default=0, server_default="0", nullable=False)
+    max_attempts = Column(Integer, nullable=False)
+    run_at = Column(DateTime(timezone=True), default=utcnow, nullable=False)
+    created_at = Column(DateTime(timezone=True), default=utcnow, nullable=False)
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+    # Worker holding a running job, and when it claimed it
+    locked_by = Column(String, nullable=True)
+    locked_at = Column(DateTime(timezone=True), nullable=True)
+    last_error = Column(Text, nullable=True)
+    result = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=True)
+    created_by = Column(UUID(as_uuid=True), nullable=True)
@@ -0,0 +1,37 @@
+from sqlalchemy import Column, String, Date, Integer, BigInteger
+from sqlalchemy.dialects.postgresql import UUID
+from app.database import Base
+
+class StatusDailyRollup(Base):
+    """
+    Per-user, per-day, per-status counters, maintained as transitions are
+    recorded. No foreign keys: rollups are history and outlive purged rows.
+    """
+    __tablename__ = "status_daily_rollups"
+
+    user_id = Column(UUID(as_uuid=True), primary_key=True)
+    day = Column(Date, primary_key=True)
+    status = Column(String, primary_key=True)
+    # Applications created in this status
+    created_count = Column(Integer, default=0, server_default="0", nullable=False)
+    # Moves into this status, creation included
+    entered_count = Column(Integer, default=0, server_default="0", nullable=False)
+    # Applications reaching this funnel stage for the first time
+    reached_count = Column(Integer, default=0, server_default="0", nullable=False)
+    # Moves out of this status, and the total time spent in it before them
+    exited_count = Column(Integer, default=0, server_default="0", nullable=False)
+    dwell_seconds = Column(BigInteger, default=0, server_default="0", nullable=False)
+
+class StatusDwellRollup(Base):
+    """
+    Histogram of time spent in a status before leaving it, per user, day and
+    status; `bucket` indexes DWELL_BUCKET_HOURS in app/utils/status_stats.py.
+    Medians are read off the cumulative counts.
+    """
+    __tablename__ = "status_dwell_rollups"
+
+    user_id = Column(UUID(as_uuid=True), primary_key=True)
+    day = Column(Date, primary_key=True)
+    status = Column(String, primary_key=True)
+    bucket = Column(Integer, primary_key=True)
+    count = Column(Integer, default=0, server_default="0", nullable=False)
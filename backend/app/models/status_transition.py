@@ -0,0 +1,27 @@
+from sqlalchemy import Column, String, DateTime, Index
+from sqlalchemy.dialects.postgresql import UUID
+import uuid
+from app.database import Base
+from app.models.application import utcnow
+
+class StatusTransition(Base):
+    """
+    One status change of an application; `from_status` is NULL for the
+    status it was created with. Feeds the rollups behind GET
+    /applications/stats (see app/utils/status_stats.py).
+
+    No foreign key: like the rollups, the log is history and survives purges,
+    so the rollups can always be rebuilt from it.
+    """
+    __tablename__ = "status_transitions"
+    __table_args__ = (
+        Index("ix_status_transitions_app_changed", "application_id", "changed_at"),
+        Index("ix_status_transitions_user_changed", "user_id", "changed_at"),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    application_id = Column(UUID(as_uuid=True), nullable=False)
+    user_id = Column(UUID(as_uuid=True), nullable=False)
+    from_status = Column(String, nullable=True)
+    to_status = Column(String, nullable=False)
+    changed_at = Column(DateTime(timezone=True), default=utcnow, nullable=False)
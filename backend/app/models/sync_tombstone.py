@@ -0,0 +1,23 @@
+from sqlalchemy import Column, String, DateTime, Integer, Index
+from sqlalchemy.dialects.postgresql import UUID
+from app.database import Base
+from app.models.application import utcnow
+
+class SyncTombstone(Base):
+    """
+    Marker left behind when a row is removed for good, so delta-sync clients
+    (GET /applications/changes) learn to drop it. Compacted after
+    SYNC_TOMBSTONE_RETENTION_DAYS; see app/utils/sync.py.
+    """
+    __tablename__ = "sync_tombstones"
+    __table_args__ = (
+        Index("ix_sync_tombstones_user_seq", "user_id", "seq"),
+        Index("ix_sync_tombstones_deleted_at", "deleted_at"),
+    )
+
+    # No foreign keys: tombstones outlive the rows they describe.
+    user_id = Column(UUID(as_uuid=True), primary_key=True)
+    entity_type = Column(String, primary_key=True)
+    entity_id = Column(UUID(as_uuid=True), primary_key=True)
+    seq = Column(Integer, nullable=False)
+    deleted_at = Column(DateTime(timezone=True), default=utcnow, nullable=False)
@@ -1,24 +1,37 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey
+from sqlalchemy import Column, String, DateTime, ForeignKey, Integer, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import uuid
 from datetime import datetime
 from app.database import Base
 from app.models.application_tag import ApplicationTag
+from app.models.tag_usage import TagUsage
 from app.models.mixins import TimestampMixin
 
 class Tag(Base, TimestampMixin):
     __tablename__ = "tags"
+    __table_args__ = (
+        Index("ix_tags_user_id", "user_id"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     name = Column(String, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
+    change_seq = Column(Integer, default=0, server_default="0", nullable=False)
 
     user = relationship("User", back_populates="tags")
 
     application_tags = relationship(
         "ApplicationTag",
         back_populates="tag",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True
+    )
+
+    usage_counts = relationship(
+        "TagUsage",
+        back_populates="tag",
+        cascade="all, delete-orphan",
+        passive_deletes=True
     )
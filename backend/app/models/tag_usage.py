@@ -0,0 +1,23 @@
+from sqlalchemy import Column, ForeignKey, Integer
+from sqlalchemy import Enum as SqlEnum
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import relationship
+from app.database import Base
+from app.constants.tag_fields import TaggableField
+
+class TagUsage(Base):
+    """
+    How many active and soft-deleted applications carry a tag on a field.
+
+    Kept up to date by the writes that add, move or remove application_tags
+    rows and by soft-delete/restore/purge (see app/utils/tag_usage.py), so
+    the sidebar never has to group application_tags on read.
+    """
+    __tablename__ = "tag_usage_counts"
+
+    tag_id = Column(UUID(as_uuid=True), ForeignKey("tags.id", ondelete="CASCADE"), primary_key=True)
+    field = Column(SqlEnum(TaggableField, name="tag_field_enum"), primary_key=True)
+    active_count = Column(Integer, default=0, server_default="0", nullable=False)
+    deleted_count = Column(Integer, default=0, server_default="0", nullable=False)
+
+    tag = relationship("Tag", back_populates="usage_counts")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime
+from sqlalchemy import Column, String, DateTime, Integer, DDL, event
 import uuid
 from datetime import datetime
 from sqlalchemy.dialects.postgresql import UUID
@@ -14,15 +14,38 @@ class User(Base, TimestampMixin):
     hashed_password = Column(String, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
     is_admin = Column(String, default="false", nullable=False)
+    # Bumped on every change to the user's applications or tags; drives ETags.
+    data_version = Column(Integer, default=0, server_default="0", nullable=False)
+    # Highest data_version whose tombstones have been compacted away; delta
+    # sync tokens older than this must fall back to a full reload.
+    sync_floor = Column(Integer, default=0, server_default="0", nullable=False)
+    # Set while a background account deletion is emptying the account; the
+    # user can no longer sign in or authenticate (see app/utils/account_deletion.py).
+    deletion_started_at = Column(DateTime(timezone=True), nullable=True)
 
+    # The database cascades deletes (ON DELETE CASCADE); passive_deletes
+    # keeps the ORM from loading every child row just to delete it.
     applications = relationship(
         "Application",
         back_populates="user",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True
     )
 
     tags = relationship(
         "Tag",
         back_populates="user",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True
     )
+
+# Admin search matches email prefixes case-insensitively; text_pattern_ops
+# lets LIKE 'prefix%' use the index whatever the database collation.
+event.listen(
+    User.__table__,
+    "after_create",
+    DDL(
+        "CREATE INDEX IF NOT EXISTS ix_users_email_lower "
+        "ON users (lower(email) text_pattern_ops)"
+    ).execute_if(dialect="postgresql"),
+)
@@ -1,12 +1,32 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 from uuid import UUID
+from typing import List, Optional
 import logging
 
 from app.database import SessionLocal
 from app.models.user import User
 from app.core.auth import get_current_user
-from app.schemas.user import UserOut
+from app.core.principal_cache import principal_cache
+from app.core.password_hasher import password_hasher
+from app.core.events import broker
+from app.core.compression import compression_stats
+from app.schemas.user import AdminUserPage
+from app.schemas.job import MAINTENANCE_JOB_PAYLOADS, JobCreate, JobOut
+from pydantic import ValidationError
+from app.schemas.application import ApplicationStatsOut
+from app.models.application import Application, utcnow
+from app.models.tag import Tag
+from app.utils.pagination import decode_value_cursor, encode_value_cursor
+from app.utils.estimates import table_row_counts
+from app.utils.status_stats import status_stats
+from app.utils.account_deletion import delete_account, start_account_deletion
+from app.core.jobs import FAILED, JOB_STATUSES, QUEUED, enqueue_job
+from app.models.job import Job
+from app.core.config import settings
+from app.utils.serialization import render
+from datetime import timedelta
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(filename)s:%(lineno)d - %(message)s")
@@ -20,35 +40,208 @@ def get_db():
     finally:
         db.close()
 
-def require_admin(user: User = Depends(get_current_user)):
+async def require_admin(user: User = Depends(get_current_user)):
     if not user.is_admin:
         raise HTTPException(status_code=403, detail="Admin access required")
     return user
 
-# GET /admin/users - View all users
-@router.get("/users", response_model=list[UserOut])
+# GET /admin/users - Page through users, with per-user aggregates
+@router.get("/users", response_model=AdminUserPage)
 def get_all_users(
+    q: Optional[str] = Query(None, min_length=1, max_length=320, description="Case-insensitive email prefix"),
+    limit: int = Query(50, gt=0, le=200),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's next_cursor"),
     db: Session = Depends(get_db),
     current_admin: User = Depends(require_admin)
 ):
-    logger.info(f"Admin {current_admin.email} fetched all users.")
-    users = db.query(User).all()
-    return users
+    """
+    Users ordered by email, keyset-paginated on it (emails are unique).
 
-@router.delete("/users/{user_id}", status_code=204)
+    The page and its aggregates come from one statement: the page of users
+    is a subquery, and application and tag counts are grouped only over the
+    users on it. Site-wide totals are planner estimates where available.
+    """
+    # Accounts being deleted in the background are already gone as far as admins are concerned.
+    filters = [User.deletion_started_at.is_(None)]
+    if q:
+        filters.append(func.lower(User.email).startswith(q.lower(), autoescape=True))
+    if cursor:
+        filters.append(User.email > decode_value_cursor(cursor))
+
+    page = (
+        select(User.id, User.email, User.created_at, User.is_admin)
+        .where(*filters)
+        .order_by(User.email)
+        .limit(limit + 1)
+        .subquery()
+    )
+    on_page = select(page.c.id)
+    apps = (
+        select(
+            Application.user_id,
+            func.count().filter(Application.is_deleted == False).label("active_applications"),
+            func.count().filter(Application.is_deleted == True).label("deleted_applications"),
+            func.max(Application.updated_at).label("last_activity_at"),
+        )
+        .where(Application.user_id.in_(on_page))
+        .group_by(Application.user_id)
+        .subquery()
+    )
+    tags = (
+        select(Tag.user_id, func.count().label("tags"))
+        .where(Tag.user_id.in_(on_page))
+        .group_by(Tag.user_id)
+        .subquery()
+    )
+    rows = db.execute(
+        select(
+            page,
+            func.coalesce(apps.c.active_applications, 0).label("active_applications"),
+            func.coalesce(apps.c.deleted_applications, 0).label("deleted_applications"),
+            func.coalesce(tags.c.tags, 0).label("tags"),
+            apps.c.last_activity_at,
+        )
+        .outerjoin(apps, apps.c.user_id == page.c.id)
+        .outerjoin(tags, tags.c.user_id == page.c.id)
+        .order_by(page.c.email)
+    ).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_value_cursor(rows[-1].email)
+
+    counts, estimated = table_row_counts(db, (User, Application, Tag))
+    logger.info(f"Admin {current_admin.email} listed {len(rows)} users (q={q!r}, cursor={bool(cursor)})")
+    return render(AdminUserPage, {
+        "users": [row._asdict() for row in rows],
+        "next_cursor": next_cursor,
+        "totals": {
+            "users": counts["users"],
+            "applications": counts["applications"],
+            "tags": counts["tags"],
+            "estimated": estimated,
+        },
+    })
+
+# GET /admin/metrics - Process-local runtime counters
+@router.get("/metrics")
+async def get_metrics(current_admin: User = Depends(require_admin)):
+    return {
+        "password_hashing": password_hasher.stats(),
+        "live_updates": broker.stats(),
+        "compression": compression_stats.snapshot(),
+    }
+
+# GET /admin/stats - Funnel, time in status and volume across every user
+@router.get("/stats", response_model=ApplicationStatsOut)
+def get_stats(
+    days: Optional[int] = Query(None, ge=1, le=3650),
+    weeks: int = Query(12, ge=1, le=104),
+    db: Session = Depends(get_db),
+    current_admin: User = Depends(require_admin)
+):
+    today = utcnow().date()
+    since = today - timedelta(days=days - 1) if days else None
+    return render(ApplicationStatsOut, status_stats(db, None, since, weeks, today))
+
+@router.delete("/users/{user_id}", status_code=204, responses={202: {"model": JobOut}})
 def delete_user(
     user_id: UUID,
+    background: bool = Query(False, description="Queue an account.purge job that deletes in chunks (202)"),
     db: Session = Depends(get_db),
     current_admin: User = Depends(require_admin)
 ):
     if user_id == current_admin.id:
         raise HTTPException(status_code=400, detail="Admin cannot delete themselves")
 
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
+    email = db.execute(select(User.email).where(User.id == user_id)).scalar_one_or_none()
+    if email is None:
         raise HTTPException(status_code=404, detail="User not found")
 
-    db.delete(user)
+    # The account and everything in it go away together, so its delta-sync
+    # clients get a 401 rather than per-row tombstones; its old ones go too.
+    if background:
+        start_account_deletion(db, user_id)
+        job = enqueue_job(
+            db, "account.purge",
+            {"user_id": str(user_id), "chunk_size": settings.ACCOUNT_DELETE_CHUNK_SIZE},
+            created_by=current_admin.id,
+        )
+        db.commit()
+        principal_cache.invalidate(user_id)
+        logger.info(f"Admin {current_admin.email} queued deletion of user {email} (id: {user_id}, job: {job.id})")
+        return render(JobOut, job, status_code=status.HTTP_202_ACCEPTED)
+
+    delete_account(db, user_id)
     db.commit()
-    logger.info(f"Admin {current_admin.email} deleted user {user.email} (id: {user.id})")
+    principal_cache.invalidate(user_id)
+    logger.info(f"Admin {current_admin.email} deleted user {email} (id: {user_id})")
     return
+
+# GET /admin/jobs - Background jobs, newest first
+@router.get("/jobs", response_model=List[JobOut])
+def list_jobs(
+    job_status: Optional[str] = Query(None, alias="status", pattern=f"^({'|'.join(JOB_STATUSES)})$"),
+    kind: Optional[str] = Query(None),
+    limit: int = Query(50, gt=0, le=200),
+    db: Session = Depends(get_db),
+    current_admin: User = Depends(require_admin)
+):
+    query = select(Job).order_by(Job.created_at.desc(), Job.id).limit(limit)
+    if job_status:
+        query = query.where(Job.status == job_status)
+    if kind:
+        query = query.where(Job.kind == kind)
+    return render(List[JobOut], db.execute(query).scalars().all())
+
+# POST /admin/jobs - Queue a maintenance job (e.g. status_stats.backfill)
+@router.post("/jobs", response_model=JobOut, status_code=202)
+def create_job(
+    job_in: JobCreate,
+    db: Session = Depends(get_db),
+    current_admin: User = Depends(require_admin)
+):
+    payload_schema = MAINTENANCE_JOB_PAYLOADS.get(job_in.kind)
+    if payload_schema is None:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown job kind. Expected one of: {', '.join(sorted(MAINTENANCE_JOB_PAYLOADS))}"
+        )
+    try:
+        payload = payload_schema.model_validate(job_in.payload).model_dump(mode="json", exclude_none=True)
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=e.errors(include_url=False, include_context=False))
+    job = enqueue_job(db, job_in.kind, payload, created_by=current_admin.id, max_attempts=job_in.max_attempts)
+    db.commit()
+    logger.info(f"Admin {current_admin.email} queued job {job.id} ({job.kind})")
+    return render(JobOut, job, status_code=202)
+
+# GET /admin/jobs/{job_id} - One job's status, attempts, error and result
+@router.get("/jobs/{job_id}", response_model=JobOut)
+def get_job(
+    job_id: UUID,
+    db: Session = Depends(get_db),
+    current_admin: User = Depends(require_admin)
+):
+    job = db.get(Job, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return render(JobOut, job)
+
+# POST /admin/jobs/{job_id}/retry - Requeue a failed job with a fresh set of attempts
+@router.post("/jobs/{job_id}/retry", response_model=JobOut)
+def retry_job(
+    job_id: UUID,
+    db: Session = Depends(get_db),
+    current_admin: User = Depends(require_admin)
+):
+    job = db.get(Job, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if job.status != FAILED:
+        raise HTTPException(status_code=409, detail="Only failed jobs can be retried")
+    job.status, job.attempts, job.run_at, job.finished_at = QUEUED, 0, utcnow(), None
+    db.commit()
+    logger.info(f"Admin {current_admin.email} requeued job {job.id} ({job.kind})")
+    return render(JobOut, job)
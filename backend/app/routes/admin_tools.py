@@ -6,6 +6,7 @@ import logging
 from app.database import SessionLocal
 from app.models.user import User
 from app.core.auth import get_current_user
+from app.core.principal_cache import principal_cache
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(filename)s:%(lineno)d - %(message)s")
@@ -43,6 +44,7 @@ def promote_user(
         raise HTTPException(status_code=404, detail="User not found")
     user.is_admin = True
     db.commit()
+    principal_cache.invalidate(user.id)
     logger.info(f"User {user.email} (id: {user.id}) was promoted to admin via secret tool by {current_user.email}")
     return {"message": f"User {user.email} promoted to admin."}
 
@@ -62,5 +64,6 @@ def demote_user(
         raise HTTPException(status_code=400, detail="You cannot modify your own admin status.")
     user.is_admin = False
     db.commit()
+    principal_cache.invalidate(user.id)
     logger.info(f"User {user.email} (id: {user.id}) was demoted from admin via secret tool by {current_user.email}")
     return {"message": f"User {user.email} demoted to regular user."}
@@ -1,19 +1,58 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Path, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Path, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session, aliased
 from uuid import UUID
 from typing import List, Dict, Optional
-from sqlalchemy import desc, and_
+from sqlalchemy import desc, and_, update, delete, insert, select, func, case, literal
 import logging
-
-from app.schemas.application import ApplicationCreate, ApplicationOut, ApplicationUpdate, ApplicationSummaryOut
-from app.models.application import Application
+import tempfile
+from datetime import timedelta
+
+from app.schemas.application import (
+    ApplicationCreate,
+    ApplicationTagInput,
+    ApplicationOut,
+    ApplicationUpdate,
+    ApplicationSummaryOut,
+    ApplicationSummaryPage,
+    ApplicationPage,
+    ApplicationSearchPage,
+    ApplicationBulkStatusUpdate,
+    ApplicationBulkStatusOut,
+    ApplicationBulkIds,
+    ApplicationTrashSelection,
+    ApplicationBulkOut,
+    BulkResultItem,
+    BoardOut,
+    ApplicationChangesOut,
+    ApplicationImportOut,
+    ApplicationStatsOut,
+    ApplicationHistoryPage,
+)
+from app.models.application import Application, utcnow
 from app.models.application_tag import ApplicationTag
 from app.models.tag import Tag
 from app.models.user import User
 from app.database import SessionLocal
 from app.core.auth import get_current_user
-from app.schemas.tag import TagOut
-from app.utils.pagination import get_pagination_params
+from app.constants.status import ApplicationStatus
+from app.constants.tag_fields import TaggableField
+from app.utils.pagination import get_pagination_params, paginate
+from app.utils.tag_filters import get_tag_filters, apply_tag_filters
+from app.utils.search import search_applications
+from app.utils.etag import bump_data_version, check_not_modified
+from app.utils.sync import encode_sync_token, decode_sync_token, record_tombstones
+from app.models.sync_tombstone import SyncTombstone
+from app.core.events import emit_event
+from app.utils.tag_usage import apply_usage_deltas, shift_tag_usage, usage_deltas
+from app.utils.status_stats import record_status_changes, record_status_creations, status_stats
+from app.utils.activity import diff_fields, record_activity, snapshot, tag_changes
+from app.models.application_activity import ApplicationActivity
+from app.utils.serialization import render
+from app.utils.export import stream_export, MEDIA_TYPES
+from app.utils.importer import import_upload
+from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(filename)s:%(lineno)d - %(message)s")
@@ -27,11 +66,209 @@ def get_db():
     finally:
         db.close()
 
-def apply_tags_to_application_fields(app: Application, db: Session):
-    for assoc in app.application_tags:
-        tag = db.query(Tag).filter(Tag.id == assoc.tag_id).first()
-        if tag and assoc.field in Application.__table__.columns:
-            setattr(app, assoc.field, tag.name)
+def validate_tag_inputs(tags: List[ApplicationTagInput], db: Session, user_id: UUID) -> Dict[UUID, str]:
+    """
+    Reject duplicate or foreign tags in a create/update payload with a
+    single IN query, and return the requested tags' names by id.
+    """
+    seen = set()
+    fields = {}
+    for tag_data in tags:
+        key = (tag_data.tag_id, tag_data.field)
+        if key in seen:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Duplicate tag '{tag_data.tag_id}' for field '{tag_data.field}'"
+            )
+        seen.add(key)
+        if tag_data.field not in TAGGABLE_FIELDS:
+            raise HTTPException(status_code=400, detail=f"Invalid tag field: {tag_data.field}")
+        # application_tags is keyed on (application_id, tag_id)
+        if fields.setdefault(tag_data.tag_id, tag_data.field) != tag_data.field:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Tag '{tag_data.tag_id}' can only be used on one field"
+            )
+
+    if not fields:
+        return {}
+    names = dict(
+        db.query(Tag.id, Tag.name)
+        .filter(Tag.id.in_(fields), Tag.user_id == user_id)
+        .all()
+    )
+    for tag_data in tags:
+        if tag_data.tag_id not in names:
+            raise HTTPException(status_code=400, detail=f"Invalid tag ID: {tag_data.tag_id}")
+    return names
+
+def sync_application_tags(app_id: UUID, tags: List[ApplicationTagInput], db: Session) -> Dict[str, list]:
+    """
+    Bring an application's tag associations in line with `tags` by writing
+    only the difference: delete removed rows, re-field moved ones, insert
+    new ones. Returns the difference as {tag_id: [old field, new field]}.
+    """
+    wanted = {tag_data.tag_id: tag_data.field for tag_data in tags}
+    current = dict(
+        db.query(ApplicationTag.tag_id, ApplicationTag.field)
+        .filter(ApplicationTag.application_id == app_id)
+        .all()
+    )
+
+    usage = usage_deltas()
+    removed = [tag_id for tag_id in current if tag_id not in wanted]
+    for tag_id in removed:
+        usage[(tag_id, current[tag_id])][0] -= 1
+    if removed:
+        db.execute(
+            delete(ApplicationTag)
+            .where(ApplicationTag.application_id == app_id, ApplicationTag.tag_id.in_(removed))
+            .execution_options(synchronize_session=False)
+        )
+
+    moved = {tag_id: field for tag_id, field in wanted.items() if tag_id in current and current[tag_id] != field}
+    for tag_id, field in moved.items():
+        usage[(tag_id, current[tag_id])][0] -= 1
+        usage[(tag_id, field)][0] += 1
+    if moved:
+        db.execute(
+            update(ApplicationTag)
+            .where(ApplicationTag.application_id == app_id, ApplicationTag.tag_id.in_(moved))
+            .values(field=case(
+                *((ApplicationTag.tag_id == tag_id, literal(field, ApplicationTag.field.type)) for tag_id, field in moved.items())
+            ))
+            .execution_options(synchronize_session=False)
+        )
+
+    added = [
+        {"application_id": app_id, "tag_id": tag_id, "field": field}
+        for tag_id, field in wanted.items()
+        if tag_id not in current
+    ]
+    for row in added:
+        usage[(row["tag_id"], row["field"])][0] += 1
+    if added:
+        db.execute(insert(ApplicationTag), added)
+    apply_usage_deltas(db, usage)
+    return tag_changes(current, wanted)
+
+def apply_tags_to_application_fields(app: Application, tags: List[ApplicationTagInput], names: Dict[UUID, str]):
+    for tag_data in tags:
+        if tag_data.field in Application.__table__.columns:
+            setattr(app, tag_data.field, names[tag_data.tag_id])
+
+# Columns for the list endpoints, loaded as plain rows rather than ORM
+# objects; see app/utils/serialization.py.
+SUMMARY_COLUMNS = (
+    Application.id,
+    Application.company,
+    Application.position,
+    Application.status,
+    Application.created_at,
+    Application.updated_at,
+)
+DETAIL_COLUMNS = SUMMARY_COLUMNS + (Application.location, Application.url, Application.notes)
+TAGGABLE_FIELDS = {field.value for field in TaggableField}
+
+def application_payload(app, tags: Dict[str, list]) -> dict:
+    """ApplicationOut-shaped dict from an ORM object or a DETAIL_COLUMNS row."""
+    return {
+        "id": app.id,
+        "company": app.company,
+        "position": app.position,
+        "status": app.status,
+        "location": app.location,
+        "url": app.url,
+        "notes": app.notes,
+        "created_at": app.created_at,
+        "updated_at": app.updated_at,
+        "tags": tags,
+    }
+
+def load_tag_maps(app_ids: List[UUID], db: Session) -> Dict[UUID, Dict[str, List[dict]]]:
+    """
+    Build the per-field tag map for every application in one joined query,
+    instead of lazy-loading application_tags and tags per row.
+    """
+    tag_maps = {app_id: {} for app_id in app_ids}
+    if not app_ids:
+        return tag_maps
+
+    rows = (
+        db.query(ApplicationTag.application_id, ApplicationTag.field, Tag.id, Tag.name)
+        .join(Tag, Tag.id == ApplicationTag.tag_id)
+        .filter(ApplicationTag.application_id.in_(app_ids))
+        .all()
+    )
+    for application_id, field, tag_id, tag_name in rows:
+        tag_maps[application_id].setdefault(field, []).append({"id": tag_id, "name": tag_name})
+    return tag_maps
+
+def load_tag_ids(app_ids: List[UUID], db: Session) -> Dict[UUID, List[UUID]]:
+    tag_ids = {app_id: [] for app_id in app_ids}
+    if not app_ids:
+        return tag_ids
+
+    rows = (
+        db.query(ApplicationTag.application_id, ApplicationTag.tag_id)
+        .filter(ApplicationTag.application_id.in_(app_ids))
+        .all()
+    )
+    for application_id, tag_id in rows:
+        tag_ids[application_id].append(tag_id)
+    return tag_ids
+
+def dedupe_ids(ids: List[UUID]) -> List[UUID]:
+    return list(dict.fromkeys(ids))
+
+def explain_skipped_ids(
+    ids: List[UUID],
+    db: Session,
+    user_id: UUID,
+    owned_reason: str
+) -> Dict[UUID, str]:
+    """
+    Work out why ids were not touched by a set-based statement: the row does
+    not exist, belongs to someone else, or is owned but in the wrong state.
+    """
+    if not ids:
+        return {}
+
+    owners = dict(
+        db.query(Application.id, Application.user_id)
+        .filter(Application.id.in_(ids))
+        .all()
+    )
+
+    reasons = {}
+    for app_id in ids:
+        if app_id not in owners:
+            reasons[app_id] = "not_found"
+        elif owners[app_id] != user_id:
+            reasons[app_id] = "forbidden"
+        else:
+            reasons[app_id] = owned_reason
+    return reasons
+
+def build_bulk_results(
+    ids: List[UUID],
+    done: Dict[UUID, Optional[object]],
+    done_result: str,
+    skipped: Dict[UUID, str]
+) -> List[BulkResultItem]:
+    return [
+        BulkResultItem(id=app_id, result=done_result, updated_at=done[app_id])
+        if app_id in done
+        else BulkResultItem(id=app_id, result=skipped[app_id])
+        for app_id in ids
+    ]
+
+def trash_selection_filters(selection: ApplicationTrashSelection, user_id: UUID):
+    filters = [Application.user_id == user_id, Application.is_deleted == True]
+    if selection.all:
+        return filters, None
+    ids = dedupe_ids(selection.ids)
+    return filters + [Application.id.in_(ids)], ids
 
 @router.post("/", response_model=ApplicationOut, status_code=201)
 def create_application(
@@ -46,54 +283,48 @@ def create_application(
 
     new_app = Application(**app_data, user_id=current_user.id)
 
-    seen = set()
+    validate_tag_inputs(app_in.tags or [], db, current_user.id)
     for tag_data in app_in.tags or []:
-        key = (tag_data.tag_id, tag_data.field)
-        if key in seen:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Duplicate tag '{tag_data.tag_id}' for field '{tag_data.field}'"
-            )
-        seen.add(key)
-
-    if app_in.tags:
-        for tag_data in app_in.tags:
-            tag = db.query(Tag).filter(Tag.id == tag_data.tag_id, Tag.user_id == current_user.id).first()
-            if not tag:
-                raise HTTPException(status_code=400, detail=f"Invalid tag ID: {tag_data.tag_id}")
-            assoc = ApplicationTag(tag_id=tag.id, field=tag_data.field)
-            new_app.application_tags.append(assoc)
+        new_app.application_tags.append(ApplicationTag(tag_id=tag_data.tag_id, field=tag_data.field))
 
+    new_app.change_seq = bump_data_version(db, current_user.id)
     db.add(new_app)
+    db.flush()
+    record_status_creations(db, current_user.id, [(new_app.id, new_app.status, new_app.created_at)])
+    record_activity(db, current_user.id, [(new_app.id, "created", {
+        **diff_fields({}, {field: value for field, value in snapshot(new_app).items() if value is not None}),
+        **({"tags": tag_changes({}, {tag.tag_id: tag.field for tag in app_in.tags})} if app_in.tags else {}),
+    })])
+    usage = usage_deltas()
+    for tag_data in app_in.tags or []:
+        usage[(tag_data.tag_id, tag_data.field)][0] += 1
+    apply_usage_deltas(db, usage)
+    emit_event(
+        db, current_user.id, "application.created",
+        version=new_app.change_seq, ids=[str(new_app.id)], status=new_app.status
+    )
     db.commit()
     db.refresh(new_app)
     logger.info(f"User {current_user.id} created application {new_app.id}")
-    tag_map = {}
-    for assoc in new_app.application_tags:
-        field = assoc.field
-        tag_map.setdefault(field, []).append(TagOut.from_orm(assoc.tag))
-
-    return ApplicationOut(
-        id=new_app.id,
-        company=new_app.company,
-        position=new_app.position,
-        status=new_app.status,
-        location=new_app.location,
-        url=new_app.url,
-        notes=new_app.notes,
-        created_at=new_app.created_at,
-        updated_at=new_app.updated_at,
-        tags=tag_map
-    )
-
-@router.get("/", response_model=Dict[str, object])
+    tag_map = load_tag_maps([new_app.id], db)[new_app.id]
+
+    return render(ApplicationOut, application_payload(new_app, tag_map), status_code=201)
+
+@router.get("/", response_model=ApplicationSummaryPage)
 def get_applications(
-    pagination: Dict[str, int] = Depends(get_pagination_params),
+    request: Request,
+    response: Response,
+    pagination: Dict[str, object] = Depends(get_pagination_params),
     status: Optional[str] = Query(None, description="Filter by application status"),
+    tag_filters: Dict[str, list] = Depends(get_tag_filters),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    query = db.query(Application).filter(
+    not_modified = check_not_modified(request, response, db, current_user.id)
+    if not_modified:
+        return not_modified
+
+    query = db.query(*SUMMARY_COLUMNS).filter(
         Application.user_id == current_user.id,
         Application.is_deleted == False
     )
@@ -101,46 +332,42 @@ def get_applications(
     if status:
         query = query.filter(Application.status == status)
 
-    total_count = query.count()
+    query = apply_tag_filters(query, tag_filters)
 
-    apps = (
-        query.order_by(desc(Application.created_at))
-        .offset(pagination["offset"])
-        .limit(pagination["limit"])
-        .all()
-    )
+    total_count = query.count() if pagination["include_total"] else None
 
-    result = [
-        ApplicationSummaryOut(
-            id=app.id,
-            company=app.company,
-            position=app.position,
-            status=app.status,
-            created_at=app.created_at,
-            updated_at=app.updated_at,
-            tag_ids=[assoc.tag_id for assoc in app.application_tags]
-        )
-        for app in apps
-    ]
+    apps, next_cursor = paginate(query, Application.created_at, Application.id, pagination)
+
+    tag_ids = load_tag_ids([app.id for app in apps], db)
+
+    result = [{**app._asdict(), "tag_ids": tag_ids[app.id]} for app in apps]
 
     logger.info(
         f"User {current_user.id} fetched {len(result)} applications "
-        f"(offset={pagination['offset']}, limit={pagination['limit']}, status={status})"
+        f"(offset={pagination['offset']}, cursor={bool(pagination['cursor'])}, limit={pagination['limit']}, status={status}, "
+        f"tags_any={len(tag_filters['any'])}, tags_all={len(tag_filters['all'])})"
     )
 
-    return {
+    return render(ApplicationSummaryPage, {
         "total": total_count,
-        "applications": result
-    }
+        "applications": result,
+        "next_cursor": next_cursor
+    }, response)
 
-@router.get("/deleted", response_model=Dict[str, object])
+@router.get("/deleted", response_model=ApplicationPage)
 def get_deleted_applications(
-    pagination: Dict[str, int] = Depends(get_pagination_params),
+    request: Request,
+    response: Response,
+    pagination: Dict[str, object] = Depends(get_pagination_params),
     status: Optional[str] = Query(None, description="Filter by status (optional)"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    query = db.query(Application).filter(
+    not_modified = check_not_modified(request, response, db, current_user.id)
+    if not_modified:
+        return not_modified
+
+    query = db.query(*DETAIL_COLUMNS).filter(
         Application.user_id == current_user.id,
         Application.is_deleted == True
     )
@@ -148,52 +375,449 @@ def get_deleted_applications(
     if status:
         query = query.filter(Application.status == status)
 
-    total_count = query.count()
+    total_count = query.count() if pagination["include_total"] else None
+
+    apps, next_cursor = paginate(query, Application.updated_at, Application.id, pagination)
+
+    tag_maps = load_tag_maps([app.id for app in apps], db)
+
+    result = [application_payload(app, tag_maps[app.id]) for app in apps]
 
-    apps = (
-        query.order_by(desc(Application.updated_at))
-        .offset(pagination["offset"])
-        .limit(pagination["limit"])
+    logger.info(
+        f"User {current_user.id} viewed {len(result)} deleted apps "
+        f"(offset={pagination['offset']}, cursor={bool(pagination['cursor'])}, limit={pagination['limit']}, status={status})"
+    )
+
+    return render(ApplicationPage, {
+        "total": total_count,
+        "applications": result,
+        "next_cursor": next_cursor
+    }, response)
+
+@router.get("/board", response_model=BoardOut)
+def get_board(
+    per_column_limit: Optional[int] = Query(None, gt=0, le=500, description="Cap the cards returned per column (counts stay exact)"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    active = and_(Application.user_id == current_user.id, Application.is_deleted == False)
+
+    counts = dict(
+        db.query(Application.status, func.count())
+        .filter(active)
+        .group_by(Application.status)
         .all()
     )
 
-    result = []
+    query = db.query(*SUMMARY_COLUMNS, Application.location).filter(active)
+    if per_column_limit:
+        ranked = (
+            select(
+                Application.id,
+                func.row_number().over(
+                    partition_by=Application.status,
+                    order_by=(desc(Application.created_at), desc(Application.id))
+                ).label("position_in_column")
+            )
+            .where(active)
+            .subquery()
+        )
+        query = query.join(ranked, ranked.c.id == Application.id).filter(
+            ranked.c.position_in_column <= per_column_limit
+        )
+    apps = query.order_by(desc(Application.created_at), desc(Application.id)).all()
+
+    card_tags = {app.id: {} for app in apps}
+    if apps:
+        assocs = (
+            db.query(ApplicationTag.application_id, ApplicationTag.field, ApplicationTag.tag_id)
+            .join(Application, Application.id == ApplicationTag.application_id)
+            .filter(active)
+        )
+        if per_column_limit:
+            # Only the cards on the board, not every active application's tags.
+            assocs = assocs.join(ranked, ranked.c.id == ApplicationTag.application_id).filter(
+                ranked.c.position_in_column <= per_column_limit
+            )
+        for application_id, field, tag_id in assocs.all():
+            if application_id in card_tags:
+                card_tags[application_id].setdefault(field, []).append(tag_id)
+
+    tag_names = dict(db.query(Tag.id, Tag.name).filter(Tag.user_id == current_user.id).all())
+
+    columns = {app_status.value: [] for app_status in ApplicationStatus}
     for app in apps:
-        tags_by_field = {}
-        for assoc in app.application_tags:
-            tags_by_field.setdefault(assoc.field, []).append(TagOut.from_orm(assoc.tag))
-
-        result.append(ApplicationOut(
-            id=app.id,
-            company=app.company,
-            position=app.position,
-            status=app.status,
-            location=app.location,
-            url=app.url,
-            notes=app.notes,
-            created_at=app.created_at,
-            updated_at=app.updated_at,
-            tags=tags_by_field
-        ))
+        columns.setdefault(app.status, []).append({**app._asdict(), "tags": card_tags[app.id]})
+
+    logger.info(f"User {current_user.id} loaded board with {len(apps)} cards")
+
+    return render(BoardOut, {
+        "columns": [
+            {"status": column, "count": counts.get(column, 0), "applications": cards}
+            for column, cards in columns.items()
+        ],
+        "tags": tag_names
+    })
+
+@router.get("/changes", response_model=ApplicationChangesOut)
+def get_changes(
+    since: Optional[str] = Query(None, description="Sync token from a previous response's `next`; omit for a full snapshot"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    # Read the version before any rows: a write committing in between is
+    # returned now and again next time, which clients apply idempotently.
+    version, sync_floor = (
+        db.query(User.data_version, User.sync_floor).filter(User.id == current_user.id).one()
+    )
+    since_seq = decode_sync_token(since) if since else None
+    # Tokens older than the compacted tombstones, or from the future (e.g. a
+    # restored database), cannot be diffed against; send a full snapshot.
+    reset = since_seq is not None and not (sync_floor <= since_seq <= version)
+    full = since_seq is None or reset
+
+    app_query = db.query(*DETAIL_COLUMNS, Application.is_deleted).filter(Application.user_id == current_user.id)
+    tag_query = db.query(Tag.id, Tag.name).filter(Tag.user_id == current_user.id)
+    deleted = {"applications": [], "tags": []}
+    if not full:
+        app_query = app_query.filter(Application.change_seq > since_seq)
+        tag_query = tag_query.filter(Tag.change_seq > since_seq)
+        tombstones = db.query(SyncTombstone.entity_type, SyncTombstone.entity_id).filter(
+            SyncTombstone.user_id == current_user.id,
+            SyncTombstone.seq > since_seq
+        )
+        for entity_type, entity_id in tombstones:
+            deleted["applications" if entity_type == "application" else "tags"].append(entity_id)
+
+    apps = app_query.order_by(Application.change_seq, Application.id).all()
+    tags = tag_query.order_by(Tag.change_seq, Tag.id).all()
+    tag_maps = load_tag_maps([app.id for app in apps], db)
+
+    changed = [{**application_payload(app, tag_maps[app.id]), "is_deleted": app.is_deleted} for app in apps]
 
     logger.info(
-        f"User {current_user.id} viewed {len(result)} deleted apps "
-        f"(offset={pagination['offset']}, limit={pagination['limit']}, status={status})"
+        f"User {current_user.id} synced {len(changed)} applications and "
+        f"{len(deleted['applications']) + len(deleted['tags'])} tombstones (full={full}, reset={reset})"
     )
 
-    return {
+    return render(ApplicationChangesOut, {
+        "next": encode_sync_token(version),
+        "reset": reset,
+        "applications": changed,
+        "tags": tags,
+        "deleted": deleted
+    })
+
+@router.get("/stats", response_model=ApplicationStatsOut)
+def get_stats(
+    request: Request,
+    response: Response,
+    days: Optional[int] = Query(None, ge=1, le=3650, description="Only count the last N days for funnel and time in status; omit for all time"),
+    weeks: int = Query(12, ge=1, le=104, description="Weeks of application volume to return"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    # The days window and the week starts move with the date, not just with writes.
+    today = utcnow().date()
+    not_modified = check_not_modified(request, response, db, current_user.id, scope=today.isoformat())
+    if not_modified:
+        return not_modified
+
+    since = today - timedelta(days=days - 1) if days else None
+    stats = status_stats(db, current_user.id, since, weeks, today)
+    logger.info(f"User {current_user.id} fetched stats (days={days}, weeks={weeks})")
+    return render(ApplicationStatsOut, stats, response)
+
+@router.get("/export", response_class=StreamingResponse)
+def export_applications(
+    export_format: str = Query("csv", alias="format", pattern="^(csv|ndjson)$", description="csv or ndjson"),
+    include_deleted: bool = Query(False, description="Include applications in the trash"),
+    current_user: User = Depends(get_current_user)
+):
+    # The stream opens its own session: request-scoped dependencies are torn
+    # down before the body is sent.
+    filename = f"applications-{utcnow():%Y%m%d}.{export_format}"
+    logger.info(f"User {current_user.id} started a {export_format} export (include_deleted={include_deleted})")
+    return StreamingResponse(
+        stream_export(current_user.id, export_format, include_deleted),
+        media_type=MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+@router.post("/import", response_model=ApplicationImportOut)
+async def bulk_import_applications(
+    request: Request,
+    import_format: Optional[str] = Query(None, alias="format", pattern="^(csv|ndjson)$", description="csv or ndjson; defaults from Content-Type"),
+    create_tags: bool = Query(False, description="Create tags referenced by name that do not exist yet"),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Import applications from a CSV or NDJSON request body, in the same
+    shape GET /applications/export writes. The body is spooled to a
+    temporary file as it arrives and parsed row by row from there, in the
+    thread pool on a session of its own (like the export), so a large
+    import never blocks the event loop, whatever DB_MODE is.
+    """
+    if import_format is None:
+        import_format = "ndjson" if "json" in request.headers.get("content-type", "") else "csv"
+
+    with tempfile.SpooledTemporaryFile(max_size=1024 * 1024) as upload:
+        size = 0
+        async for chunk in request.stream():
+            size += len(chunk)
+            if size > settings.IMPORT_MAX_BYTES:
+                raise HTTPException(status_code=413, detail="Import file is too large")
+            upload.write(chunk)
+        upload.seek(0)
+
+        result = await run_in_threadpool(import_upload, current_user.id, upload, import_format, create_tags)
+
+    logger.info(
+        f"User {current_user.id} imported {result['imported']}/{result['total']} applications "
+        f"from {import_format} ({size} bytes, {result['batches']} batches)"
+    )
+    return render(ApplicationImportOut, result)
+
+@router.get("/search", response_model=ApplicationSearchPage)
+def search(
+    q: str = Query(..., min_length=1, max_length=200, description="Search text for company, position, location and notes"),
+    pagination: Dict[str, object] = Depends(get_pagination_params),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    hits, total_count = search_applications(
+        db, current_user.id, q, pagination["limit"], pagination["offset"], pagination["include_total"]
+    )
+
+    tag_ids = load_tag_ids([app.id for app, _, _ in hits], db)
+
+    result = [
+        {
+            "id": app.id,
+            "company": app.company,
+            "position": app.position,
+            "status": app.status,
+            "location": app.location,
+            "created_at": app.created_at,
+            "updated_at": app.updated_at,
+            "tag_ids": tag_ids[app.id],
+            "rank": rank,
+            "snippet": snippet
+        }
+        for app, rank, snippet in hits
+    ]
+
+    logger.info(
+        f"User {current_user.id} searched applications, {len(result)} hits "
+        f"(offset={pagination['offset']}, limit={pagination['limit']})"
+    )
+
+    return render(ApplicationSearchPage, {
         "total": total_count,
         "applications": result
+    })
+
+@router.post("/bulk/status", response_model=ApplicationBulkStatusOut)
+def bulk_update_status(
+    payload: ApplicationBulkStatusUpdate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    ids = dedupe_ids(payload.ids)
+    new_status = payload.status.value
+    version = bump_data_version(db, current_user.id)
+    # Lock the rows and read their current status for the transition log.
+    before = (
+        db.query(Application.id, Application.status, Application.created_at)
+        .filter(
+            Application.id.in_(ids),
+            Application.user_id == current_user.id,
+            Application.is_deleted == False
+        )
+        .with_for_update()
+        .all()
+    )
+
+    stmt = (
+        update(Application)
+        .where(
+            Application.id.in_(ids),
+            Application.user_id == current_user.id,
+            Application.is_deleted == False
+        )
+        .values(status=new_status, updated_at=utcnow(), change_seq=version)
+        .returning(Application.id, Application.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+    updated = {row.id: row.updated_at for row in db.execute(stmt)}
+
+    skipped = explain_skipped_ids(
+        [app_id for app_id in ids if app_id not in updated], db, current_user.id, "deleted"
+    )
+    if updated:
+        record_status_changes(
+            db, current_user.id,
+            [(app.id, app.status, app.created_at, new_status) for app in before if app.id in updated],
+            utcnow()
+        )
+        record_activity(db, current_user.id, [
+            (app.id, "updated", diff_fields({"status": app.status}, {"status": new_status}))
+            for app in before if app.id in updated
+        ])
+        emit_event(
+            db, current_user.id, "application.moved",
+            version=version, ids=[str(app_id) for app_id in updated], status=new_status
+        )
+        db.commit()
+    else:
+        # Nothing moved: drop the version bump so cached ETags stay valid.
+        db.rollback()
+
+    logger.info(
+        f"User {current_user.id} moved {len(updated)}/{len(ids)} applications to {new_status}"
+    )
+    return ApplicationBulkStatusOut(
+        status=new_status,
+        updated=len(updated),
+        results=build_bulk_results(ids, updated, "updated", skipped)
+    )
+
+@router.post("/bulk/delete", response_model=ApplicationBulkOut)
+def bulk_delete_applications(
+    payload: ApplicationBulkIds,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    ids = dedupe_ids(payload.ids)
+    version = bump_data_version(db, current_user.id)
+
+    stmt = (
+        update(Application)
+        .where(
+            Application.id.in_(ids),
+            Application.user_id == current_user.id,
+            Application.is_deleted == False
+        )
+        .values(is_deleted=True, updated_at=utcnow(), change_seq=version)
+        .returning(Application.id, Application.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+    deleted = {row.id: row.updated_at for row in db.execute(stmt)}
+
+    skipped = explain_skipped_ids(
+        [app_id for app_id in ids if app_id not in deleted], db, current_user.id, "already_deleted"
+    )
+    if deleted:
+        shift_tag_usage(db, deleted, active=-1, deleted=1)
+        record_activity(db, current_user.id, [(app_id, "deleted", {"is_deleted": [False, True]}) for app_id in deleted])
+        emit_event(db, current_user.id, "application.deleted", version=version, ids=[str(app_id) for app_id in deleted])
+        db.commit()
+    else:
+        db.rollback()
+
+    logger.info(f"User {current_user.id} bulk deleted {len(deleted)}/{len(ids)} applications")
+    return ApplicationBulkOut(
+        affected=len(deleted),
+        results=build_bulk_results(ids, deleted, "deleted", skipped)
+    )
+
+@router.post("/bulk/restore", response_model=ApplicationBulkOut)
+def bulk_restore_applications(
+    selection: ApplicationTrashSelection,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    filters, ids = trash_selection_filters(selection, current_user.id)
+    version = bump_data_version(db, current_user.id)
+
+    stmt = (
+        update(Application)
+        .where(*filters)
+        .values(is_deleted=False, updated_at=utcnow(), change_seq=version)
+        .returning(Application.id, Application.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+    restored = {row.id: row.updated_at for row in db.execute(stmt)}
+
+    if ids is None:
+        ids = list(restored)
+    skipped = explain_skipped_ids(
+        [app_id for app_id in ids if app_id not in restored], db, current_user.id, "not_deleted"
+    )
+    if restored:
+        shift_tag_usage(db, restored, active=1, deleted=-1)
+        record_activity(db, current_user.id, [(app_id, "restored", {"is_deleted": [True, False]}) for app_id in restored])
+        emit_event(db, current_user.id, "application.restored", version=version, ids=[str(app_id) for app_id in restored])
+        db.commit()
+    else:
+        db.rollback()
+
+    logger.info(f"User {current_user.id} bulk restored {len(restored)} applications (all={selection.all})")
+    return ApplicationBulkOut(
+        affected=len(restored),
+        results=build_bulk_results(ids, restored, "restored", skipped)
+    )
+
+@router.post("/bulk/purge", response_model=ApplicationBulkOut)
+def bulk_permanent_delete_applications(
+    selection: ApplicationTrashSelection,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    filters, ids = trash_selection_filters(selection, current_user.id)
+    version = bump_data_version(db, current_user.id)
+    doomed = select(Application.id).where(*filters)
+
+    shift_tag_usage(db, doomed, active=0, deleted=-1)
+    db.execute(
+        delete(ApplicationActivity)
+        .where(ApplicationActivity.application_id.in_(doomed))
+        .execution_options(synchronize_session=False)
+    )
+    # application_tags go with the applications (ON DELETE CASCADE).
+    purged = {
+        row.id: None
+        for row in db.execute(
+            delete(Application)
+            .where(*filters)
+            .returning(Application.id)
+            .execution_options(synchronize_session=False)
+        )
     }
 
+    record_tombstones(db, current_user.id, "application", purged, version)
+
+    if ids is None:
+        ids = list(purged)
+    skipped = explain_skipped_ids(
+        [app_id for app_id in ids if app_id not in purged], db, current_user.id, "not_deleted"
+    )
+    if purged:
+        emit_event(db, current_user.id, "application.purged", version=version, ids=[str(app_id) for app_id in purged])
+        db.commit()
+    else:
+        db.rollback()
+
+    logger.info(f"User {current_user.id} permanently deleted {len(purged)} applications (all={selection.all})")
+    return ApplicationBulkOut(
+        affected=len(purged),
+        results=build_bulk_results(ids, purged, "purged", skipped)
+    )
+
 @router.get("/{application_id}", response_model=ApplicationOut)
 def get_application_by_id(
+    request: Request,
+    response: Response,
     application_id: UUID = Path(..., description="The ID of the application to retrieve"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
+    not_modified = check_not_modified(request, response, db, current_user.id)
+    if not_modified:
+        return not_modified
+
     app = (
-        db.query(Application)
+        db.query(*DETAIL_COLUMNS, Application.user_id)
         .filter(Application.id == application_id, Application.is_deleted == False)
         .first()
     )
@@ -202,28 +826,47 @@ def get_application_by_id(
     if app.user_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not authorized to view this application")
     
-    tag_map = {}
-    for assoc in app.application_tags:
-        field = assoc.field
-        if field not in tag_map:
-            tag_map[field] = []
-        tag_map[field].append(TagOut.from_orm(assoc.tag))
-
-    app_data = ApplicationOut(
-        id=app.id,
-        position=app.position,
-        company=app.company,
-        location=app.location,
-        status=app.status,
-        url=app.url,
-        notes=app.notes,
-        created_at=app.created_at,
-        updated_at=app.updated_at,
-        tags=tag_map
-    )
+    tag_map = load_tag_maps([app.id], db)[app.id]
 
     logger.info(f"User {current_user.id} accessed application {app.id}")
-    return app_data
+    return render(ApplicationOut, application_payload(app, tag_map), response)
+
+@router.get("/{application_id}/history", response_model=ApplicationHistoryPage)
+def get_application_history(
+    request: Request,
+    response: Response,
+    application_id: UUID = Path(..., description="The ID of the application whose history to list"),
+    pagination: Dict[str, object] = Depends(get_pagination_params),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    not_modified = check_not_modified(request, response, db, current_user.id)
+    if not_modified:
+        return not_modified
+
+    owner_id = db.query(Application.user_id).filter(Application.id == application_id).scalar()
+    if owner_id is None:
+        raise HTTPException(status_code=404, detail="Application not found")
+    if owner_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Not authorized to view this application")
+
+    # Served by ix_application_activity_app_created, newest first.
+    query = db.query(
+        ApplicationActivity.id,
+        ApplicationActivity.action,
+        ApplicationActivity.changes,
+        ApplicationActivity.created_at,
+    ).filter(ApplicationActivity.application_id == application_id)
+
+    total_count = query.count() if pagination["include_total"] else None
+    entries, next_cursor = paginate(query, ApplicationActivity.created_at, ApplicationActivity.id, pagination)
+
+    logger.info(f"User {current_user.id} viewed {len(entries)} history entries of application {application_id}")
+    return render(ApplicationHistoryPage, {
+        "total": total_count,
+        "history": [entry._asdict() for entry in entries],
+        "next_cursor": next_cursor
+    }, response)
 
 @router.patch("/{application_id}", response_model=ApplicationOut)
 def update_application(
@@ -242,52 +885,41 @@ def update_application(
         raise HTTPException(status_code=400, detail="Cannot update a deleted application")
 
     update_data = app_in.dict(exclude_unset=True, exclude={"tags"})
+    previous_status = app.status
+    before = snapshot(app)
     if "url" in update_data and update_data["url"] is not None:
         update_data["url"] = str(update_data["url"])
     for key, value in update_data.items():
         setattr(app, key, value)
 
+    changes = {}
     if app_in.tags is not None:
-        seen = set()
-        app.application_tags.clear()
-        for tag_data in app_in.tags:
-            key = (tag_data.tag_id, tag_data.field)
-            if key in seen:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Duplicate tag '{tag_data.tag_id}' for field '{tag_data.field}'"
-                )
-            seen.add(key)
-
-            tag = db.query(Tag).filter(Tag.id == tag_data.tag_id, Tag.user_id == current_user.id).first()
-            if not tag:
-                raise HTTPException(status_code=400, detail=f"Invalid tag ID: {tag_data.tag_id}")
-            assoc = ApplicationTag(tag_id=tag.id, field=tag_data.field)
-            app.application_tags.append(assoc)
-
-        apply_tags_to_application_fields(app, db)
-
+        names = validate_tag_inputs(app_in.tags, db, current_user.id)
+        tags_changed = sync_application_tags(app.id, app_in.tags, db)
+        apply_tags_to_application_fields(app, app_in.tags, names)
+        if tags_changed:
+            changes["tags"] = tags_changed
+    changes.update(diff_fields(before, snapshot(app)))
+    record_activity(db, current_user.id, [(app.id, "updated", changes)])
+
+    # After tag propagation: a tag on the status field sets the status too
+    moved = app.status != previous_status
+    app.change_seq = bump_data_version(db, current_user.id)
+    if moved:
+        record_status_changes(db, current_user.id, [(app.id, previous_status, app.created_at, app.status)], utcnow())
+        emit_event(
+            db, current_user.id, "application.moved",
+            version=app.change_seq, ids=[str(app.id)], status=app.status
+        )
+    else:
+        emit_event(db, current_user.id, "application.updated", version=app.change_seq, ids=[str(app.id)])
     db.commit()
     db.refresh(app)
     logger.info(f"User {current_user.id} updated application {app.id}")
 
-    tag_map = {}
-    for atag in app.application_tags:
-        tag_out = TagOut.from_orm(atag.tag)
-        tag_map.setdefault(atag.field, []).append(tag_out)
+    tag_map = load_tag_maps([app.id], db)[app.id]
 
-    return ApplicationOut(
-        id=app.id,
-        company=app.company,
-        position=app.position,
-        status=app.status,
-        location=app.location,
-        url=app.url,
-        notes=app.notes,
-        created_at=app.created_at,
-        updated_at=app.updated_at,
-        tags=tag_map
-    )
+    return render(ApplicationOut, application_payload(app, tag_map))
 
 @router.delete("/{application_id}", status_code=204)
 def delete_application(
@@ -301,7 +933,15 @@ def delete_application(
     if app.user_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not authorized to delete this application")
 
+    if app.is_deleted:
+        # Already in the trash: nothing changes, so nothing to announce.
+        return
+
+    shift_tag_usage(db, [app.id], active=-1, deleted=1)
+    record_activity(db, current_user.id, [(app.id, "deleted", {"is_deleted": [False, True]})])
     app.is_deleted = True
+    app.change_seq = bump_data_version(db, current_user.id)
+    emit_event(db, current_user.id, "application.deleted", version=app.change_seq, ids=[str(app.id)])
     db.commit()
     logger.info(f"User {current_user.id} deleted application {app.id}")
     return
@@ -321,7 +961,11 @@ def restore_application(
     if not app.is_deleted:
         raise HTTPException(status_code=400, detail="Application is not deleted")
 
+    shift_tag_usage(db, [app.id], active=1, deleted=-1)
+    record_activity(db, current_user.id, [(app.id, "restored", {"is_deleted": [True, False]})])
     app.is_deleted = False
+    app.change_seq = bump_data_version(db, current_user.id)
+    emit_event(db, current_user.id, "application.restored", version=app.change_seq, ids=[str(app.id)])
     db.commit()
     logger.info(f"User {current_user.id} restored application {app.id}")
     return {"message": f"Application {app.id} has been restored"}
@@ -344,6 +988,11 @@ def permanent_delete_application(
             detail="You must soft-delete the application before permanently deleting it."
         )
 
+    version = bump_data_version(db, current_user.id)
+    shift_tag_usage(db, [app.id], active=0, deleted=-1)
+    db.query(ApplicationActivity).filter(ApplicationActivity.application_id == app.id).delete(synchronize_session=False)
+    record_tombstones(db, current_user.id, "application", [app.id], version)
+    emit_event(db, current_user.id, "application.purged", version=version, ids=[str(app.id)])
     db.delete(app)
     db.commit()
     logger.info(f"User {current_user.id} permanently deleted application {app.id}")
@@ -4,10 +4,11 @@ from datetime import timedelta
 from jose import JWTError, jwt
 import logging
 
-from app.database import SessionLocal
+from app.database import SessionLocal, run_db
 from app.models.user import User
 from app.schemas.user import UserSignup, UserLogin, UserOut, UserInDB
-from app.core.security import hash_password, verify_password, create_access_token, decode_access_token
+from app.core.security import create_access_token, decode_access_token
+from app.core.password_hasher import password_hasher
 from app.core.config import settings
 
 router = APIRouter()
@@ -20,18 +21,32 @@ def get_db():
     finally:
         db.close()
 
+def find_user_by_email(db: Session, email: str):
+    return db.query(User).filter(User.email == email).first()
+
+def insert_user(db: Session, email: str, hashed_password: str) -> User:
+    new_user = User(email=email, hashed_password=hashed_password)
+    db.add(new_user)
+    db.commit()
+    db.refresh(new_user)
+    return new_user
+
+def save_password_hash(db: Session, user: User, hashed_password: str):
+    user.hashed_password = hashed_password
+    db.commit()
+    db.refresh(user)
+
+# signup/login are async so bcrypt runs on the hashing pool while the
+# request waits on the event loop instead of holding a worker thread.
 @router.post("/signup")
-def signup(user_in: UserSignup, response: Response, db: Session = Depends(get_db)):
-    existing_user = db.query(User).filter(User.email == user_in.email).first()
+async def signup(user_in: UserSignup, response: Response, db: Session = Depends(get_db)):
+    existing_user = await run_db(db, find_user_by_email, user_in.email)
     if existing_user:
         logger.warning(f"Signup attempt with existing email: {user_in.email}")
         raise HTTPException(status_code=400, detail="Email already registered")
     
-    hashed_pw = hash_password(user_in.password)
-    new_user = User(email=user_in.email, hashed_password=hashed_pw)
-    db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    hashed_pw = await password_hasher.hash(user_in.password)
+    new_user = await run_db(db, insert_user, user_in.email, hashed_pw)
 
     token = create_access_token({"sub": str(new_user.id)})
 
@@ -47,11 +62,19 @@ def signup(user_in: UserSignup, response: Response, db: Session = Depends(get_db
     return {"message": "Signup successful"}
 
 @router.post("/login")
-def login(user_in: UserLogin, response: Response, db: Session = Depends(get_db)):
-    user = db.query(User).filter(User.email == user_in.email).first()
-    if not user or not verify_password(user_in.password, user.hashed_password):
+async def login(user_in: UserLogin, response: Response, db: Session = Depends(get_db)):
+    user = await run_db(db, find_user_by_email, user_in.email)
+    valid, new_hash = False, None
+    # Accounts queued for deletion can't sign in.
+    if user and user.deletion_started_at is None:
+        valid, new_hash = await password_hasher.verify_and_update(user_in.password, user.hashed_password)
+    if not valid:
         logger.warning(f"Failed login attempt for email: {user_in.email}")
         raise HTTPException(status_code=401, detail="Invalid credentials")
+
+    if new_hash:
+        await run_db(db, save_password_hash, user, new_hash)
+        logger.info(f"Rehashed password for user {user.id} with the configured bcrypt cost")
     
     user_in_db = UserInDB.from_orm(user)
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
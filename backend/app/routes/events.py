@@ -0,0 +1,55 @@
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
+import asyncio
+import json
+import logging
+
+from app.models.user import User
+from app.core.auth import get_current_user
+from app.core.config import settings
+from app.core.events import broker, Subscription
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(filename)s:%(lineno)d - %(message)s")
+
+router = APIRouter()
+
+def format_sse(message: dict) -> str:
+    data = {key: value for key, value in message.items() if key != "type"}
+    return f"event: {message['type']}\ndata: {json.dumps(data, default=str, separators=(',', ':'))}\n\n"
+
+async def event_stream(request: Request, subscription: Subscription):
+    try:
+        # Tell proxies not to buffer and the browser how soon to reconnect.
+        yield "retry: 3000\n\n"
+        while not await request.is_disconnected():
+            try:
+                message = await asyncio.wait_for(subscription.get(), timeout=settings.SSE_HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                # A comment line keeps idle connections open through proxies
+                # and lets us notice clients that went away.
+                yield ": keep-alive\n\n"
+                continue
+            yield format_sse(message)
+    finally:
+        broker.unsubscribe(subscription)
+        logger.info(f"User {subscription.user_id} closed a live-update stream")
+
+@router.get("/stream")
+async def stream_events(
+    request: Request,
+    current_user: User = Depends(get_current_user)
+):
+    # Subscribing here, before any headers go out, lets the cap answer 429.
+    subscription = broker.subscribe(current_user.id)
+    logger.info(f"User {current_user.id} opened a live-update stream")
+    return StreamingResponse(
+        event_stream(request, subscription),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        # The stream's finally only runs if its body was iterated; this
+        # releases the subscription when it never was. Unsubscribing twice
+        # is harmless.
+        background=BackgroundTask(broker.unsubscribe, subscription),
+    )
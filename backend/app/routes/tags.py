@@ -1,14 +1,22 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.orm import Session
+from sqlalchemy import select, update
 from typing import List
 from uuid import UUID
 import logging
 
 from app.models.tag import Tag
+from app.models.application import Application
+from app.models.application_tag import ApplicationTag
+from app.models.tag_usage import TagUsage
 from app.models.user import User
 from app.database import SessionLocal
-from app.schemas.tag import TagCreate, TagOut
+from app.schemas.tag import TagCreate, TagOut, TagUsageOut
 from app.core.auth import get_current_user
+from app.utils.etag import bump_data_version, check_not_modified
+from app.utils.sync import record_tombstones
+from app.core.events import emit_event
+from app.utils.serialization import render
 
 
 logger = logging.getLogger(__name__)
@@ -30,7 +38,10 @@ def create_tag(
     current_user: User = Depends(get_current_user)
 ):
     tag = Tag(name=tag_in.name, user_id=current_user.id)
+    tag.change_seq = bump_data_version(db, current_user.id)
     db.add(tag)
+    db.flush()
+    emit_event(db, current_user.id, "tag.created", version=tag.change_seq, id=str(tag.id), name=tag.name)
     db.commit()
     db.refresh(tag)
     logger.info(f"User {current_user.email} created tag '{tag.name}' (id: {tag.id})")
@@ -38,12 +49,51 @@ def create_tag(
 
 @router.get("/", response_model=List[TagOut])
 def get_tags(
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    tags = db.query(Tag).filter(Tag.user_id == current_user.id).all()
+    not_modified = check_not_modified(request, response, db, current_user.id)
+    if not_modified:
+        return not_modified
+
+    tags = db.query(Tag.id, Tag.name).filter(Tag.user_id == current_user.id).all()
     logger.info(f"User {current_user.email} fetched {len(tags)} tags.")
-    return tags
+    return render(List[TagOut], [tag._asdict() for tag in tags], response)
+
+@router.get("/usage", response_model=List[TagUsageOut])
+def get_tag_usage(
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Every tag with how many active and deleted applications use it, overall
+    and per field. Reads the maintained tag_usage_counts rows; nothing is
+    counted on the fly.
+    """
+    not_modified = check_not_modified(request, response, db, current_user.id)
+    if not_modified:
+        return not_modified
+
+    rows = (
+        db.query(Tag.id, Tag.name, TagUsage.field, TagUsage.active_count, TagUsage.deleted_count)
+        .outerjoin(TagUsage, TagUsage.tag_id == Tag.id)
+        .filter(Tag.user_id == current_user.id)
+        .order_by(Tag.name, Tag.id)
+        .all()
+    )
+    tags = {}
+    for tag_id, name, field, active, deleted in rows:
+        tag = tags.setdefault(tag_id, {"id": tag_id, "name": name, "active": 0, "deleted": 0, "fields": {}})
+        if field is not None and (active or deleted):
+            tag["active"] += active
+            tag["deleted"] += deleted
+            tag["fields"][field] = {"active": active, "deleted": deleted}
+    logger.info(f"User {current_user.email} fetched usage for {len(tags)} tags.")
+    return render(List[TagUsageOut], list(tags.values()), response)
 
 @router.delete("/{tag_id}", status_code=204)
 def delete_tag(
@@ -56,6 +106,17 @@ def delete_tag(
         logger.warning(f"User {current_user.email} tried to delete non-existent tag {tag_id}")
         raise HTTPException(status_code=404, detail="Tag not found")
     
+    version = bump_data_version(db, current_user.id)
+    # Applications carrying the tag lose it with the cascade below; stamp them
+    # so delta-sync clients refetch their tag maps.
+    db.execute(
+        update(Application)
+        .where(Application.id.in_(select(ApplicationTag.application_id).where(ApplicationTag.tag_id == tag.id)))
+        .values(change_seq=version)
+        .execution_options(synchronize_session=False)
+    )
+    record_tombstones(db, current_user.id, "tag", [tag.id], version)
+    emit_event(db, current_user.id, "tag.deleted", version=version, id=str(tag.id))
     db.delete(tag)
     db.commit()
     logger.info(f"User {current_user.email} deleted tag '{tag.name}' (id: {tag.id})")
@@ -1,9 +1,10 @@
-from pydantic import BaseModel, HttpUrl, Field
-from typing import Optional, List, Dict
+from pydantic import BaseModel, HttpUrl, Field, model_validator
+from typing import Any, Optional, List, Dict
 from uuid import UUID
-from datetime import datetime
+from datetime import date, datetime
 
 from app.schemas.tag import TagOut
+from app.constants.status import ApplicationStatus
 
 class ApplicationTagInput(BaseModel):
     tag_id: UUID
@@ -18,6 +19,18 @@ class ApplicationCreate(BaseModel):
     notes: Optional[str] = None
     tags: Optional[List[ApplicationTagInput]] = []
 
+class ApplicationImport(BaseModel):
+    """
+    One imported row. Company and position are required as on create, but
+    may be empty: PATCH /applications/{id} can store "" and exports write it.
+    """
+    company: str
+    position: str
+    status: str = Field(default="wishlist")
+    location: Optional[str] = None
+    url: Optional[HttpUrl] = None
+    notes: Optional[str] = None
+
 class ApplicationOut(BaseModel):
     id: UUID
     company: str
@@ -57,4 +70,134 @@ class ApplicationSummaryOut(BaseModel):
     tag_ids: List[UUID]
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class ApplicationSummaryPage(BaseModel):
+    total: Optional[int]
+    applications: List[ApplicationSummaryOut]
+    next_cursor: Optional[str]
+
+class ApplicationPage(BaseModel):
+    total: Optional[int]
+    applications: List[ApplicationOut]
+    next_cursor: Optional[str]
+
+class ApplicationBulkStatusUpdate(BaseModel):
+    ids: List[UUID] = Field(..., min_length=1)
+    status: ApplicationStatus
+
+class BulkResultItem(BaseModel):
+    id: UUID
+    result: str
+    updated_at: Optional[datetime] = None
+
+class ApplicationBulkStatusOut(BaseModel):
+    status: str
+    updated: int
+    results: List[BulkResultItem]
+
+
+class ApplicationBulkIds(BaseModel):
+    ids: List[UUID] = Field(..., min_length=1)
+
+class ApplicationTrashSelection(BaseModel):
+    ids: Optional[List[UUID]] = None
+    all: bool = False
+
+    @model_validator(mode="after")
+    def check_selection(self):
+        if self.all == bool(self.ids):
+            raise ValueError("Provide either a non-empty 'ids' list or 'all': true")
+        return self
+
+class ApplicationBulkOut(BaseModel):
+    affected: int
+    results: List[BulkResultItem]
+
+class ApplicationSearchHit(ApplicationSummaryOut):
+    location: Optional[str] = None
+    rank: float
+    snippet: Optional[str] = None
+
+class ApplicationSearchPage(BaseModel):
+    total: Optional[int]
+    applications: List[ApplicationSearchHit]
+
+class BoardCard(BaseModel):
+    id: UUID
+    company: str
+    position: str
+    status: str
+    location: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+    tags: Dict[str, List[UUID]]
+
+class BoardColumn(BaseModel):
+    status: str
+    count: int
+    applications: List[BoardCard]
+
+class BoardOut(BaseModel):
+    columns: List[BoardColumn]
+    tags: Dict[UUID, str]
+
+class ApplicationChangeOut(ApplicationOut):
+    is_deleted: bool
+
+class SyncDeletedOut(BaseModel):
+    applications: List[UUID]
+    tags: List[UUID]
+
+class ApplicationChangesOut(BaseModel):
+    next: str
+    reset: bool
+    applications: List[ApplicationChangeOut]
+    tags: List[TagOut]
+    deleted: SyncDeletedOut
+
+class ImportRowError(BaseModel):
+    row: int
+    error: str
+
+class ApplicationImportOut(BaseModel):
+    total: int
+    imported: int
+    failed: int
+    batches: int
+    errors: List[ImportRowError]
+    errors_truncated: bool
+
+class FunnelStage(BaseModel):
+    status: str
+    from_status: Optional[str]
+    reached: int
+    conversion_rate: Optional[float]
+
+class StatusDwell(BaseModel):
+    status: str
+    exits: int
+    median_hours: Optional[float]
+    mean_hours: Optional[float]
+
+class WeeklyVolume(BaseModel):
+    week_start: date
+    created: int
+
+class ApplicationStatsOut(BaseModel):
+    since: Optional[date]
+    funnel: List[FunnelStage]
+    time_in_status: List[StatusDwell]
+    weekly_volume: List[WeeklyVolume]
+
+class ApplicationActivityOut(BaseModel):
+    id: UUID
+    action: str
+    # {field: [old, new]}; "tags" maps tag ids to [old field, new field]
+    changes: Dict[str, Any]
+    created_at: datetime
+
+class ApplicationHistoryPage(BaseModel):
+    total: Optional[int]
+    history: List[ApplicationActivityOut]
+    next_cursor: Optional[str]
@@ -0,0 +1,43 @@
+from pydantic import BaseModel, Field
+from uuid import UUID
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+class UserScopedJobPayload(BaseModel):
+    """Payload of a maintenance job that runs for one user, or everyone when user_id is omitted."""
+    user_id: Optional[UUID] = None
+
+    model_config = {
+        "extra": "forbid"
+    }
+
+# Job kinds admins may queue through POST /admin/jobs, with their payload
+# schemas. Others (account.purge) are only queued by the endpoints that
+# guard them.
+MAINTENANCE_JOB_PAYLOADS = {
+    "status_stats.backfill": UserScopedJobPayload,
+    "tag_usage.repair": UserScopedJobPayload,
+}
+
+class JobCreate(BaseModel):
+    kind: str = Field(..., min_length=1)
+    payload: Dict[str, Any] = Field(default_factory=dict)
+    max_attempts: Optional[int] = Field(None, ge=1, le=20)
+
+class JobOut(BaseModel):
+    id: UUID
+    kind: str
+    status: str
+    payload: Dict[str, Any]
+    attempts: int
+    max_attempts: int
+    run_at: datetime
+    created_at: datetime
+    started_at: Optional[datetime]
+    finished_at: Optional[datetime]
+    last_error: Optional[str]
+    result: Optional[Dict[str, Any]]
+    created_by: Optional[UUID]
+
+    class Config:
+        from_attributes = True
@@ -1,4 +1,5 @@
 from pydantic import BaseModel
+from typing import Dict
 from uuid import UUID
 from app.constants.tag_fields import TaggableField
 
@@ -14,6 +15,15 @@ class TagOut(TagBase):
     class Config:
         from_attributes = True
 
+class TagFieldUsage(BaseModel):
+    active: int
+    deleted: int
+
+class TagUsageOut(TagOut):
+    active: int
+    deleted: int
+    fields: Dict[TaggableField, TagFieldUsage]
+
 class ApplicationTagIn(BaseModel):
     tag_id: UUID
     field: TaggableField
@@ -1,6 +1,7 @@
 from pydantic import BaseModel, EmailStr
 from uuid import UUID
 from datetime import datetime
+from typing import List, Optional
 
 class UserBase(BaseModel):
     email: EmailStr
@@ -23,4 +24,22 @@ class UserOut(BaseModel):
 
 class UserInDB(UserOut):
     hashed_password: str
-    
\ No newline at end of file
+    
+
+class AdminUserOut(UserOut):
+    active_applications: int
+    deleted_applications: int
+    tags: int
+    last_activity_at: Optional[datetime]
+
+class SiteTotals(BaseModel):
+    users: int
+    applications: int
+    tags: int
+    # True when the counts come from planner statistics rather than COUNT(*)
+    estimated: bool
+
+class AdminUserPage(BaseModel):
+    users: List[AdminUserOut]
+    next_cursor: Optional[str]
+    totals: SiteTotals
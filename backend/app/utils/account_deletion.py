@@ -0,0 +1,124 @@
+"""
+Account removal.
+
+`delete_account` does it in one transaction and relies on the foreign keys'
+ON DELETE CASCADE for applications, tags and their associations. For very
+large accounts `purge_account` empties the account a chunk at a time, each
+chunk in its own short transaction, and deletes the user row last. While it
+runs the user is flagged with `deletion_started_at` and can't sign in.
+
+Purges run as `account.purge` jobs (app/core/jobs.py), so a worker that
+dies mid-purge is retried. Flagged accounts can also be finished by hand:
+
+    cd backend
+    python -m app.utils.account_deletion
+"""
+import argparse
+import logging
+from typing import List
+from uuid import UUID
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.jobs import job_handler
+from app.models.application import Application, utcnow
+from app.models.application_activity import ApplicationActivity
+from app.models.status_rollup import StatusDailyRollup, StatusDwellRollup
+from app.models.status_transition import StatusTransition
+from app.models.sync_tombstone import SyncTombstone
+from app.models.tag import Tag
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+# Per-user rows with no foreign key to the user (they outlive the rows they
+# describe), paired with a column to chunk them by.
+HISTORY_TABLES = (
+    (ApplicationActivity, ApplicationActivity.id),
+    (StatusTransition, StatusTransition.id),
+    (StatusDailyRollup, StatusDailyRollup.day),
+    (StatusDwellRollup, StatusDwellRollup.day),
+    (SyncTombstone, SyncTombstone.entity_id),
+)
+# Deleting these cascades to application_tags and tag_usage_counts.
+OWNED_TABLES = (
+    (Application, Application.id),
+    (Tag, Tag.id),
+)
+
+def delete_account(db: Session, user_id: UUID) -> None:
+    """Delete the user and everything they own in the current transaction."""
+    for model, _ in HISTORY_TABLES:
+        db.execute(delete(model).where(model.user_id == user_id).execution_options(synchronize_session=False))
+    db.execute(delete(User).where(User.id == user_id).execution_options(synchronize_session=False))
+
+def start_account_deletion(db: Session, user_id: UUID) -> None:
+    db.execute(
+        update(User)
+        .where(User.id == user_id, User.deletion_started_at.is_(None))
+        .values(deletion_started_at=utcnow())
+        .execution_options(synchronize_session=False)
+    )
+
+def delete_chunk(db: Session, model, key, user_id: UUID, chunk_size: int) -> int:
+    """Delete up to about `chunk_size` of the user's rows and commit."""
+    deleted = db.execute(
+        delete(model)
+        .where(model.user_id == user_id, key.in_(select(key).where(model.user_id == user_id).limit(chunk_size)))
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    db.commit()
+    return deleted
+
+def purge_account(db: Session, user_id: UUID, chunk_size: int) -> int:
+    """
+    Empty the account `chunk_size` rows per transaction, then delete the
+    user. Safe to re-run after an interruption. Returns rows deleted.
+    """
+    total = 0
+    for model, key in HISTORY_TABLES + OWNED_TABLES:
+        while True:
+            deleted = delete_chunk(db, model, key, user_id, chunk_size)
+            if not deleted:
+                break
+            total += deleted
+    db.execute(delete(User).where(User.id == user_id).execution_options(synchronize_session=False))
+    db.commit()
+    logger.info(f"Purged account {user_id}: {total} rows deleted")
+    return total
+
+@job_handler("account.purge")
+def purge_account_job(db: Session, payload: dict) -> dict:
+    user_id = UUID(payload["user_id"])
+    # Only accounts start_account_deletion flagged (and locked out) are
+    # purged; a user row that is already gone means a re-run finishing up.
+    flagged = db.execute(select(User.deletion_started_at).where(User.id == user_id)).first()
+    if flagged is not None and flagged.deletion_started_at is None:
+        return {"rows_deleted": 0, "skipped": "account is not marked for deletion"}
+    chunk_size = payload.get("chunk_size") or settings.ACCOUNT_DELETE_CHUNK_SIZE
+    return {"rows_deleted": purge_account(db, user_id, chunk_size)}
+
+def pending_deletions(db: Session) -> List[UUID]:
+    return db.execute(select(User.id).where(User.deletion_started_at.is_not(None))).scalars().all()
+
+def main():
+    from app.database import SessionLocal
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chunk-size", type=int, default=settings.ACCOUNT_DELETE_CHUNK_SIZE)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        user_ids = pending_deletions(db)
+        for user_id in user_ids:
+            purge_account(db, user_id, args.chunk_size)
+    finally:
+        db.close()
+    print(f"Finished {len(user_ids)} pending account deletions.")
+
+
+if __name__ == "__main__":
+    main()
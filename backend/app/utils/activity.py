@@ -0,0 +1,148 @@
+import asyncio
+import logging
+import re
+from datetime import date, datetime, timezone
+from typing import Dict, Iterable, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import delete, insert, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.database import SessionLocal
+from app.models.application import utcnow
+from app.models.application_activity import ApplicationActivity
+
+logger = logging.getLogger(__name__)
+
+# Application columns whose changes are kept in the history.
+TRACKED_FIELDS = ("company", "position", "status", "location", "url", "notes")
+PARTITION_NAME = re.compile(r"^application_activity_y(\d{4})m(\d{2})$")
+DEFAULT_PARTITION = "application_activity_default"
+
+# (application id, action, {field: [old, new]})
+ActivityEntry = Tuple[UUID, str, Dict[str, list]]
+
+def snapshot(app) -> dict:
+    return {field: getattr(app, field) for field in TRACKED_FIELDS}
+
+def diff_fields(before: dict, after: dict) -> Dict[str, list]:
+    return {field: [before.get(field), value] for field, value in after.items() if before.get(field) != value}
+
+def tag_changes(before: dict, after: dict) -> Dict[str, list]:
+    """{tag_id: [old field, new field]} between two {tag_id: field} maps; None means absent."""
+    field = lambda value: getattr(value, "value", value)
+    return {
+        str(tag_id): [field(before.get(tag_id)), field(after.get(tag_id))]
+        for tag_id in before.keys() | after.keys()
+        if field(before.get(tag_id)) != field(after.get(tag_id))
+    }
+
+def record_activity(db: Session, user_id: UUID, entries: Iterable[ActivityEntry]) -> None:
+    """Append history rows for this transaction; entries without changes are dropped."""
+    now = utcnow()
+    rows = [
+        {"application_id": app_id, "user_id": user_id, "action": action, "changes": changes, "created_at": now}
+        for app_id, action, changes in entries
+        if changes
+    ]
+    if rows:
+        db.execute(insert(ApplicationActivity), rows)
+
+def month_start(day: date, offset: int = 0) -> date:
+    months = day.year * 12 + day.month - 1 + offset
+    return date(months // 12, months % 12 + 1, 1)
+
+def create_month_partition(db: Session, name: str, start: date, end: date) -> None:
+    bounds = f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+    in_range = "created_at >= :start AND created_at < :end"
+    params = {"start": start.isoformat(), "end": end.isoformat()}
+    stranded = db.execute(
+        text(f"SELECT count(*) FROM {DEFAULT_PARTITION} WHERE {in_range}"), params
+    ).scalar()
+    if not stranded:
+        db.execute(text(f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF application_activity {bounds}"))
+        return
+    # Postgres won't create a partition over rows the default one already
+    # holds for its range, so move them into a plain table and attach that.
+    logger.warning(f"Moving {stranded} history rows out of {DEFAULT_PARTITION} into new partition {name}")
+    db.execute(text(f"CREATE TABLE {name} (LIKE application_activity INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"))
+    db.execute(text(
+        f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} WHERE {in_range} RETURNING *) "
+        f"INSERT INTO {name} SELECT * FROM moved"
+    ), params)
+    db.execute(text(f"ALTER TABLE application_activity ATTACH PARTITION {name} {bounds}"))
+
+def ensure_activity_partitions(db: Session, months_ahead: int, today: date) -> None:
+    """Create this month's and the next `months_ahead` months' partitions (Postgres only)."""
+    if db.get_bind().dialect.name != "postgresql":
+        return
+    for offset in range(months_ahead + 1):
+        start, end = month_start(today, offset), month_start(today, offset + 1)
+        name = f"application_activity_y{start.year:04d}m{start.month:02d}"
+        try:
+            with db.begin_nested():
+                create_month_partition(db, name, start, end)
+        except SQLAlchemyError:
+            logger.exception(f"Could not create activity partition {name}")
+    db.commit()
+
+def prune_activity(db: Session, retention_months: int, today: date) -> int:
+    """
+    Drop history older than `retention_months` whole months. On Postgres
+    expired monthly partitions are dropped outright; whatever is left (the
+    default partition, or every row elsewhere) is deleted by date.
+    """
+    cutoff = month_start(today, -retention_months)
+    dropped = 0
+    if db.get_bind().dialect.name == "postgresql":
+        partitions = db.execute(text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE parent.relname = 'application_activity'"
+        )).scalars().all()
+        for name in partitions:
+            match = PARTITION_NAME.match(name)
+            if match and month_start(date(int(match[1]), int(match[2]), 1), 1) <= cutoff:
+                db.execute(text(f"DROP TABLE {name}"))
+                dropped += 1
+    deleted = db.execute(
+        delete(ApplicationActivity)
+        .where(ApplicationActivity.created_at < datetime.combine(cutoff, datetime.min.time(), timezone.utc))
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    db.commit()
+    if dropped or deleted:
+        logger.info(f"Pruned application history before {cutoff}: {dropped} partitions dropped, {deleted} rows deleted")
+    return deleted
+
+def maintain_activity_once(today: Optional[date] = None) -> None:
+    today = today or utcnow().date()
+    db = SessionLocal()
+    try:
+        ensure_activity_partitions(db, settings.ACTIVITY_PARTITIONS_AHEAD, today)
+        if settings.ACTIVITY_RETENTION_MONTHS > 0:
+            prune_activity(db, settings.ACTIVITY_RETENTION_MONTHS, today)
+    finally:
+        db.close()
+
+async def run_activity_maintenance() -> None:
+    while True:
+        try:
+            await asyncio.to_thread(maintain_activity_once)
+        except Exception:
+            logger.exception("Application history maintenance failed")
+        await asyncio.sleep(settings.ACTIVITY_MAINTENANCE_INTERVAL_SECONDS)
+
+_maintenance_task = None
+
+def start_activity_maintenance() -> None:
+    global _maintenance_task
+    if settings.ACTIVITY_MAINTENANCE_INTERVAL_SECONDS > 0:
+        _maintenance_task = asyncio.get_running_loop().create_task(run_activity_maintenance())
+
+def stop_activity_maintenance() -> None:
+    if _maintenance_task:
+        _maintenance_task.cancel()
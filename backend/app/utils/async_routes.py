@@ -0,0 +1,81 @@
+import inspect
+from fastapi import APIRouter, Depends
+from fastapi.routing import APIRoute
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_async_db
+
+def to_async_endpoint(endpoint):
+    """
+    Turn a sync route handler that takes `db: Session` into an `async def`
+    handler backed by an AsyncSession.
+
+    The handler body runs through AsyncSession.run_sync, which executes it
+    in a greenlet on the event loop with every database call awaited on the
+    async driver, so the request never occupies a thread-pool slot. Handlers
+    that are already `async def` only get the AsyncSession dependency
+    swapped in; handlers without a Session parameter are returned unchanged.
+    """
+    signature = inspect.signature(endpoint)
+    db_names = [name for name, param in signature.parameters.items() if param.annotation is Session]
+    if not db_names:
+        return endpoint
+    db_name = db_names[0]
+
+    if inspect.iscoroutinefunction(endpoint):
+        # Already async: it reaches the database through run_db, which
+        # accepts the AsyncSession as-is.
+        async def async_endpoint(**kwargs):
+            return await endpoint(**kwargs)
+    else:
+        async def async_endpoint(**kwargs):
+            db: AsyncSession = kwargs.pop(db_name)
+            return await db.run_sync(lambda session: endpoint(**kwargs, **{db_name: session}))
+
+    async_endpoint.__signature__ = signature.replace(parameters=[
+        param.replace(annotation=AsyncSession, default=Depends(get_async_db)) if name == db_name else param
+        for name, param in signature.parameters.items()
+    ])
+    async_endpoint.__name__ = endpoint.__name__
+    async_endpoint.__qualname__ = endpoint.__qualname__
+    async_endpoint.__doc__ = endpoint.__doc__
+    async_endpoint.__module__ = endpoint.__module__
+    return async_endpoint
+
+def mirror_router_async(router: APIRouter) -> APIRouter:
+    """
+    Build a router with the same paths, models and dependencies as `router`,
+    but whose handlers run on the async engine.
+    """
+    async_router = APIRouter()
+    for route in router.routes:
+        if not isinstance(route, APIRoute):
+            async_router.routes.append(route)
+            continue
+        async_router.add_api_route(
+            route.path,
+            to_async_endpoint(route.endpoint),
+            methods=list(route.methods),
+            response_model=route.response_model,
+            status_code=route.status_code,
+            tags=route.tags,
+            dependencies=route.dependencies,
+            summary=route.summary,
+            description=route.description,
+            response_description=route.response_description,
+            responses=route.responses,
+            deprecated=route.deprecated,
+            operation_id=route.operation_id,
+            response_model_include=route.response_model_include,
+            response_model_exclude=route.response_model_exclude,
+            response_model_by_alias=route.response_model_by_alias,
+            response_model_exclude_unset=route.response_model_exclude_unset,
+            response_model_exclude_defaults=route.response_model_exclude_defaults,
+            response_model_exclude_none=route.response_model_exclude_none,
+            include_in_schema=route.include_in_schema,
+            response_class=route.response_class,
+            name=route.name,
+            openapi_extra=route.openapi_extra,
+        )
+    return async_router
@@ -0,0 +1,31 @@
+from typing import Dict, Tuple
+
+from sqlalchemy import func, select, text
+from sqlalchemy.orm import Session
+
+
+def table_row_counts(db: Session, models) -> Tuple[Dict[str, int], bool]:
+    """
+    Row counts for `models`, keyed by table name, and whether they are
+    estimates.
+
+    On Postgres these come from the planner statistics in pg_class, which
+    cost nothing to read and are kept current by autovacuum/ANALYZE. A
+    table that has never been analyzed reports -1 and is counted exactly
+    instead, as is everything on other databases.
+    """
+    tables = {model.__tablename__: model for model in models}
+    counts, estimated = {}, False
+    if db.get_bind().dialect.name == "postgresql":
+        rows = db.execute(
+            text("SELECT relname, reltuples::bigint FROM pg_class WHERE relkind IN ('r', 'p') AND relname = ANY(:names)"),
+            {"names": list(tables)},
+        )
+        for name, reltuples in rows:
+            if reltuples >= 0:
+                counts[name] = reltuples
+                estimated = True
+    for name, model in tables.items():
+        if name not in counts:
+            counts[name] = db.execute(select(func.count()).select_from(model)).scalar()
+    return counts, estimated
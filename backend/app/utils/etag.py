@@ -0,0 +1,62 @@
+import hashlib
+from typing import Optional
+from uuid import UUID
+
+from fastapi import Request, Response
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.models.user import User
+
+def bump_data_version(db: Session, user_id: UUID) -> int:
+    """
+    Record that something in the user's board changed and return the new
+    version. Call it inside the same transaction as the change, before the
+    rows are written: the row lock it takes serialises a user's writers, so
+    versions stamped on changed rows commit in order (see app/utils/sync.py).
+    """
+    return db.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(data_version=User.data_version + 1)
+        .returning(User.data_version)
+        .execution_options(synchronize_session=False)
+    ).scalar_one()
+
+def compute_etag(request: Request, version: Optional[int], scope: str = "") -> str:
+    # The version says "something changed"; the URL digest keeps different
+    # pages/filters of the same collection from sharing a tag. `scope` covers
+    # anything else the body depends on, such as the current date.
+    params = "&".join(sorted(f"{key}={value}" for key, value in request.query_params.multi_items()))
+    key = f"{request.url.path}?{params}" + (f"#{scope}" if scope else "")
+    digest = hashlib.blake2s(key.encode(), digest_size=8).hexdigest()
+    return f'W/"{version or 0}-{digest}"'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison: W/"x" and "x" are equivalent for If-None-Match.
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag.removeprefix("W/") in candidates
+
+def check_not_modified(
+    request: Request, response: Response, db: Session, user_id: UUID, scope: str = ""
+) -> Optional[Response]:
+    """
+    Answer a conditional GET from the user's data_version (and `scope`, for
+    bodies that also depend on something other than the user's data).
+
+    Returns a ready 304 response when the client's copy is current; otherwise
+    sets ETag on `response` and returns None so the handler builds the body.
+    """
+    version = db.query(User.data_version).filter(User.id == user_id).scalar()
+    etag = compute_etag(request, version, scope)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    response.headers.update(headers)
+    return None
@@ -0,0 +1,108 @@
+import csv
+import io
+from itertools import groupby
+from typing import Iterator
+from uuid import UUID
+
+import orjson
+from sqlalchemy import desc
+
+from app.database import SessionLocal
+from app.models.application import Application
+from app.models.application_tag import ApplicationTag
+from app.models.tag import Tag
+from app.constants.tag_fields import TaggableField
+
+EXPORT_BATCH_SIZE = 1000
+# Flush to the client once this many characters are buffered.
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+EXPORT_COLUMNS = (
+    Application.id,
+    Application.company,
+    Application.position,
+    Application.status,
+    Application.location,
+    Application.url,
+    Application.notes,
+    Application.created_at,
+    Application.updated_at,
+    Application.is_deleted,
+)
+TAG_FIELDS = [field.value for field in TaggableField]
+CSV_HEADER = [column.key for column in EXPORT_COLUMNS] + [f"tags_{field}" for field in TAG_FIELDS]
+
+MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+
+def iter_export_rows(user_id: UUID, include_deleted: bool) -> Iterator[dict]:
+    """
+    Yield one dict per application, tags grouped by field, from a single
+    server-side cursor.
+
+    Applications are outer-joined to their tags and ordered by id within the
+    sort key, so each application's tag rows arrive together and are folded
+    in as they stream past; only one application is held at a time.
+    """
+    db = SessionLocal()
+    try:
+        query = (
+            db.query(*EXPORT_COLUMNS, ApplicationTag.field, Tag.name)
+            .outerjoin(ApplicationTag, ApplicationTag.application_id == Application.id)
+            .outerjoin(Tag, Tag.id == ApplicationTag.tag_id)
+            .filter(Application.user_id == user_id)
+        )
+        if not include_deleted:
+            query = query.filter(Application.is_deleted == False)
+        query = (
+            query.order_by(desc(Application.created_at), desc(Application.id), Tag.name)
+            .execution_options(stream_results=True, yield_per=EXPORT_BATCH_SIZE)
+        )
+
+        for _, rows in groupby(query, key=lambda row: row.id):
+            first = next(rows)
+            record = {column.key: first[i] for i, column in enumerate(EXPORT_COLUMNS)}
+            tags = {}
+            for row in (first, *rows):
+                if row.field is not None:
+                    tags.setdefault(getattr(row.field, "value", row.field), []).append(row.name)
+            record["tags"] = tags
+            yield record
+    finally:
+        db.close()
+
+def export_csv(rows: Iterator[dict]) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_HEADER)
+    for record in rows:
+        tags = record.pop("tags")
+        writer.writerow(
+            [
+                value.isoformat() if hasattr(value, "isoformat") else value
+                for value in record.values()
+            ]
+            + ["; ".join(tags.get(field, [])) for field in TAG_FIELDS]
+        )
+        if buffer.tell() >= EXPORT_CHUNK_SIZE:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+def export_ndjson(rows: Iterator[dict]) -> Iterator[bytes]:
+    chunk = bytearray()
+    for record in rows:
+        chunk += orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+        if len(chunk) >= EXPORT_CHUNK_SIZE:
+            yield bytes(chunk)
+            chunk.clear()
+    yield bytes(chunk)
+
+def stream_export(user_id: UUID, export_format: str, include_deleted: bool):
+    rows = iter_export_rows(user_id, include_deleted)
+    if export_format == "ndjson":
+        return export_ndjson(rows)
+    return export_csv(rows)
@@ -0,0 +1,299 @@
+import csv
+import io
+import uuid
+from typing import IO, Dict, Iterator, List, Optional, Tuple
+from uuid import UUID
+
+import orjson
+from pydantic import ValidationError
+from sqlalchemy import insert, or_, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.constants.tag_fields import TaggableField
+from app.core.events import emit_event
+from app.database import SessionLocal
+from app.models.application import Application, utcnow
+from app.models.application_tag import ApplicationTag
+from app.models.tag import Tag
+from app.schemas.application import ApplicationImport
+from app.utils.etag import bump_data_version
+from app.utils.tag_usage import apply_usage_deltas, usage_deltas
+from app.utils.status_stats import record_status_creations
+from app.utils.activity import TRACKED_FIELDS, diff_fields, record_activity, tag_changes
+
+IMPORT_BATCH_SIZE = 1000
+IMPORT_MAX_ERRORS = 1000
+
+APPLICATION_FIELDS = ("company", "position", "status", "location", "url", "notes")
+# CSV has no null: an empty cell in these columns means the value is absent
+# (NULL, or the default status). Company and position keep "" as written.
+CSV_EMPTY_IS_ABSENT = ("status", "location", "url", "notes")
+TAG_FIELDS = {field.value for field in TaggableField}
+# Values accepted for is_deleted: JSON booleans, and what CSV exports write
+FLAGS = {"true": True, "1": True, "yes": True, "false": False, "0": False, "no": False, "": False}
+
+# (row number, application fields, [(tag field, tag id or name)]) or an error
+ParsedRow = Tuple[int, Optional[dict], List[Tuple[str, str]], Optional[str]]
+
+def split_refs(value) -> List[str]:
+    if value is None:
+        return []
+    if isinstance(value, list):
+        return [str(ref).strip() for ref in value if str(ref).strip()]
+    return [ref.strip() for ref in str(value).split(";") if ref.strip()]
+
+def parse_record(record: dict) -> Tuple[dict, List[Tuple[str, str]]]:
+    """
+    Accept the shapes GET /applications/export writes: flat `tags_<field>`
+    columns ("; "-separated) for CSV, a `tags` object of field -> [refs] for
+    NDJSON. A `tags` list of {"field", "tag_id" | "name"} is accepted too.
+    """
+    fields = {key: record[key] for key in APPLICATION_FIELDS if record.get(key) is not None}
+    if record.get("is_deleted") is not None:
+        fields["is_deleted"] = record["is_deleted"]
+    refs = []
+    for key, value in record.items():
+        # A CSV row with more cells than the header files the rest under None
+        if isinstance(key, str) and key.startswith("tags_"):
+            refs.extend((key[len("tags_"):], ref) for ref in split_refs(value))
+
+    tags = record.get("tags")
+    if isinstance(tags, dict):
+        for field, value in tags.items():
+            refs.extend((field, ref) for ref in split_refs(value))
+    elif isinstance(tags, list):
+        for item in tags:
+            if not isinstance(item, dict):
+                raise ValueError("Each entry in 'tags' must be an object")
+            ref = item.get("tag_id") or item.get("name")
+            if not ref:
+                raise ValueError("Tag entries need a 'tag_id' or 'name'")
+            refs.append((item.get("field"), str(ref)))
+    return fields, refs
+
+def iter_csv(file: IO[bytes]) -> Iterator[Tuple[int, dict]]:
+    text = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+    for row_number, record in enumerate(csv.DictReader(text), start=1):
+        # DictReader fills the columns a short row lacks with None
+        yield row_number, {
+            key: None if value == "" and key in CSV_EMPTY_IS_ABSENT else value
+            for key, value in record.items()
+        }
+
+def iter_ndjson(file: IO[bytes]) -> Iterator[Tuple[int, object]]:
+    for line_number, line in enumerate(file, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield line_number, orjson.loads(line)
+        except orjson.JSONDecodeError:
+            yield line_number, None
+
+def iter_rows(file: IO[bytes], import_format: str) -> Iterator[ParsedRow]:
+    records = iter_ndjson(file) if import_format == "ndjson" else iter_csv(file)
+    for row_number, record in records:
+        if not isinstance(record, dict):
+            yield row_number, None, [], "Row is not a JSON object"
+            continue
+        try:
+            fields, refs = parse_record(record)
+        except ValueError as e:
+            yield row_number, None, [], str(e)
+            continue
+        yield row_number, fields, refs, None
+
+def parse_flag(value) -> bool:
+    if isinstance(value, bool):
+        return value
+    flag = FLAGS.get(str(value).strip().lower())
+    if flag is None:
+        raise ValueError(f"Invalid is_deleted value '{value}'")
+    return flag
+
+def validate_fields(fields: dict) -> dict:
+    """
+    Accept what the API can store: anything POST or PATCH /applications/
+    would. `is_deleted` is kept, so an export that included the trash comes
+    back with those rows still in it.
+    """
+    fields = dict(fields)
+    is_deleted = parse_flag(fields.pop("is_deleted", False))
+    data = ApplicationImport.model_validate(fields).model_dump()
+    if data.get("url"):
+        data["url"] = str(data["url"])
+    data["is_deleted"] = is_deleted
+    return data
+
+def resolve_tags(db: Session, user_id: UUID, refs: List[str], create_missing: bool, version: int) -> Dict[str, UUID]:
+    """
+    Map every tag reference in a batch (an id or a name) to a tag id with a
+    single query, creating the missing names in one insert when asked to.
+    """
+    ids, names = set(), set()
+    for ref in refs:
+        try:
+            ids.add(UUID(ref))
+        except ValueError:
+            names.add(ref)
+    if not ids and not names:
+        return {}
+
+    resolved = {}
+    rows = db.execute(
+        select(Tag.id, Tag.name)
+        .where(Tag.user_id == user_id, or_(Tag.id.in_(ids), Tag.name.in_(names)))
+        .order_by(Tag.created_at, Tag.id)
+    ).all()
+    for tag_id, name in rows:
+        if tag_id in ids:
+            resolved[str(tag_id)] = tag_id
+        if name in names:
+            resolved.setdefault(name, tag_id)
+
+    missing = sorted(names - resolved.keys())
+    if missing and create_missing:
+        new_tags = [
+            {"id": uuid.uuid4(), "user_id": user_id, "name": name, "change_seq": version}
+            for name in missing
+        ]
+        db.execute(insert(Tag), new_tags)
+        for tag in new_tags:
+            resolved[tag["name"]] = tag["id"]
+            emit_event(db, user_id, "tag.created", version=version, id=str(tag["id"]), name=tag["name"])
+    return resolved
+
+def import_batch(db: Session, user_id: UUID, batch: List[ParsedRow], create_tags: bool, errors: List[dict]) -> int:
+    """Validate and insert one batch in its own transaction; returns rows imported."""
+    valid = []
+    for row_number, fields, refs, error in batch:
+        if error is None:
+            try:
+                valid.append((row_number, validate_fields(fields), refs))
+                continue
+            except (ValidationError, ValueError) as e:
+                error = "; ".join(
+                    f"{'.'.join(map(str, err['loc'])) or 'row'}: {err['msg']}" for err in e.errors()
+                ) if isinstance(e, ValidationError) else str(e)
+        errors.append({"row": row_number, "error": error})
+
+    if not valid:
+        return 0
+
+    try:
+        version = bump_data_version(db, user_id)
+        resolved = resolve_tags(db, user_id, [ref for _, _, refs in valid for _, ref in refs], create_tags, version)
+
+        applications, associations, imported_ids = [], [], []
+        now = utcnow()
+        for row_number, data, refs in valid:
+            app_id = uuid.uuid4()
+            links, problem = {}, None
+            for field, ref in refs:
+                if field not in TAG_FIELDS:
+                    problem = f"Invalid tag field '{field}'"
+                    break
+                if ref not in resolved:
+                    problem = f"Unknown tag '{ref}'"
+                    break
+                tag_id = resolved[ref]
+                # application_tags is keyed on (application_id, tag_id)
+                if links.get(tag_id, {}).get("field", field) != field:
+                    problem = f"Tag '{ref}' is used on more than one field"
+                    break
+                links[tag_id] = {"application_id": app_id, "tag_id": tag_id, "field": TaggableField(field)}
+            if problem:
+                errors.append({"row": row_number, "error": problem})
+                continue
+            applications.append({
+                **data, "id": app_id, "user_id": user_id,
+                "created_at": now, "updated_at": now, "change_seq": version,
+            })
+            associations.extend(links.values())
+            imported_ids.append(str(app_id))
+
+        trashed = {app["id"] for app in applications if app["is_deleted"]}
+        if applications:
+            db.execute(insert(Application), applications)
+        if associations:
+            db.execute(insert(ApplicationTag), associations)
+            usage = usage_deltas()
+            for link in associations:
+                usage[(link["tag_id"], link["field"])][link["application_id"] in trashed] += 1
+            apply_usage_deltas(db, usage)
+        record_status_creations(db, user_id, [(app["id"], app["status"], now) for app in applications])
+        tags_by_app = {}
+        for link in associations:
+            tags_by_app.setdefault(link["application_id"], {})[link["tag_id"]] = link["field"]
+        record_activity(db, user_id, [
+            (app["id"], "created", {
+                **diff_fields({}, {field: app[field] for field in TRACKED_FIELDS if app.get(field) is not None}),
+                **({"is_deleted": [None, True]} if app["is_deleted"] else {}),
+                **({"tags": tag_changes({}, tags_by_app[app["id"]])} if app["id"] in tags_by_app else {}),
+            })
+            for app in applications
+        ])
+        active_ids = [str(app["id"]) for app in applications if app["id"] not in trashed]
+        if active_ids:
+            emit_event(db, user_id, "application.created", version=version, ids=active_ids)
+        if trashed:
+            # Straight into the trash: boards have nothing to add.
+            emit_event(db, user_id, "application.deleted", version=version, ids=[str(app_id) for app_id in trashed])
+        db.commit()
+        return len(imported_ids)
+    except SQLAlchemyError:
+        db.rollback()
+        errors.extend({"row": row_number, "error": "Could not save row"} for row_number, _, _ in valid)
+        return 0
+
+def import_applications(db: Session, user_id: UUID, file: IO[bytes], import_format: str, create_tags: bool) -> dict:
+    """
+    Import a CSV or NDJSON upload in batches of IMPORT_BATCH_SIZE rows.
+
+    Each batch resolves its tag references in one query, writes applications
+    and application_tags with multi-row inserts, and commits on its own, so a
+    failure only costs the batch it happened in.
+    """
+    errors: List[dict] = []
+    total = imported = batches = 0
+    batch: List[ParsedRow] = []
+
+    def flush():
+        nonlocal imported, batches
+        if batch:
+            imported += import_batch(db, user_id, batch, create_tags, errors)
+            batches += 1
+            batch.clear()
+
+    try:
+        for row in iter_rows(file, import_format):
+            total += 1
+            batch.append(row)
+            if len(batch) >= IMPORT_BATCH_SIZE:
+                flush()
+        flush()
+    except (UnicodeDecodeError, csv.Error) as e:
+        flush()
+        errors.append({"row": total + 1, "error": f"Could not parse file: {e}"})
+
+    errors.sort(key=lambda error: error["row"])
+    return {
+        "total": total,
+        "imported": imported,
+        "failed": total - imported,
+        "batches": batches,
+        "errors": errors[:IMPORT_MAX_ERRORS],
+        "errors_truncated": len(errors) > IMPORT_MAX_ERRORS,
+    }
+
+def import_upload(user_id: UUID, file: IO[bytes], import_format: str, create_tags: bool) -> dict:
+    """
+    import_applications on a sync session of its own. It parses, validates
+    and writes every row, so call it from the thread pool rather than on
+    the event loop.
+    """
+    db = SessionLocal()
+    try:
+        return import_applications(db, user_id, file, import_format, create_tags)
+    finally:
+        db.close()
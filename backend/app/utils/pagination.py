@@ -1,8 +1,74 @@
 from fastapi import Query
-from typing import Dict
+from sqlalchemy import desc, literal, tuple_
+from sqlalchemy.orm import Query as SAQuery
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+import base64
+import json
 
-def get_pagination_params(
+from app.utils.errors import bad_request
+
+async def get_pagination_params(
     limit: int = Query(50, gt=0, le=100),
-    offset: int = Query(0, ge=0)
-) -> Dict[str, int]:
-    return {"limit": limit, "offset": offset}
\ No newline at end of file
+    offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Opaque keyset cursor from a previous page's next_cursor; takes precedence over offset"),
+    include_total: bool = Query(True, description="Set to false to skip the exact total count")
+) -> Dict[str, object]:
+    return {"limit": limit, "offset": offset, "cursor": cursor, "include_total": include_total}
+
+def encode_cursor(sort_value: datetime, row_id: UUID) -> str:
+    raw = json.dumps([sort_value.isoformat(), str(row_id)]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(sort_value), UUID(row_id)
+    except (ValueError, TypeError):
+        bad_request("Invalid pagination cursor")
+
+def encode_value_cursor(value: str) -> str:
+    return base64.urlsafe_b64encode(json.dumps([value]).encode()).decode().rstrip("=")
+
+def decode_value_cursor(cursor: str) -> str:
+    """Decode a cursor over a single unique sort key (e.g. an email)."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        (value,) = json.loads(base64.urlsafe_b64decode(padded))
+        if not isinstance(value, str):
+            raise ValueError(cursor)
+        return value
+    except (ValueError, TypeError):
+        bad_request("Invalid pagination cursor")
+
+def paginate(query: SAQuery, sort_column, id_column, pagination: Dict[str, object]) -> Tuple[List, Optional[str]]:
+    """
+    Page through `query` newest-first on (sort_column, id_column).
+
+    With a cursor the page starts right after the encoded row (keyset
+    pagination); otherwise the classic offset is applied. Either way one
+    extra row is fetched to decide whether a next_cursor exists.
+    """
+    query = query.order_by(desc(sort_column), desc(id_column))
+
+    if pagination["cursor"]:
+        sort_value, row_id = decode_cursor(pagination["cursor"])
+        query = query.filter(
+            tuple_(sort_column, id_column)
+            < tuple_(literal(sort_value, sort_column.type), literal(row_id, id_column.type))
+        )
+    elif pagination["offset"]:
+        query = query.offset(pagination["offset"])
+
+    limit = pagination["limit"]
+    rows = query.limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(getattr(last, sort_column.key), getattr(last, id_column.key))
+
+    return rows, next_cursor
@@ -0,0 +1,124 @@
+import html
+import re
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import func, literal_column, select
+from sqlalchemy.orm import Session
+
+from app.models.application import Application, SEARCH_CONFIG
+
+SNIPPET_START = "<mark>"
+SNIPPET_STOP = "</mark>"
+HEADLINE_OPTIONS = f"StartSel={SNIPPET_START}, StopSel={SNIPPET_STOP}, MaxWords=25, MinWords=8, MaxFragments=2"
+
+# Fallback ranking weights, mirroring the tsvector weights A/A/B/C.
+FIELD_WEIGHTS = (("company", 1.0), ("position", 1.0), ("location", 0.4), ("notes", 0.2))
+FALLBACK_SCAN_LIMIT = 5000
+SNIPPET_RADIUS = 60
+
+SearchHit = Tuple[Application, float, Optional[str]]
+
+def search_applications(
+    db: Session,
+    user_id: UUID,
+    q: str,
+    limit: int,
+    offset: int,
+    include_total: bool
+) -> Tuple[List[SearchHit], Optional[int]]:
+    """
+    Ranked search over a user's active applications.
+
+    On Postgres this matches the generated `search_vector` column through its
+    GIN index and ranks with ts_rank_cd. Elsewhere (SQLite test databases) it
+    falls back to case-insensitive LIKE matching ranked in Python.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        return _search_postgres(db, user_id, q, limit, offset, include_total)
+    return _search_fallback(db, user_id, q, limit, offset, include_total)
+
+def _search_postgres(db, user_id, q, limit, offset, include_total):
+    query = func.websearch_to_tsquery(SEARCH_CONFIG, q)
+    search_vector = literal_column("applications.search_vector")
+    filters = [
+        Application.user_id == user_id,
+        Application.is_deleted == False,
+        search_vector.op("@@")(query),
+    ]
+
+    rank = func.ts_rank_cd(search_vector, query).label("rank")
+    # Rank and page first so ts_headline only runs for the rows returned.
+    page = (
+        select(Application.id.label("id"), rank)
+        .where(*filters)
+        .order_by(rank.desc(), Application.created_at.desc(), Application.id.desc())
+        .limit(limit)
+        .offset(offset)
+        .subquery()
+    )
+    document = func.concat_ws(" · ", Application.company, Application.position, Application.location, Application.notes)
+    # ts_headline returns the text as-is; escape it so only our markers are markup.
+    for raw, escaped in (("&", "&amp;"), ("<", "&lt;"), (">", "&gt;")):
+        document = func.replace(document, raw, escaped)
+    rows = db.execute(
+        select(Application, page.c.rank, func.ts_headline(SEARCH_CONFIG, document, query, HEADLINE_OPTIONS))
+        .join(page, page.c.id == Application.id)
+        .order_by(page.c.rank.desc(), Application.created_at.desc(), Application.id.desc())
+    ).all()
+
+    total = None
+    if include_total:
+        total = db.execute(select(func.count()).select_from(Application).where(*filters)).scalar()
+
+    return [(app, float(score), snippet) for app, score, snippet in rows], total
+
+def _terms(q: str) -> List[str]:
+    return [term for term in re.findall(r"\w+", q.lower()) if term]
+
+def _rank(app: Application, terms: List[str]) -> float:
+    score = 0.0
+    for field, weight in FIELD_WEIGHTS:
+        value = (getattr(app, field) or "").lower()
+        score += weight * sum(value.count(term) for term in terms)
+    return score
+
+def _snippet(app: Application, terms: List[str]) -> Optional[str]:
+    document = " · ".join(
+        value for value in (app.company, app.position, app.location, app.notes) if value
+    )
+    lowered = document.lower()
+    hits = [lowered.find(term) for term in terms if term in lowered]
+    if not hits:
+        return None
+
+    start = max(0, min(hits) - SNIPPET_RADIUS)
+    end = min(len(document), min(hits) + SNIPPET_RADIUS * 2)
+    window = html.escape(document[start:end])
+    pattern = re.compile("|".join(re.escape(html.escape(term)) for term in terms), re.IGNORECASE)
+    highlighted = pattern.sub(lambda m: f"{SNIPPET_START}{m.group(0)}{SNIPPET_STOP}", window)
+    return ("…" if start else "") + highlighted + ("…" if end < len(document) else "")
+
+def _search_fallback(db, user_id, q, limit, offset, include_total):
+    terms = _terms(q)
+    if not terms:
+        return [], 0 if include_total else None
+
+    query = db.query(Application).filter(
+        Application.user_id == user_id,
+        Application.is_deleted == False
+    )
+    haystack = func.lower(
+        func.coalesce(Application.company, "") + " " + func.coalesce(Application.position, "") + " "
+        + func.coalesce(Application.location, "") + " " + func.coalesce(Application.notes, "")
+    )
+    for term in terms:
+        query = query.filter(haystack.contains(term, autoescape=True))
+
+    matches = query.limit(FALLBACK_SCAN_LIMIT).all()
+    ranked = sorted(
+        ((app, _rank(app, terms)) for app in matches),
+        key=lambda hit: (-hit[1], -hit[0].created_at.timestamp(), str(hit[0].id)),
+    )
+    page = [(app, score, _snippet(app, terms)) for app, score in ranked[offset:offset + limit]]
+    return page, len(ranked) if include_total else None
@@ -0,0 +1,38 @@
+from functools import lru_cache
+from typing import Any, Optional
+
+from fastapi import Response
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+
+class FastJSONResponse(ORJSONResponse):
+    """
+    orjson-backed JSON response. Bodies that `render` already turned into
+    JSON bytes are passed through as-is.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return super().render(content)
+
+@lru_cache(maxsize=None)
+def type_adapter(schema) -> TypeAdapter:
+    return TypeAdapter(schema)
+
+def render(schema, payload: Any, response: Optional[Response] = None, status_code: int = 200) -> FastJSONResponse:
+    """
+    Validate `payload` (plain dicts and lists built straight from query rows)
+    against `schema` once, and emit it without going back through FastAPI's
+    response_model validation and jsonable_encoder.
+
+    Handlers keep their response_model for the OpenAPI schema; returning a
+    Response skips the second pass. Headers set on the injected `response`
+    (ETag, Cache-Control) are carried over.
+    """
+    adapter = type_adapter(schema)
+    body = adapter.dump_json(adapter.validate_python(payload))
+    headers = None
+    if response is not None:
+        headers = {key: value for key, value in response.headers.items() if key != "content-length"}
+    return FastJSONResponse(body, status_code=status_code, headers=headers)
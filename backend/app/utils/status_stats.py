@@ -0,0 +1,359 @@
+"""
+Funnel, time-in-status and volume analytics for GET /applications/stats.
+
+Every status change is recorded in status_transitions, and the same write
+adds its effect to the per-user daily rollups (status_daily_rollups and the
+status_dwell_rollups histogram), so reading stats only sums a handful of
+pre-aggregated rows. `backfill_status_stats` rebuilds the rollups from the
+transitions, first inferring a history for applications that predate them:
+
+    cd backend
+    python -m app.utils.status_stats            # every user
+    python -m app.utils.status_stats --user ID  # one account
+"""
+import argparse
+import uuid
+from bisect import bisect_right
+from collections import Counter, defaultdict
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import delete, exists, func, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.constants.status import ApplicationStatus
+from app.core.jobs import job_handler
+from app.models.application import Application
+from app.models.status_rollup import StatusDailyRollup, StatusDwellRollup
+from app.models.status_transition import StatusTransition
+from app.models.user import User
+from app.utils.upsert import upsert_increments
+
+STATUSES = tuple(status.value for status in ApplicationStatus)
+# Funnel stages in order; reaching a stage implies the ones before it.
+FUNNEL = ("wishlist", "applied", "interviewed", "offer")
+# (stage, stage its conversion rate is measured against)
+FUNNEL_STEPS = (
+    ("wishlist", None),
+    ("applied", "wishlist"),
+    ("interviewed", "applied"),
+    ("offer", "interviewed"),
+    ("declined", "interviewed"),
+)
+# Upper bounds, in hours, of the dwell-time histogram buckets. Anything
+# longer than the last bound lands in one open-ended bucket.
+DWELL_BUCKET_HOURS = (1, 6, 12, 24, 48, 72, 120, 168, 240, 336, 504, 720, 1080, 1440, 2160)
+
+DAILY_COUNTERS = ("created_count", "entered_count", "reached_count", "exited_count", "dwell_seconds")
+BACKFILL_BATCH_SIZE = 1000
+UNTOUCHED = timedelta(seconds=1)
+
+# (application id, status before, application created_at, status after)
+StatusMove = Tuple[UUID, str, datetime, str]
+
+def as_utc(value: datetime) -> datetime:
+    # SQLite hands timestamps back naive; they were written as UTC.
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+def dwell_bucket(seconds: float) -> int:
+    return bisect_right(DWELL_BUCKET_HOURS, seconds / 3600)
+
+def stages_reached(status: str) -> Tuple[str, ...]:
+    if status in FUNNEL:
+        return FUNNEL[:FUNNEL.index(status) + 1]
+    if status == "declined":
+        return ("wishlist", "declined")
+    return ()
+
+class ApplicationHistory:
+    """Where one application stands: its status, since when, stages reached."""
+
+    def __init__(self, status: Optional[str] = None, entered_at: Optional[datetime] = None):
+        self.status = status
+        self.entered_at = as_utc(entered_at) if entered_at else None
+        self.reached = set(stages_reached(status)) if status else set()
+
+    def move(self, to_status: str, at: datetime):
+        """Apply a transition; returns (previous status and entry time, stages newly reached)."""
+        at = as_utc(at)
+        previous = (self.status, self.entered_at) if self.status is not None else None
+        new = [stage for stage in stages_reached(to_status) if stage not in self.reached]
+        self.reached.update(new)
+        self.status, self.entered_at = to_status, at
+        return previous, new
+
+class StatusRollups:
+    """Rollup increments collected in memory, written with one upsert per table."""
+
+    def __init__(self):
+        self.daily: Dict[tuple, Counter] = defaultdict(Counter)
+        self.dwell: Dict[tuple, int] = defaultdict(int)
+
+    def record(self, user_id: UUID, to_status: str, at: datetime, previous=None, reached=()) -> None:
+        day = as_utc(at).date()
+        if previous is None:
+            self.daily[(user_id, day, to_status)]["created_count"] += 1
+        else:
+            from_status, entered_at = previous
+            seconds = max(0, int((as_utc(at) - entered_at).total_seconds()))
+            exited = self.daily[(user_id, day, from_status)]
+            exited["exited_count"] += 1
+            exited["dwell_seconds"] += seconds
+            self.dwell[(user_id, day, from_status, dwell_bucket(seconds))] += 1
+        self.daily[(user_id, day, to_status)]["entered_count"] += 1
+        for stage in reached:
+            self.daily[(user_id, day, stage)]["reached_count"] += 1
+
+    def write(self, db: Session) -> None:
+        daily = [
+            {"user_id": user_id, "day": day, "status": status, **{name: counts[name] for name in DAILY_COUNTERS}}
+            for (user_id, day, status), counts in self.daily.items()
+        ]
+        dwell = [
+            {"user_id": user_id, "day": day, "status": status, "bucket": bucket, "count": count}
+            for (user_id, day, status, bucket), count in self.dwell.items()
+        ]
+        for start in range(0, max(len(daily), len(dwell)), BACKFILL_BATCH_SIZE):
+            upsert_increments(
+                db, StatusDailyRollup, daily[start:start + BACKFILL_BATCH_SIZE],
+                keys=("user_id", "day", "status"), counters=DAILY_COUNTERS,
+            )
+            upsert_increments(
+                db, StatusDwellRollup, dwell[start:start + BACKFILL_BATCH_SIZE],
+                keys=("user_id", "day", "status", "bucket"), counters=("count",),
+            )
+
+def record_status_creations(db: Session, user_id: UUID, created: List[Tuple[UUID, str, datetime]]) -> None:
+    """Record the initial status of new applications: (id, status, created_at)."""
+    rollups, transitions = StatusRollups(), []
+    for app_id, status, created_at in created:
+        previous, reached = ApplicationHistory().move(status, created_at)
+        rollups.record(user_id, status, created_at, previous, reached)
+        transitions.append({
+            "id": uuid.uuid4(), "application_id": app_id, "user_id": user_id,
+            "from_status": None, "to_status": status, "changed_at": created_at,
+        })
+    if transitions:
+        db.execute(insert(StatusTransition), transitions)
+        rollups.write(db)
+
+def load_histories(db: Session, moves: List[StatusMove]) -> Dict[UUID, ApplicationHistory]:
+    """
+    Rebuild where each moving application stands from its transitions, in
+    one grouped query: the distinct statuses it has been in and when it last
+    entered each. Applications without recorded transitions start from
+    their current status and created_at.
+    """
+    histories = {app_id: ApplicationHistory(status, created_at) for app_id, status, created_at, _ in moves}
+    rows = db.execute(
+        select(StatusTransition.application_id, StatusTransition.to_status, func.max(StatusTransition.changed_at))
+        .where(StatusTransition.application_id.in_(list(histories)))
+        .group_by(StatusTransition.application_id, StatusTransition.to_status)
+    ).all()
+    latest: Dict[UUID, datetime] = {}
+    for app_id, status, changed_at in rows:
+        history = histories[app_id]
+        history.reached.update(stages_reached(status))
+        if app_id not in latest or as_utc(changed_at) > latest[app_id]:
+            latest[app_id] = as_utc(changed_at)
+            history.entered_at = latest[app_id]
+    return histories
+
+def record_status_changes(db: Session, user_id: UUID, moves: List[StatusMove], at: datetime) -> None:
+    """Record status changes of existing applications and fold them into the rollups."""
+    moves = [move for move in moves if move[1] != move[3]]
+    if not moves:
+        return
+    histories = load_histories(db, moves)
+    rollups, transitions = StatusRollups(), []
+    for app_id, from_status, _, to_status in moves:
+        previous, reached = histories[app_id].move(to_status, at)
+        rollups.record(user_id, to_status, at, previous, reached)
+        transitions.append({
+            "id": uuid.uuid4(), "application_id": app_id, "user_id": user_id,
+            "from_status": from_status, "to_status": to_status, "changed_at": at,
+        })
+    db.execute(insert(StatusTransition), transitions)
+    rollups.write(db)
+
+def median_hours(histogram: Dict[int, int]) -> Optional[float]:
+    """Median of a dwell histogram, interpolated linearly inside its bucket."""
+    total = sum(histogram.values())
+    if not total:
+        return None
+    target, seen = total / 2, 0
+    for bucket in range(len(DWELL_BUCKET_HOURS) + 1):
+        count = histogram.get(bucket, 0)
+        if count and seen + count >= target:
+            lower = DWELL_BUCKET_HOURS[bucket - 1] if bucket else 0
+            if bucket == len(DWELL_BUCKET_HOURS):
+                return float(lower)
+            upper = DWELL_BUCKET_HOURS[bucket]
+            return round(lower + (upper - lower) * (target - seen) / count, 1)
+        seen += count
+    return None
+
+def status_stats(db: Session, user_id: Optional[UUID], since: Optional[date], weeks: int, today: date) -> dict:
+    """
+    Funnel, time in status and weekly volume, from the rollups alone: three
+    grouped reads over at most a few rows per status and per day. With
+    `user_id=None` the numbers cover every user.
+    """
+    scope = []
+    if user_id is not None:
+        scope.append(StatusDailyRollup.user_id == user_id)
+    window = scope + ([StatusDailyRollup.day >= since] if since else [])
+
+    totals = {
+        row.status: row
+        for row in db.execute(
+            select(
+                StatusDailyRollup.status,
+                *(func.coalesce(func.sum(getattr(StatusDailyRollup, name)), 0).label(name) for name in DAILY_COUNTERS),
+            )
+            .where(*window)
+            .group_by(StatusDailyRollup.status)
+        )
+    }
+
+    dwell_window = [StatusDwellRollup.user_id == user_id] if user_id is not None else []
+    if since:
+        dwell_window.append(StatusDwellRollup.day >= since)
+    histograms: Dict[str, Dict[int, int]] = defaultdict(dict)
+    for status, bucket, count in db.execute(
+        select(StatusDwellRollup.status, StatusDwellRollup.bucket, func.sum(StatusDwellRollup.count))
+        .where(*dwell_window)
+        .group_by(StatusDwellRollup.status, StatusDwellRollup.bucket)
+    ):
+        histograms[status][bucket] = count
+
+    first_week = today - timedelta(days=today.weekday() + 7 * (weeks - 1))
+    volume = defaultdict(int)
+    for day, created in db.execute(
+        select(StatusDailyRollup.day, func.sum(StatusDailyRollup.created_count))
+        .where(*scope, StatusDailyRollup.day >= first_week)
+        .group_by(StatusDailyRollup.day)
+    ):
+        volume[day - timedelta(days=day.weekday())] += created
+
+    def reached(status):
+        return totals[status].reached_count if status in totals else 0
+
+    funnel = []
+    for stage, previous in FUNNEL_STEPS:
+        base = reached(previous) if previous else None
+        funnel.append({
+            "status": stage,
+            "from_status": previous,
+            "reached": reached(stage),
+            "conversion_rate": round(reached(stage) / base, 4) if base else None,
+        })
+
+    time_in_status = []
+    for status in STATUSES:
+        exits = totals[status].exited_count if status in totals else 0
+        time_in_status.append({
+            "status": status,
+            "exits": exits,
+            "median_hours": median_hours(histograms.get(status, {})),
+            "mean_hours": round(totals[status].dwell_seconds / exits / 3600, 1) if exits else None,
+        })
+
+    weekly_volume = [
+        {"week_start": week, "created": volume.get(week, 0)}
+        for week in (first_week + timedelta(weeks=i) for i in range(weeks))
+    ]
+    return {"since": since, "funnel": funnel, "time_in_status": time_in_status, "weekly_volume": weekly_volume}
+
+def synthesize_transitions(db: Session, user_id: Optional[UUID]) -> int:
+    """
+    Give applications with no recorded transitions a history inferred from
+    their timestamps: created as wishlist at created_at and moved to their
+    current status at updated_at, or created straight into their status
+    when it is still wishlist or the row was never updated (created_at and
+    updated_at are stamped separately on insert, so "never" means within
+    UNTOUCHED of each other).
+    """
+    query = select(
+        Application.id, Application.user_id, Application.status, Application.created_at, Application.updated_at
+    ).where(~exists().where(StatusTransition.application_id == Application.id))
+    if user_id is not None:
+        query = query.where(Application.user_id == user_id)
+
+    rows = []
+    for app_id, owner_id, status, created_at, updated_at in db.execute(query).all():
+        base = {"application_id": app_id, "user_id": owner_id}
+        if status == "wishlist" or as_utc(updated_at) - as_utc(created_at) < UNTOUCHED:
+            rows.append({**base, "id": uuid.uuid4(), "from_status": None, "to_status": status, "changed_at": created_at})
+        else:
+            rows.append({**base, "id": uuid.uuid4(), "from_status": None, "to_status": "wishlist", "changed_at": created_at})
+            rows.append({**base, "id": uuid.uuid4(), "from_status": "wishlist", "to_status": status, "changed_at": updated_at})
+    for start in range(0, len(rows), BACKFILL_BATCH_SIZE):
+        db.execute(insert(StatusTransition), rows[start:start + BACKFILL_BATCH_SIZE])
+    return len(rows)
+
+def backfill_status_stats(db: Session, user_id: Optional[UUID] = None) -> Tuple[int, int]:
+    """
+    Rebuild the rollups (for one user, or everyone) by replaying
+    status_transitions, after synthesizing transitions for applications
+    that have none. Returns (transitions synthesized, transitions replayed).
+    """
+    synthesized = synthesize_transitions(db, user_id)
+
+    # Rewritten rollups change what GET /applications/stats returns, so
+    # cached copies (ETag on data_version) must not validate any more.
+    stale = update(User).values(data_version=User.data_version + 1)
+    if user_id is not None:
+        stale = stale.where(User.id == user_id)
+    db.execute(stale.execution_options(synchronize_session=False))
+
+    for model in (StatusDailyRollup, StatusDwellRollup):
+        stmt = delete(model)
+        if user_id is not None:
+            stmt = stmt.where(model.user_id == user_id)
+        db.execute(stmt.execution_options(synchronize_session=False))
+
+    query = select(
+        StatusTransition.application_id, StatusTransition.user_id, StatusTransition.to_status, StatusTransition.changed_at
+    ).order_by(StatusTransition.application_id, StatusTransition.changed_at, StatusTransition.from_status.is_not(None))
+    if user_id is not None:
+        query = query.where(StatusTransition.user_id == user_id)
+
+    rollups, replayed = StatusRollups(), 0
+    history, current_app = None, None
+    for batch in db.execute(query.execution_options(yield_per=BACKFILL_BATCH_SIZE)).partitions():
+        for app_id, owner_id, to_status, changed_at in batch:
+            if app_id != current_app:
+                history, current_app = ApplicationHistory(), app_id
+            previous, reached = history.move(to_status, changed_at)
+            rollups.record(owner_id, to_status, changed_at, previous, reached)
+            replayed += 1
+    rollups.write(db)
+    return synthesized, replayed
+
+@job_handler("status_stats.backfill")
+def backfill_status_stats_job(db: Session, payload: dict) -> dict:
+    user_id = UUID(payload["user_id"]) if payload.get("user_id") else None
+    synthesized, replayed = backfill_status_stats(db, user_id)
+    return {"synthesized": synthesized, "replayed": replayed}
+
+def main():
+    from app.database import SessionLocal
+    from app.models.tag import Tag  # noqa: F401 - resolves the models' relationships
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--user", type=UUID, help="only rebuild this user's rollups")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        synthesized, replayed = backfill_status_stats(db, args.user)
+        db.commit()
+    finally:
+        db.close()
+    print(f"Rebuilt status rollups from {replayed} transitions ({synthesized} inferred from timestamps).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+import asyncio
+import base64
+import json
+import logging
+from datetime import timedelta
+from typing import Iterable
+from uuid import UUID
+
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.database import SessionLocal
+from app.models.application import utcnow
+from app.models.sync_tombstone import SyncTombstone
+from app.models.user import User
+from app.utils.errors import bad_request
+
+logger = logging.getLogger(__name__)
+
+# Delta sync model: every mutation bumps users.data_version (see
+# app/utils/etag.py) and stamps the rows it touched with the new value in
+# change_seq. A sync token is just the data_version a client has seen, so
+# "what changed" is `change_seq > token`, plus tombstones for rows that no
+# longer exist.
+
+def encode_sync_token(version: int) -> str:
+    raw = json.dumps({"v": version}).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_sync_token(token: str) -> int:
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        version = json.loads(base64.urlsafe_b64decode(padded))["v"]
+        if not isinstance(version, int) or version < 0:
+            raise ValueError(token)
+        return version
+    except (ValueError, TypeError, KeyError):
+        bad_request("Invalid sync token")
+
+def record_tombstones(db: Session, user_id: UUID, entity_type: str, entity_ids: Iterable[UUID], seq: int) -> None:
+    rows = [
+        {"user_id": user_id, "entity_type": entity_type, "entity_id": entity_id, "seq": seq, "deleted_at": utcnow()}
+        for entity_id in entity_ids
+    ]
+    if rows:
+        db.execute(insert(SyncTombstone), rows)
+
+def compact_tombstones(db: Session, retention_days: int) -> int:
+    """
+    Drop tombstones older than the retention window.
+
+    Each affected user's sync_floor is raised to the newest compacted seq, so
+    a client holding an older token is told to reload instead of silently
+    missing deletions.
+    """
+    cutoff = utcnow() - timedelta(days=retention_days)
+    expired = (
+        select(SyncTombstone.user_id, func.max(SyncTombstone.seq).label("seq"))
+        .where(SyncTombstone.deleted_at < cutoff)
+        .group_by(SyncTombstone.user_id)
+        .subquery()
+    )
+    db.execute(
+        update(User)
+        .where(User.id == expired.c.user_id, User.sync_floor < expired.c.seq)
+        .values(sync_floor=expired.c.seq)
+        .execution_options(synchronize_session=False)
+    )
+    removed = db.execute(
+        delete(SyncTombstone)
+        .where(SyncTombstone.deleted_at < cutoff)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    db.commit()
+    return removed
+
+def compact_tombstones_once() -> int:
+    db = SessionLocal()
+    try:
+        return compact_tombstones(db, settings.SYNC_TOMBSTONE_RETENTION_DAYS)
+    finally:
+        db.close()
+
+async def run_tombstone_compaction() -> None:
+    while True:
+        try:
+            removed = await asyncio.to_thread(compact_tombstones_once)
+            if removed:
+                logger.info(f"Compacted {removed} sync tombstones")
+        except Exception:
+            logger.exception("Sync tombstone compaction failed")
+        await asyncio.sleep(settings.SYNC_COMPACTION_INTERVAL_SECONDS)
+
+_compaction_task = None
+
+def start_tombstone_compaction() -> None:
+    global _compaction_task
+    if settings.SYNC_COMPACTION_INTERVAL_SECONDS > 0:
+        _compaction_task = asyncio.get_running_loop().create_task(run_tombstone_compaction())
+
+def stop_tombstone_compaction() -> None:
+    if _compaction_task:
+        _compaction_task.cancel()
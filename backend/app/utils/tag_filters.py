@@ -0,0 +1,59 @@
+from fastapi import Query
+from sqlalchemy import select, and_, or_, func, case
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+from app.constants.tag_fields import TaggableField
+from app.models.application import Application
+from app.models.application_tag import ApplicationTag
+from app.utils.errors import bad_request
+
+TagFilter = Tuple[UUID, Optional[TaggableField]]
+
+def parse_tag_filter(raw: str) -> TagFilter:
+    """Parse `<tag_id>` or `<field>:<tag_id>` (e.g. `company:3f1c...`)."""
+    field, _, tag_id = raw.rpartition(":")
+    try:
+        return UUID(tag_id), TaggableField(field) if field else None
+    except ValueError:
+        bad_request(f"Invalid tag filter '{raw}', expected '<tag_id>' or '<field>:<tag_id>'")
+
+async def get_tag_filters(
+    tags_any: List[str] = Query([], description="Match applications having ANY of these tags (OR). Each entry is a tag id or field:tag_id."),
+    tags_all: List[str] = Query([], description="Match applications having ALL of these tags (AND). Each entry is a tag id or field:tag_id.")
+) -> Dict[str, List[TagFilter]]:
+    return {
+        "any": list(dict.fromkeys(parse_tag_filter(raw) for raw in tags_any)),
+        "all": list(dict.fromkeys(parse_tag_filter(raw) for raw in tags_all)),
+    }
+
+def tag_condition(tag_filter: TagFilter):
+    tag_id, field = tag_filter
+    if field is None:
+        return ApplicationTag.tag_id == tag_id
+    return and_(ApplicationTag.tag_id == tag_id, ApplicationTag.field == field)
+
+def apply_tag_filters(query, tag_filters: Dict[str, List[TagFilter]]):
+    """
+    Narrow an Application query by tags with set-based SQL over
+    application_tags: a semi-join for OR, and a grouped HAVING that requires
+    every condition to match at least once for AND. Both probe the
+    (tag_id, field, application_id) index.
+    """
+    if tag_filters["any"]:
+        matching = select(ApplicationTag.application_id).where(
+            or_(*(tag_condition(f) for f in tag_filters["any"]))
+        )
+        query = query.filter(Application.id.in_(matching))
+
+    if tag_filters["all"]:
+        conditions = [tag_condition(f) for f in tag_filters["all"]]
+        matching = (
+            select(ApplicationTag.application_id)
+            .where(or_(*conditions))
+            .group_by(ApplicationTag.application_id)
+            .having(and_(*(func.max(case((condition, 1), else_=0)) == 1 for condition in conditions)))
+        )
+        query = query.filter(Application.id.in_(matching))
+
+    return query
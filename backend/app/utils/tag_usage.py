@@ -0,0 +1,123 @@
+"""
+Per-tag usage counts (active / soft-deleted applications, per field).
+
+Writes keep tag_usage_counts current as they go; `repair_tag_usage`
+recomputes it from application_tags for when the two have drifted:
+
+    cd backend
+    python -m app.utils.tag_usage            # every user
+    python -m app.utils.tag_usage --user ID  # one account
+"""
+import argparse
+from collections import defaultdict
+from typing import Dict, Iterable, Optional, Tuple, Union
+from uuid import UUID
+
+from sqlalchemy import Select, delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from app.constants.tag_fields import TaggableField
+from app.core.jobs import job_handler
+from app.models.application import Application
+from app.models.application_tag import ApplicationTag
+from app.models.tag import Tag
+from app.models.tag_usage import TagUsage
+from app.utils.upsert import upsert_increments
+
+# (tag_id, field) -> [active delta, deleted delta]
+UsageDeltas = Dict[Tuple[UUID, TaggableField], list]
+
+def usage_deltas() -> UsageDeltas:
+    return defaultdict(lambda: [0, 0])
+
+def apply_usage_deltas(db: Session, deltas: UsageDeltas) -> None:
+    """Add the deltas to tag_usage_counts in one upsert."""
+    rows = [
+        {"tag_id": tag_id, "field": TaggableField(field), "active_count": active, "deleted_count": deleted}
+        for (tag_id, field), (active, deleted) in deltas.items()
+        if active or deleted
+    ]
+    upsert_increments(db, TagUsage, rows, keys=("tag_id", "field"), counters=("active_count", "deleted_count"))
+
+def shift_tag_usage(db: Session, app_ids: Union[Iterable[UUID], Select], active: int, deleted: int) -> None:
+    """
+    Move the tags of `app_ids` (ids or a select of them) between the active
+    and deleted columns: (-1, +1) for a soft delete, (+1, -1) for a restore,
+    (0, -1) for a purge. Must run while the application_tags rows still exist.
+    """
+    if not isinstance(app_ids, Select):
+        app_ids = list(app_ids)
+    counts = db.execute(
+        select(ApplicationTag.tag_id, ApplicationTag.field, func.count())
+        .where(ApplicationTag.application_id.in_(app_ids))
+        .group_by(ApplicationTag.tag_id, ApplicationTag.field)
+    )
+    deltas = usage_deltas()
+    for tag_id, field, count in counts:
+        deltas[(tag_id, field)] = [active * count, deleted * count]
+    apply_usage_deltas(db, deltas)
+
+def repair_tag_usage(db: Session, user_id: Optional[UUID] = None) -> int:
+    """
+    Recompute tag_usage_counts from application_tags (for one user, or
+    everyone) and return how many (tag, field) counts were wrong.
+    """
+    tags = select(Tag.id)
+    if user_id is not None:
+        tags = tags.where(Tag.user_id == user_id)
+
+    stored = {
+        (row.tag_id, row.field): (row.active_count, row.deleted_count)
+        for row in db.execute(
+            select(TagUsage.tag_id, TagUsage.field, TagUsage.active_count, TagUsage.deleted_count)
+            .where(TagUsage.tag_id.in_(tags), (TagUsage.active_count != 0) | (TagUsage.deleted_count != 0))
+        )
+    }
+    expected = {
+        (tag_id, field): (active, deleted)
+        for tag_id, field, active, deleted in db.execute(
+            select(
+                ApplicationTag.tag_id,
+                ApplicationTag.field,
+                func.count().filter(Application.is_deleted == False),
+                func.count().filter(Application.is_deleted == True),
+            )
+            .join(Application, Application.id == ApplicationTag.application_id)
+            .where(ApplicationTag.tag_id.in_(tags))
+            .group_by(ApplicationTag.tag_id, ApplicationTag.field)
+        )
+    }
+    drifted = sum(1 for key in stored.keys() | expected.keys() if stored.get(key) != expected.get(key))
+
+    db.execute(delete(TagUsage).where(TagUsage.tag_id.in_(tags)).execution_options(synchronize_session=False))
+    if expected:
+        db.execute(insert(TagUsage), [
+            {"tag_id": tag_id, "field": field, "active_count": active, "deleted_count": deleted}
+            for (tag_id, field), (active, deleted) in expected.items()
+        ])
+    return drifted
+
+@job_handler("tag_usage.repair")
+def repair_tag_usage_job(db: Session, payload: dict) -> dict:
+    user_id = UUID(payload["user_id"]) if payload.get("user_id") else None
+    return {"drifted": repair_tag_usage(db, user_id)}
+
+def main():
+    from app.database import SessionLocal
+    from app.models.user import User  # noqa: F401 - resolves the models' relationships
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--user", type=UUID, help="only repair this user's tags")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        drifted = repair_tag_usage(db, args.user)
+        db.commit()
+    finally:
+        db.close()
+    print(f"Recomputed tag usage counts; {drifted} were out of date.")
+
+
+if __name__ == "__main__":
+    main()
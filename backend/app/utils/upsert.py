@@ -0,0 +1,22 @@
+from typing import Iterable, List
+
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+
+def upsert_increments(db: Session, model, rows: List[dict], keys: Iterable[str], counters: Iterable[str]) -> None:
+    """
+    Insert `rows` into a counter table, adding the `counters` columns onto
+    any row that already exists for the same `keys`, in one statement.
+
+    The increments happen in SQL, so concurrent writers bumping the same row
+    do not lose updates. Both Postgres and SQLite support ON CONFLICT.
+    """
+    if not rows:
+        return
+    dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+    stmt = dialect.insert(model).values(rows)
+    db.execute(stmt.on_conflict_do_update(
+        index_elements=[getattr(model, key) for key in keys],
+        set_={name: getattr(model, name) + getattr(stmt.excluded, name) for name in counters},
+    ))
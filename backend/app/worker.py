@@ -0,0 +1,61 @@
+"""
+Job worker process, for running background jobs outside the web dynos:
+
+    cd backend
+    python -m app.worker                  # one worker thread
+    python -m app.worker --concurrency 4
+
+Set JOB_WORKERS_IN_PROCESS=0 on the web process when this runs. SIGTERM
+(a Heroku dyno restart) lets running jobs finish before exiting.
+"""
+import argparse
+import logging
+import signal
+import threading
+
+from app.core.config import settings
+from app.core.jobs import TIDY_INTERVAL, tidy_jobs, work_once, worker_name
+from app.models.application import utcnow
+# Modules whose @job_handler registrations the queue may refer to
+from app.utils import account_deletion, status_stats, tag_usage  # noqa: F401
+
+logger = logging.getLogger(__name__)
+
+def work(worker: str, stopping: threading.Event) -> None:
+    logger.info(f"Job worker {worker} started")
+    last_tidy = None
+    while not stopping.is_set():
+        try:
+            if work_once(worker):
+                continue
+            if last_tidy is None or utcnow() - last_tidy >= TIDY_INTERVAL:
+                tidy_jobs()
+                last_tidy = utcnow()
+        except Exception:
+            logger.exception(f"Job worker {worker} hit an error")
+        stopping.wait(settings.JOB_POLL_INTERVAL_SECONDS)
+    logger.info(f"Job worker {worker} stopped")
+
+def main():
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s - %(message)s")
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=1, help="worker threads in this process")
+    args = parser.parse_args()
+
+    stopping = threading.Event()
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        signal.signal(signum, lambda *_: stopping.set())
+
+    threads = [
+        threading.Thread(target=work, args=(worker_name(), stopping), daemon=True)
+        for _ in range(max(args.concurrency, 1))
+    ]
+    for thread in threads:
+        thread.start()
+    while any(thread.is_alive() for thread in threads):
+        for thread in threads:
+            thread.join(timeout=1)
+
+
+if __name__ == "__main__":
+    main()
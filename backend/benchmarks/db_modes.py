@@ -0,0 +1,126 @@
+"""
+Compare concurrent throughput of the sync and async database modes.
+
+Starts the API once per DB_MODE under uvicorn, signs up a throwaway user,
+seeds a board, then hammers GET /applications/ with a fixed number of
+concurrent clients and reports requests/second and latency percentiles.
+
+    cd backend
+    DATABASE_URL=postgresql://... python benchmarks/db_modes.py --concurrency 64 --duration 15
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+from uuid import uuid4
+
+import httpx
+
+
+def start_server(mode: str, port: int, workers: int) -> subprocess.Popen:
+    env = dict(os.environ, DB_MODE=mode)
+    return subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "app.main:app",
+            "--port", str(port), "--workers", str(workers), "--log-level", "warning",
+        ],
+        env=env,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    )
+
+
+async def wait_until_up(base_url: str, timeout: float = 30.0):
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        while time.monotonic() < deadline:
+            try:
+                await client.get("/")
+                return
+            except httpx.TransportError:
+                await asyncio.sleep(0.2)
+    raise RuntimeError(f"server at {base_url} did not start")
+
+
+async def seed(base_url: str, apps: int) -> str:
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        res = await client.post("/auth/signup", json={"email": f"bench-{uuid4()}@example.com", "password": "benchpass123"})
+        res.raise_for_status()
+        token = res.cookies["access_token"]
+        client.cookies.set("access_token", token)
+        for i in range(apps):
+            await client.post("/applications/", json={"company": f"Bench{i}", "position": "Dev", "status": "applied"})
+        return token
+
+
+async def hammer(base_url: str, token: str, concurrency: int, duration: float):
+    latencies = []
+    errors = 0
+    deadline = time.monotonic() + duration
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, cookies={"access_token": token}, limits=limits, timeout=30) as client:
+        async def worker():
+            nonlocal errors
+            while time.monotonic() < deadline:
+                started = time.perf_counter()
+                try:
+                    res = await client.get("/applications/", params={"limit": 50})
+                    if res.status_code != 200:
+                        errors += 1
+                except httpx.HTTPError:
+                    errors += 1
+                latencies.append(time.perf_counter() - started)
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+    return latencies, errors
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+async def run_mode(mode: str, args) -> dict:
+    port = args.port + (0 if mode == "sync" else 1)
+    base_url = f"http://127.0.0.1:{port}"
+    server = start_server(mode, port, args.workers)
+    try:
+        await wait_until_up(base_url)
+        token = await seed(base_url, args.apps)
+        latencies, errors = await hammer(base_url, token, args.concurrency, args.duration)
+    finally:
+        server.terminate()
+        server.wait()
+
+    return {
+        "mode": mode,
+        "requests": len(latencies),
+        "rps": len(latencies) / args.duration,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": percentile(latencies, 0.95) * 1000,
+        "errors": errors,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--apps", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--port", type=int, default=8700)
+    args = parser.parse_args()
+
+    results = [asyncio.run(run_mode(mode, args)) for mode in ("sync", "async")]
+
+    print(f"{'mode':<6} {'requests':>9} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'errors':>7}")
+    for r in results:
+        print(f"{r['mode']:<6} {r['requests']:>9} {r['rps']:>9.1f} {r['p50_ms']:>9.1f} {r['p95_ms']:>9.1f} {r['errors']:>7}")
+
+
+if __name__ == "__main__":
+    main()
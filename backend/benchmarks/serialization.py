@@ -0,0 +1,90 @@
+"""
+Compare the render() fast path with the old response path (pydantic models
+built field by field, then jsonable_encoder and the stdlib encoder) for
+pages of 10, 100 and 1000 applications. tests/test_serialization.py uses
+the same helpers to check that both produce the same JSON; this only times
+them.
+
+    cd backend
+    python benchmarks/serialization.py --repeat 20
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime, timezone
+from uuid import uuid4
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+
+from app.schemas.application import ApplicationOut, ApplicationPage  # noqa: E402
+from app.schemas.tag import TagOut  # noqa: E402
+from app.utils.serialization import render  # noqa: E402
+
+
+def make_rows(count):
+    now = datetime.now(timezone.utc)
+    tag = {"id": uuid4(), "name": "Remote"}
+    return [
+        {
+            "id": uuid4(),
+            "company": f"Company {i}",
+            "position": "Backend Engineer",
+            "status": "applied",
+            "location": "Berlin",
+            "url": f"https://jobs.example.com/{i}",
+            "notes": "Referred by a former colleague. " * 4,
+            "created_at": now,
+            "updated_at": now,
+            "tags": {"company": [tag], "location": [tag]},
+        }
+        for i in range(count)
+    ]
+
+
+def legacy_render(rows):
+    # What the handlers did before: build models field by field, then let
+    # FastAPI run jsonable_encoder and the stdlib encoder over the result.
+    applications = [
+        ApplicationOut(
+            **{key: value for key, value in row.items() if key != "tags"},
+            tags={field: [TagOut(**tag) for tag in tags] for field, tags in row["tags"].items()}
+        )
+        for row in rows
+    ]
+    content = jsonable_encoder({"total": len(rows), "applications": applications, "next_cursor": None})
+    return json.dumps(content).encode()
+
+
+def fast_render(rows):
+    return render(ApplicationPage, {"total": len(rows), "applications": rows, "next_cursor": None}).body
+
+
+def best_of(fn, rows, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(rows)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="runs per size; the best is reported")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    args = parser.parse_args()
+
+    print(f"{'apps':>6} {'legacy ms':>10} {'fast ms':>10} {'speedup':>8}")
+    for count in args.sizes:
+        rows = make_rows(count)
+        legacy = best_of(legacy_render, rows, args.repeat)
+        fast = best_of(fast_render, rows, args.repeat)
+        print(f"{count:>6} {legacy * 1000:>10.2f} {fast * 1000:>10.2f} {legacy / fast:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""initial schema
+
+Databases bootstrapped by the old Base.metadata.create_all() call already
+have these tables, so each one is only created when it is missing.
+
+Revision ID: 0001_initial_schema
+Revises:
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0001_initial_schema"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def _missing(table_name):
+    return not sa.inspect(op.get_bind()).has_table(table_name)
+
+
+def upgrade():
+    if _missing("users"):
+        op.create_table(
+            "users",
+            sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+            sa.Column("email", sa.String(), nullable=False, unique=True),
+            sa.Column("hashed_password", sa.String(), nullable=False),
+            sa.Column("created_at", sa.DateTime(), nullable=True),
+            sa.Column("is_admin", sa.String(), nullable=False),
+            sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        )
+
+    if _missing("applications"):
+        op.create_table(
+            "applications",
+            sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+            sa.Column("user_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id"), nullable=False),
+            sa.Column("company", sa.String(), nullable=False),
+            sa.Column("position", sa.String(), nullable=False),
+            sa.Column("status", sa.String(), nullable=False),
+            sa.Column("location", sa.String(), nullable=True),
+            sa.Column("url", sa.String(), nullable=True),
+            sa.Column("notes", sa.Text(), nullable=True),
+            sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("is_deleted", sa.Boolean(), nullable=False),
+        )
+
+    if _missing("tags"):
+        op.create_table(
+            "tags",
+            sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+            sa.Column("user_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id"), nullable=False),
+            sa.Column("name", sa.String(), nullable=False),
+            sa.Column("created_at", sa.DateTime(), nullable=True),
+            sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        )
+
+    if _missing("application_tags"):
+        op.create_table(
+            "application_tags",
+            sa.Column("application_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("applications.id"), primary_key=True),
+            sa.Column("tag_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("tags.id"), primary_key=True),
+            sa.Column(
+                "field",
+                sa.Enum("COMPANY", "LOCATION", "POSITION", "STATUS", name="tag_field_enum"),
+                nullable=False,
+            ),
+            sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+            sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        )
+
+
+def downgrade():
+    op.drop_table("application_tags")
+    op.drop_table("tags")
+    op.drop_table("applications")
+    op.drop_table("users")
+    sa.Enum(name="tag_field_enum").drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,53 @@
+"""indexes for the per-user board, trash and tag lookups
+
+Revision ID: 0002_hot_path_indexes
+Revises: 0001_initial_schema
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002_hot_path_indexes"
+down_revision = "0001_initial_schema"
+branch_labels = None
+depends_on = None
+
+ACTIVE_ROWS = sa.text("is_deleted = false")
+DELETED_ROWS = sa.text("is_deleted = true")
+
+
+def upgrade():
+    op.create_index(
+        "ix_applications_user_active_created",
+        "applications",
+        ["user_id", "created_at", "id"],
+        postgresql_where=ACTIVE_ROWS,
+        sqlite_where=ACTIVE_ROWS,
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_applications_user_active_status_created",
+        "applications",
+        ["user_id", "status", "created_at", "id"],
+        postgresql_where=ACTIVE_ROWS,
+        sqlite_where=ACTIVE_ROWS,
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_applications_user_deleted_updated",
+        "applications",
+        ["user_id", "updated_at", "id"],
+        postgresql_where=DELETED_ROWS,
+        sqlite_where=DELETED_ROWS,
+        if_not_exists=True,
+    )
+    op.create_index("ix_tags_user_id", "tags", ["user_id"], if_not_exists=True)
+    op.create_index("ix_application_tags_tag_id", "application_tags", ["tag_id"], if_not_exists=True)
+
+
+def downgrade():
+    op.drop_index("ix_application_tags_tag_id", table_name="application_tags")
+    op.drop_index("ix_tags_user_id", table_name="tags")
+    op.drop_index("ix_applications_user_deleted_updated", table_name="applications")
+    op.drop_index("ix_applications_user_active_status_created", table_name="applications")
+    op.drop_index("ix_applications_user_active_created", table_name="applications")
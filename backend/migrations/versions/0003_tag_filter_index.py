@@ -0,0 +1,28 @@
+"""widen the application_tags tag-side index for server-side tag filters
+
+Revision ID: 0003_tag_filter_index
+Revises: 0002_hot_path_indexes
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0003_tag_filter_index"
+down_revision = "0002_hot_path_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_application_tags_tag_field_app",
+        "application_tags",
+        ["tag_id", "field", "application_id"],
+        if_not_exists=True,
+    )
+    op.drop_index("ix_application_tags_tag_id", table_name="application_tags", if_exists=True)
+
+
+def downgrade():
+    op.create_index("ix_application_tags_tag_id", "application_tags", ["tag_id"], if_not_exists=True)
+    op.drop_index("ix_application_tags_tag_field_app", table_name="application_tags")
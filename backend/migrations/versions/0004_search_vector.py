@@ -0,0 +1,42 @@
+"""generated tsvector column and GIN index for application search
+
+Postgres only; SQLite databases use the LIKE-based fallback search.
+
+Revision ID: 0004_search_vector
+Revises: 0003_tag_filter_index
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0004_search_vector"
+down_revision = "0003_tag_filter_index"
+branch_labels = None
+depends_on = None
+
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english', coalesce(company, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(position, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(location, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(notes, '')), 'C')"
+)
+
+
+def upgrade():
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute(
+        "ALTER TABLE applications ADD COLUMN IF NOT EXISTS search_vector tsvector "
+        f"GENERATED ALWAYS AS ({SEARCH_VECTOR_SQL}) STORED"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_applications_search_vector "
+        "ON applications USING GIN (search_vector)"
+    )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("DROP INDEX IF EXISTS ix_applications_search_vector")
+    op.execute("ALTER TABLE applications DROP COLUMN IF EXISTS search_vector")
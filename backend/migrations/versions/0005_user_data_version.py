@@ -0,0 +1,21 @@
+"""per-user data_version counter for conditional GETs
+
+Revision ID: 0005_user_data_version
+Revises: 0004_search_vector
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0005_user_data_version"
+down_revision = "0004_search_vector"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column("users", sa.Column("data_version", sa.Integer(), server_default="0", nullable=False))
+
+
+def downgrade():
+    op.drop_column("users", "data_version")
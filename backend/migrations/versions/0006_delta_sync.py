@@ -0,0 +1,43 @@
+"""change_seq stamps and tombstones for delta sync
+
+Revision ID: 0006_delta_sync
+Revises: 0005_user_data_version
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0006_delta_sync"
+down_revision = "0005_user_data_version"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column("users", sa.Column("sync_floor", sa.Integer(), server_default="0", nullable=False))
+    op.add_column("applications", sa.Column("change_seq", sa.Integer(), server_default="0", nullable=False))
+    op.add_column("tags", sa.Column("change_seq", sa.Integer(), server_default="0", nullable=False))
+    op.create_index(
+        "ix_applications_user_change_seq", "applications", ["user_id", "change_seq"], if_not_exists=True
+    )
+    op.create_table(
+        "sync_tombstones",
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("entity_type", sa.String(), primary_key=True),
+        sa.Column("entity_id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("seq", sa.Integer(), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index("ix_sync_tombstones_user_seq", "sync_tombstones", ["user_id", "seq"])
+    op.create_index("ix_sync_tombstones_deleted_at", "sync_tombstones", ["deleted_at"])
+
+
+def downgrade():
+    op.drop_index("ix_sync_tombstones_deleted_at", table_name="sync_tombstones")
+    op.drop_index("ix_sync_tombstones_user_seq", table_name="sync_tombstones")
+    op.drop_table("sync_tombstones")
+    op.drop_index("ix_applications_user_change_seq", table_name="applications")
+    op.drop_column("tags", "change_seq")
+    op.drop_column("applications", "change_seq")
+    op.drop_column("users", "sync_floor")
@@ -0,0 +1,45 @@
+"""per-tag usage counts
+
+Revision ID: 0007_tag_usage_counts
+Revises: 0006_delta_sync
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0007_tag_usage_counts"
+down_revision = "0006_delta_sync"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "tag_usage_counts",
+        sa.Column("tag_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("tags.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column(
+            "field",
+            postgresql.ENUM("COMPANY", "LOCATION", "POSITION", "STATUS", name="tag_field_enum", create_type=False),
+            primary_key=True,
+        ),
+        sa.Column("active_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("deleted_count", sa.Integer(), server_default="0", nullable=False),
+    )
+    # Seed from the existing associations; from here on the counts are
+    # maintained by the writes themselves.
+    op.execute(
+        """
+        INSERT INTO tag_usage_counts (tag_id, field, active_count, deleted_count)
+        SELECT at.tag_id, at.field,
+               count(*) FILTER (WHERE NOT a.is_deleted),
+               count(*) FILTER (WHERE a.is_deleted)
+        FROM application_tags at
+        JOIN applications a ON a.id = at.application_id
+        GROUP BY at.tag_id, at.field
+        """
+    )
+
+
+def downgrade():
+    op.drop_table("tag_usage_counts")
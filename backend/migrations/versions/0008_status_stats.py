@@ -0,0 +1,58 @@
+"""status transitions and daily stats rollups
+
+Revision ID: 0008_status_stats
+Revises: 0007_tag_usage_counts
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0008_status_stats"
+down_revision = "0007_tag_usage_counts"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "status_transitions",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("application_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("from_status", sa.String(), nullable=True),
+        sa.Column("to_status", sa.String(), nullable=False),
+        sa.Column("changed_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index("ix_status_transitions_app_changed", "status_transitions", ["application_id", "changed_at"])
+    op.create_index("ix_status_transitions_user_changed", "status_transitions", ["user_id", "changed_at"])
+
+    op.create_table(
+        "status_daily_rollups",
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("day", sa.Date(), primary_key=True),
+        sa.Column("status", sa.String(), primary_key=True),
+        sa.Column("created_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("entered_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("reached_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("exited_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("dwell_seconds", sa.BigInteger(), server_default="0", nullable=False),
+    )
+    op.create_table(
+        "status_dwell_rollups",
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("day", sa.Date(), primary_key=True),
+        sa.Column("status", sa.String(), primary_key=True),
+        sa.Column("bucket", sa.Integer(), primary_key=True),
+        sa.Column("count", sa.Integer(), server_default="0", nullable=False),
+    )
+    # Existing applications have no transitions yet; build them and the
+    # rollups with `python -m app.utils.status_stats` after upgrading.
+
+
+def downgrade():
+    op.drop_table("status_dwell_rollups")
+    op.drop_table("status_daily_rollups")
+    op.drop_index("ix_status_transitions_user_changed", table_name="status_transitions")
+    op.drop_index("ix_status_transitions_app_changed", table_name="status_transitions")
+    op.drop_table("status_transitions")
@@ -0,0 +1,39 @@
+"""append-only application history, partitioned by month
+
+Revision ID: 0009_application_activity
+Revises: 0008_status_stats
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0009_application_activity"
+down_revision = "0008_status_stats"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "application_activity",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("application_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("action", sa.String(), nullable=False),
+        sa.Column("changes", postgresql.JSONB(), nullable=False),
+        sa.PrimaryKeyConstraint("id", "created_at"),
+        postgresql_partition_by="RANGE (created_at)",
+    )
+    op.create_index(
+        "ix_application_activity_app_created", "application_activity", ["application_id", "created_at"]
+    )
+    op.create_index("ix_application_activity_user", "application_activity", ["user_id"])
+    # Monthly partitions are created ahead of time by the app's maintenance
+    # task (app/utils/activity.py); the default one catches the rest.
+    op.execute("CREATE TABLE application_activity_default PARTITION OF application_activity DEFAULT")
+
+
+def downgrade():
+    op.drop_table("application_activity")
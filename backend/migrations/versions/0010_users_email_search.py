@@ -0,0 +1,20 @@
+"""index for case-insensitive email prefix search
+
+Revision ID: 0010_users_email_search
+Revises: 0009_application_activity
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+revision = "0010_users_email_search"
+down_revision = "0009_application_activity"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("CREATE INDEX IF NOT EXISTS ix_users_email_lower ON users (lower(email) text_pattern_ops)")
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS ix_users_email_lower")
@@ -0,0 +1,53 @@
+"""ON DELETE CASCADE for user, application and tag children; deletion flag on users
+
+Revision ID: 0011_cascade_deletes
+Revises: 0010_users_email_search
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0011_cascade_deletes"
+down_revision = "0010_users_email_search"
+branch_labels = None
+depends_on = None
+
+# (table, column, referenced table); constraint names are Postgres' defaults.
+FOREIGN_KEYS = (
+    ("applications", "user_id", "users"),
+    ("tags", "user_id", "users"),
+    ("application_tags", "application_id", "applications"),
+    ("application_tags", "tag_id", "tags"),
+)
+
+
+def replace_foreign_keys(on_delete):
+    for table, column, referenced in FOREIGN_KEYS:
+        name = f"{table}_{column}_fkey"
+        op.execute(f"ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {name}")
+        # NOT VALID skips the full-table check while the ALTER holds its lock.
+        op.execute(
+            f"ALTER TABLE {table} ADD CONSTRAINT {name} FOREIGN KEY ({column}) "
+            f"REFERENCES {referenced} (id) {on_delete} NOT VALID"
+        )
+
+
+def validate_foreign_keys():
+    # The migration transaction would hold the ALTERs' locks through the
+    # scans; committing first lets VALIDATE run under a lock that lets reads
+    # and writes through.
+    with op.get_context().autocommit_block():
+        for table, column, _ in FOREIGN_KEYS:
+            op.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT {table}_{column}_fkey")
+
+
+def upgrade():
+    op.add_column("users", sa.Column("deletion_started_at", sa.DateTime(timezone=True), nullable=True))
+    replace_foreign_keys("ON DELETE CASCADE")
+    validate_foreign_keys()
+
+
+def downgrade():
+    replace_foreign_keys("")
+    validate_foreign_keys()
+    op.drop_column("users", "deletion_started_at")
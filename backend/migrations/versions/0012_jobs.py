@@ -0,0 +1,43 @@
+"""database-backed background job queue
+
+Revision ID: 0012_jobs
+Revises: 0011_cascade_deletes
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0012_jobs"
+down_revision = "0011_cascade_deletes"
+branch_labels = None
+depends_on = None
+
+QUEUED_JOBS = sa.text("status = 'queued'")
+
+
+def upgrade():
+    op.create_table(
+        "jobs",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("kind", sa.String(), nullable=False),
+        sa.Column("payload", postgresql.JSONB(), nullable=False),
+        sa.Column("status", sa.String(), nullable=False),
+        sa.Column("attempts", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("max_attempts", sa.Integer(), nullable=False),
+        sa.Column("run_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("locked_by", sa.String(), nullable=True),
+        sa.Column("locked_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("result", postgresql.JSONB(), nullable=True),
+        sa.Column("created_by", postgresql.UUID(as_uuid=True), nullable=True),
+    )
+    op.create_index("ix_jobs_queued_run_at", "jobs", ["run_at"], postgresql_where=QUEUED_JOBS)
+    op.create_index("ix_jobs_status_created", "jobs", ["status", "created_at"])
+
+
+def downgrade():
+    op.drop_table("jobs")
@@ -1,9 +1,18 @@
+import os
+# Tests drive the job queue themselves (app.core.jobs.work_once).
+os.environ.setdefault("JOB_WORKERS_IN_PROCESS", "0")
+
 import pytest
+from contextlib import contextmanager
 from fastapi.testclient import TestClient
+from sqlalchemy import event
 from app.main import app
 from app.models.user import User
 from app.core.security import hash_password
-from app.database import SessionLocal
+from app.database import SessionLocal, engine, async_engine, Base
+
+# The app no longer runs create_all on import; migrations own the real schema.
+Base.metadata.create_all(bind=engine)
 
 FAKE_USER_ID = "123e4567-e89b-12d3-a456-426614174000"
 
@@ -26,3 +35,24 @@ def setup_fake_user():
         db.add(fake_user)
         db.commit()
     db.close()
+
+@pytest.fixture
+def count_queries():
+    """Context manager that records every SQL statement sent to the engine."""
+    @contextmanager
+    def _count():
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engines = [engine] + ([async_engine.sync_engine] if async_engine is not None else [])
+        for target in engines:
+            event.listen(target, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            for target in engines:
+                event.remove(target, "before_cursor_execute", before_cursor_execute)
+
+    return _count
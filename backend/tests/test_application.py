@@ -134,6 +134,459 @@ def test_permanent_delete_application_ecp(client):
     non_exist_perm = client.delete(f"/applications/{uuid4()}/permanent")
     assert non_exist_perm.status_code == 404
 
+# ---------- GET /applications/{id}/history ---------- (ECP)
+def test_application_history_ecp(client):
+    tag_id = client.post("/tags/", json={"name": "HistoryTag"}).json()["id"]
+    res = client.post("/applications/", json={
+        "company": "HistoryCo", "position": "QA", "status": "wishlist",
+        "tags": [{"tag_id": tag_id, "field": "position"}],
+    })
+    app_id = res.json()["id"]
+    client.patch(f"/applications/{app_id}", json={"status": "applied", "notes": "Sent CV", "company": "HistoryCo"})
+    client.patch(f"/applications/{app_id}", json={"tags": [{"tag_id": tag_id, "field": "location"}]})
+    client.delete(f"/applications/{app_id}")
+    client.patch(f"/applications/{app_id}/restore")
+
+    res = client.get(f"/applications/{app_id}/history")
+    assert res.status_code == 200
+    body = res.json()
+    assert body["total"] == 5
+    history = body["history"]
+    assert [entry["action"] for entry in history] == ["restored", "deleted", "updated", "updated", "created"]
+    # Only what changed is stored
+    assert history[3]["changes"] == {"status": ["wishlist", "applied"], "notes": [None, "Sent CV"]}
+    assert history[2]["changes"] == {"tags": {tag_id: ["position", "location"]}, "location": [None, "HistoryTag"]}
+    assert history[1]["changes"] == {"is_deleted": [False, True]}
+    assert history[4]["changes"]["company"] == [None, "HistoryCo"]
+    assert history[4]["changes"]["tags"] == {tag_id: [None, "position"]}
+
+    # Keyset paging walks the same entries
+    page = client.get(f"/applications/{app_id}/history", params={"limit": 3}).json()
+    rest = client.get(f"/applications/{app_id}/history", params={"limit": 3, "cursor": page["next_cursor"]}).json()
+    assert [entry["id"] for entry in page["history"] + rest["history"]] == [entry["id"] for entry in history]
+    assert rest["next_cursor"] is None
+
+    assert client.get(f"/applications/{uuid4()}/history").status_code == 404
+
+    # Purging an application takes its history with it
+    client.delete(f"/applications/{app_id}")
+    client.delete(f"/applications/{app_id}/permanent")
+    assert client.get(f"/applications/{app_id}/history").status_code == 404
+    db = SessionLocal()
+    try:
+        from app.models.application_activity import ApplicationActivity
+        assert db.query(ApplicationActivity).filter(ApplicationActivity.application_id == UUID(app_id)).count() == 0
+    finally:
+        db.close()
+
+# ---------- POST /applications/bulk/status ---------- (ECP)
+def test_bulk_update_status_ecp(client):
+    ids = []
+    for company in ("BulkA", "BulkB"):
+        res = client.post("/applications/", json={"company": company, "position": "Dev", "status": "wishlist"})
+        assert res.status_code == 201
+        ids.append(res.json()["id"])
+
+    deleted_res = client.post("/applications/", json={"company": "BulkGone", "position": "Dev", "status": "wishlist"})
+    deleted_id = deleted_res.json()["id"]
+    client.delete(f"/applications/{deleted_id}")
+    missing_id = str(uuid4())
+
+    res = client.post("/applications/bulk/status", json={
+        "ids": ids + [deleted_id, missing_id],
+        "status": "applied"
+    })
+    assert res.status_code == 200
+    body = res.json()
+    assert body["updated"] == 2
+    results = {item["id"]: item["result"] for item in body["results"]}
+    assert results[ids[0]] == "updated"
+    assert results[ids[1]] == "updated"
+    assert results[deleted_id] == "deleted"
+    assert results[missing_id] == "not_found"
+
+    for app_id in ids:
+        assert client.get(f"/applications/{app_id}").json()["status"] == "applied"
+
+    # Invalid target status / empty id list
+    assert client.post("/applications/bulk/status", json={"ids": ids, "status": "bogus"}).status_code == 422
+    assert client.post("/applications/bulk/status", json={"ids": [], "status": "offer"}).status_code == 422
+
+# ---------- POST /applications/bulk/{delete,restore,purge} ---------- (ECP)
+def test_bulk_trash_operations_ecp(client):
+    ids = []
+    for company in ("TrashA", "TrashB", "TrashC"):
+        res = client.post("/applications/", json={"company": company, "position": "QA", "status": "wishlist"})
+        assert res.status_code == 201
+        ids.append(res.json()["id"])
+    missing_id = str(uuid4())
+
+    # Bulk soft delete
+    del_res = client.post("/applications/bulk/delete", json={"ids": ids + [missing_id]})
+    assert del_res.status_code == 200
+    assert del_res.json()["affected"] == 3
+    results = {item["id"]: item["result"] for item in del_res.json()["results"]}
+    assert all(results[app_id] == "deleted" for app_id in ids)
+    assert results[missing_id] == "not_found"
+
+    # Deleting again reports the rows as already deleted
+    again = client.post("/applications/bulk/delete", json={"ids": ids[:1]})
+    assert again.json()["results"][0]["result"] == "already_deleted"
+
+    # Bulk restore by id
+    restore_res = client.post("/applications/bulk/restore", json={"ids": ids[:1]})
+    assert restore_res.status_code == 200
+    assert restore_res.json()["affected"] == 1
+    assert client.get(f"/applications/{ids[0]}").status_code == 200
+
+    # Purging an active application is refused per id
+    purge_active = client.post("/applications/bulk/purge", json={"ids": ids[:1]})
+    assert purge_active.json()["results"][0]["result"] == "not_deleted"
+
+    # Empty the whole trash in one request
+    purge_all = client.post("/applications/bulk/purge", json={"all": True})
+    assert purge_all.status_code == 200
+    purged = {item["id"] for item in purge_all.json()["results"]}
+    assert set(ids[1:]) <= purged
+    assert client.get("/applications/deleted").json()["total"] == 0
+
+    # Selection must be either ids or all
+    assert client.post("/applications/bulk/purge", json={}).status_code == 422
+    assert client.post("/applications/bulk/purge", json={"ids": ids, "all": True}).status_code == 422
+
+# ---------- GET /applications/?cursor= ---------- (Keyset pagination)
+def test_cursor_pagination_ecp(client):
+    for i in range(5):
+        res = client.post("/applications/", json={"company": f"CursorCo{i}", "position": "Dev", "status": "offer"})
+        assert res.status_code == 201
+
+    offset_ids = [app["id"] for app in client.get("/applications/", params={"status": "offer", "limit": 100}).json()["applications"]]
+
+    seen = []
+    params = {"status": "offer", "limit": 2, "include_total": False}
+    while True:
+        res = client.get("/applications/", params=params)
+        assert res.status_code == 200
+        body = res.json()
+        assert body["total"] is None
+        seen.extend(app["id"] for app in body["applications"])
+        if not body["next_cursor"]:
+            break
+        params["cursor"] = body["next_cursor"]
+
+    assert seen == offset_ids
+    assert len(seen) >= 5
+
+    # Malformed cursor
+    bad = client.get("/applications/", params={"cursor": "not-a-cursor"})
+    assert bad.status_code == 400
+
+# ---------- GET /applications/?tags_any=&tags_all= ---------- (ECP)
+def test_tag_filters_ecp(client):
+    tag_a = client.post("/tags/", json={"name": "FilterA"}).json()["id"]
+    tag_b = client.post("/tags/", json={"name": "FilterB"}).json()["id"]
+
+    def create(company, tags):
+        res = client.post("/applications/", json={"company": company, "position": "Dev", "tags": tags})
+        assert res.status_code == 201
+        return res.json()["id"]
+
+    only_a = create("OnlyA", [{"tag_id": tag_a, "field": "company"}])
+    only_b = create("OnlyB", [{"tag_id": tag_b, "field": "location"}])
+    both = create("Both", [{"tag_id": tag_a, "field": "company"}, {"tag_id": tag_b, "field": "location"}])
+
+    def ids(**params):
+        res = client.get("/applications/", params={"limit": 100, **params})
+        assert res.status_code == 200
+        return {app["id"] for app in res.json()["applications"]}
+
+    assert ids(tags_any=[tag_a, tag_b]) == {only_a, only_b, both}
+    assert ids(tags_all=[tag_a, tag_b]) == {both}
+    assert ids(tags_any=[f"company:{tag_a}"]) == {only_a, both}
+    assert ids(tags_any=[f"location:{tag_a}"]) == set()
+    assert ids(tags_all=[f"company:{tag_a}", f"location:{tag_b}"]) == {both}
+    assert ids(tags_any=[tag_b], tags_all=[tag_a]) == {both}
+
+    # Malformed filters
+    assert client.get("/applications/", params={"tags_any": "nope"}).status_code == 400
+    assert client.get("/applications/", params={"tags_all": f"salary:{tag_a}"}).status_code == 400
+
+# ---------- GET /applications/search ---------- (ECP)
+def test_search_applications_ecp(client):
+    strong = client.post("/applications/", json={
+        "company": "Zephyrworks", "position": "Platform Engineer", "notes": "Met the recruiter at a meetup"
+    }).json()["id"]
+    weak = client.post("/applications/", json={
+        "company": "Acme", "position": "Designer", "notes": "Referred by a friend who works with Zephyrworks"
+    }).json()["id"]
+    deleted = client.post("/applications/", json={"company": "Zephyrworks", "position": "Old"}).json()["id"]
+    client.delete(f"/applications/{deleted}")
+
+    res = client.get("/applications/search", params={"q": "zephyrworks"})
+    assert res.status_code == 200
+    body = res.json()
+    hit_ids = [hit["id"] for hit in body["applications"]]
+    assert hit_ids[:2] == [strong, weak]  # company match outranks a notes match
+    assert deleted not in hit_ids
+    assert body["total"] == len(hit_ids)
+    assert all("<mark>" in hit["snippet"] for hit in body["applications"])
+
+    # Multiple terms must all match
+    res = client.get("/applications/search", params={"q": "zephyrworks friend"})
+    assert [hit["id"] for hit in res.json()["applications"]] == [weak]
+
+    # Pagination
+    page = client.get("/applications/search", params={"q": "zephyrworks", "limit": 1, "offset": 1})
+    assert [hit["id"] for hit in page.json()["applications"]] == [weak]
+
+    assert client.get("/applications/search", params={"q": ""}).status_code == 422
+
+# ---------- GET /applications/board ---------- (ECP)
+def test_board_snapshot_ecp(client, count_queries):
+    tag_id = client.post("/tags/", json={"name": "BoardTag"}).json()["id"]
+    card = client.post("/applications/", json={
+        "company": "BoardCo", "position": "Dev", "status": "interviewed",
+        "tags": [{"tag_id": tag_id, "field": "company"}]
+    }).json()["id"]
+    for i in range(3):
+        client.post("/applications/", json={"company": f"BoardFill{i}", "position": "Dev", "status": "applied"})
+
+    with count_queries() as statements:
+        res = client.get("/applications/board")
+    assert res.status_code == 200
+    assert len(statements) <= 4
+
+    board = res.json()
+    columns = {column["status"]: column for column in board["columns"]}
+    assert [column["status"] for column in board["columns"]][:5] == ["wishlist", "applied", "interviewed", "offer", "declined"]
+    assert all(column["count"] == len(column["applications"]) for column in board["columns"])
+    assert columns["applied"]["count"] >= 3
+
+    interviewed = {c["id"]: c for c in columns["interviewed"]["applications"]}
+    assert interviewed[card]["tags"] == {"company": [tag_id]}
+    assert board["tags"][tag_id] == "BoardTag"
+
+    with count_queries() as statements:
+        limited = client.get("/applications/board", params={"per_column_limit": 1}).json()
+    limited_columns = {column["status"]: column for column in limited["columns"]}
+    assert len(limited_columns["applied"]["applications"]) == 1
+    assert limited_columns["applied"]["count"] == columns["applied"]["count"]
+    assert limited_columns["interviewed"]["applications"][0]["tags"] == {"company": [tag_id]}
+    # Tags are only fetched for the cards that made the cut
+    tag_queries = [sql for sql in statements if "FROM application_tags" in sql]
+    assert tag_queries and all("position_in_column" in sql for sql in tag_queries)
+
+# ---------- GET /applications/changes ---------- (Delta sync)
+def test_delta_sync_changes_ecp(client):
+    from app.database import SessionLocal
+    from app.utils.sync import compact_tombstones
+
+    keep = client.post("/applications/", json={"company": "SyncKeep", "position": "Dev"}).json()["id"]
+    doomed = client.post("/applications/", json={"company": "SyncGone", "position": "Dev"}).json()["id"]
+    tag_id = client.post("/tags/", json={"name": "SyncTag"}).json()["id"]
+
+    snapshot = client.get("/applications/changes").json()
+    assert snapshot["reset"] is False
+    assert {keep, doomed} <= {a["id"] for a in snapshot["applications"]}
+    token = snapshot["next"]
+
+    quiet = client.get("/applications/changes", params={"since": token}).json()
+    assert quiet["applications"] == [] and quiet["deleted"] == {"applications": [], "tags": []}
+    assert quiet["next"] == token
+
+    client.patch(f"/applications/{keep}", json={"status": "offer"})
+    client.delete(f"/applications/{doomed}")
+    delta = client.get("/applications/changes", params={"since": token}).json()
+    assert {a["id"]: a["is_deleted"] for a in delta["applications"]} == {keep: False, doomed: True}
+    token = delta["next"]
+
+    client.delete(f"/applications/{doomed}/permanent")
+    client.delete(f"/tags/{tag_id}")
+    delta = client.get("/applications/changes", params={"since": token}).json()
+    assert delta["applications"] == []
+    assert delta["deleted"] == {"applications": [doomed], "tags": [tag_id]}
+
+    db = SessionLocal()
+    assert compact_tombstones(db, retention_days=0) >= 2
+    db.close()
+    stale = client.get("/applications/changes", params={"since": token}).json()
+    assert stale["reset"] is True
+    assert keep in {a["id"] for a in stale["applications"]}
+    assert client.get("/applications/changes", params={"since": stale["next"]}).json()["reset"] is False
+
+    assert client.get("/applications/changes", params={"since": "not-a-token"}).status_code == 400
+
+# ---------- GET /applications/stats ---------- (ECP)
+def test_application_stats_ecp(client):
+    from datetime import timedelta
+    from app.utils.status_stats import backfill_status_stats
+
+    def stats():
+        res = client.get("/applications/stats", params={"weeks": 2})
+        assert res.status_code == 200
+        return res.json()
+
+    def reached(body):
+        return {stage["status"]: stage["reached"] for stage in body["funnel"]}
+
+    before = stats()
+    ids = [
+        client.post("/applications/", json={"company": f"StatsCo{i}", "position": "Dev", "status": "wishlist"}).json()["id"]
+        for i in range(2)
+    ]
+    for status in ("applied", "interviewed", "offer"):
+        assert client.patch(f"/applications/{ids[0]}", json={"status": status}).status_code == 200
+    client.post("/applications/bulk/status", json={"ids": [ids[1]], "status": "declined"})
+    # Re-saving the same status is not a transition
+    client.patch(f"/applications/{ids[0]}", json={"status": "offer"})
+
+    # A tag on the status field moves the application as well
+    tagged = client.post("/applications/", json={"company": "StatsTagCo", "position": "Dev", "status": "wishlist"}).json()["id"]
+    tag_id = client.post("/tags/", json={"name": "interviewed"}).json()["id"]
+    assert client.patch(f"/applications/{tagged}", json={"tags": [{"tag_id": tag_id, "field": "status"}]}).json()["status"] == "interviewed"
+
+    after = stats()
+    gained = {stage: after_count - reached(before)[stage] for stage, after_count in reached(after).items()}
+    assert gained == {"wishlist": 3, "applied": 2, "interviewed": 2, "offer": 1, "declined": 1}
+    assert all(0 <= stage["conversion_rate"] <= 1 for stage in after["funnel"][1:4])
+
+    exits = {row["status"]: row["exits"] for row in after["time_in_status"]}
+    exits_before = {row["status"]: row["exits"] for row in before["time_in_status"]}
+    assert exits["wishlist"] - exits_before["wishlist"] == 3
+    assert exits["offer"] == exits_before["offer"]
+    wishlist = next(row for row in after["time_in_status"] if row["status"] == "wishlist")
+    assert wishlist["median_hours"] is not None and wishlist["median_hours"] < 1
+
+    assert len(after["weekly_volume"]) == 2
+    assert after["weekly_volume"][-1]["created"] - before["weekly_volume"][-1]["created"] == 3
+
+    # The ETag moves with the date (the days window and weeks shift daily)
+    from unittest.mock import patch
+    import app.routes.applications as applications_routes
+    etag = client.get("/applications/stats").headers["etag"]
+    assert client.get("/applications/stats", headers={"If-None-Match": etag}).status_code == 304
+    tomorrow = applications_routes.utcnow() + timedelta(days=1)
+    with patch.object(applications_routes, "utcnow", lambda: tomorrow):
+        assert client.get("/applications/stats", headers={"If-None-Match": etag}).status_code == 200
+
+    # Rebuilding the rollups from the transition log gives the same numbers,
+    # and invalidates cached copies
+    db = SessionLocal()
+    try:
+        synthesized, replayed = backfill_status_stats(db, FAKE_USER_ID)
+        db.commit()
+    finally:
+        db.close()
+    assert synthesized == 0 and replayed > 0
+    assert client.get("/applications/stats", headers={"If-None-Match": etag}).status_code == 200
+    assert stats() == after
+
+    assert client.get("/applications/stats", params={"weeks": 0}).status_code == 422
+
+# ---------- Query count for list endpoints ---------- (N+1 regression)
+def test_list_query_count_independent_of_page_size(client, count_queries):
+    tag_ids = [client.post("/tags/", json={"name": f"N1Tag{i}"}).json()["id"] for i in range(3)]
+    for i in range(12):
+        res = client.post("/applications/", json={
+            "company": f"N1Co{i}",
+            "position": "Dev",
+            "status": "wishlist",
+            "tags": [{"tag_id": tag_id, "field": "company"} for tag_id in tag_ids]
+        })
+        assert res.status_code == 201
+        if i % 2:
+            client.delete(f"/applications/{res.json()['id']}")
+
+    for path in ("/applications/", "/applications/deleted"):
+        counts = []
+        for limit in (1, 6):
+            with count_queries() as statements:
+                res = client.get(path, params={"limit": limit})
+            assert res.status_code == 200
+            assert len(res.json()["applications"]) == limit
+            counts.append(len(statements))
+        assert counts[0] == counts[1], f"{path} issued {counts} queries for page sizes 1 and 6"
+
+# ---------- Query count for tag writes ---------- (N+1 regression)
+def test_tag_writes_query_count_independent_of_tag_count(client, count_queries):
+    tag_ids = [client.post("/tags/", json={"name": f"SetTag{i}"}).json()["id"] for i in range(8)]
+    fields = ["company", "location", "position", "status"]
+
+    def tags(ids):
+        return [{"tag_id": tag_id, "field": fields[i % 4]} for i, tag_id in enumerate(ids)]
+
+    create_counts = []
+    for ids in (tag_ids[:1], tag_ids):
+        with count_queries() as statements:
+            res = client.post("/applications/", json={"company": "SetCo", "position": "Dev", "tags": tags(ids)})
+        assert res.status_code == 201
+        create_counts.append(len(statements))
+    assert create_counts[0] == create_counts[1], f"create issued {create_counts} queries for 1 and 8 tags"
+
+    app_id = res.json()["id"]
+    update_counts = []
+    for ids in (tag_ids[:4], tag_ids[:7]):
+        # Start from a state where every kind of change is needed: all but
+        # the last tag on another field, the last one missing, an extra one.
+        # Both sizes retag the status field, so both record a status move.
+        shifted = [{"tag_id": tag_id, "field": fields[(i + 1) % 4]} for i, tag_id in enumerate(ids[:-1])]
+        client.patch(f"/applications/{app_id}", json={"tags": shifted + [{"tag_id": tag_ids[7], "field": "company"}]})
+        with count_queries() as statements:
+            res = client.patch(f"/applications/{app_id}", json={"tags": tags(ids)})
+        assert res.status_code == 200
+        update_counts.append(len(statements))
+        returned = {tag["id"]: field for field, entries in res.json()["tags"].items() for tag in entries}
+        assert returned == {tag["tag_id"]: tag["field"] for tag in tags(ids)}
+    assert update_counts[0] == update_counts[1], f"update issued {update_counts} queries for 4 and 7 tags"
+
+    # Tags on columns are propagated onto the application in the same pass
+    assert res.json()["status"] == "SetTag3"
+
+    bad = client.patch(f"/applications/{app_id}", json={"tags": [{"tag_id": tag_ids[0], "field": "company"}, {"tag_id": tag_ids[0], "field": "position"}]})
+    assert bad.status_code == 400
+    bad = client.patch(f"/applications/{app_id}", json={"tags": [{"tag_id": tag_ids[0], "field": "salary"}]})
+    assert bad.status_code == 400
+
+# ---------- Conditional GETs (ETag / If-None-Match) ---------- (ECP)
+def test_conditional_get_etags(client, count_queries):
+    app_id = client.post("/applications/", json={"company": "EtagCo", "position": "Dev", "status": "applied"}).json()["id"]
+
+    for path in ("/applications/", "/applications/deleted", f"/applications/{app_id}", "/tags/"):
+        first = client.get(path)
+        assert first.status_code == 200
+        etag = first.headers["etag"]
+        assert etag.startswith('W/"')
+
+        with count_queries() as statements:
+            cached = client.get(path, headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.headers["etag"] == etag
+        assert not cached.content
+        assert not any("applications" in s or "tags" in s for s in statements)
+
+    listing = client.get("/applications/").headers["etag"]
+    assert client.get("/applications/", params={"limit": 1}).headers["etag"] != listing
+
+    client.patch(f"/applications/{app_id}", json={"status": "offer"})
+    fresh = client.get("/applications/", headers={"If-None-Match": listing})
+    assert fresh.status_code == 200
+    assert fresh.headers["etag"] != listing
+
+    tags_etag = client.get("/tags/").headers["etag"]
+    client.post("/tags/", json={"name": "EtagTag"})
+    assert client.get("/tags/", headers={"If-None-Match": tags_etag}).status_code == 200
+
+    # Writes that change nothing leave cached copies valid
+    client.delete(f"/applications/{app_id}")
+    listing = client.get("/applications/").headers["etag"]
+    assert client.delete(f"/applications/{app_id}").status_code == 204
+    noop = client.post("/applications/bulk/status", json={"ids": [app_id], "status": "offer"}).json()
+    assert (noop["updated"], noop["results"][0]["result"]) == (0, "deleted")
+    client.post("/applications/bulk/delete", json={"ids": [app_id]})
+    client.post("/applications/bulk/restore", json={"ids": [str(uuid4())]})
+    client.post("/applications/bulk/purge", json={"ids": [str(uuid4())]})
+    assert client.get("/applications/", headers={"If-None-Match": listing}).status_code == 304
+
 # ---------- POST /tags/ ---------- (Robust Worst-Case BVA)
 @pytest.mark.parametrize("payload, expected_status", [
     ({"name": "Tech"}, 201),  # Valid case
@@ -154,6 +607,60 @@ def test_get_tags_ecp(client):
     assert isinstance(tags, list)
     assert any(tag["name"] == "Design" for tag in tags)
 
+# ---------- GET /tags/usage ---------- (ECP)
+def test_tag_usage_counts_ecp(client):
+    from app.models.tag_usage import TagUsage
+    from app.utils.tag_usage import repair_tag_usage
+
+    remote = client.post("/tags/", json={"name": "UsageRemote"}).json()["id"]
+    senior = client.post("/tags/", json={"name": "UsageSenior"}).json()["id"]
+
+    def usage():
+        res = client.get("/tags/usage")
+        assert res.status_code == 200
+        return {tag["id"]: tag for tag in res.json()}
+
+    ids = [
+        client.post("/applications/", json={
+            "company": f"UsageCo{i}", "position": "Dev",
+            "tags": [{"tag_id": remote, "field": "location"}, {"tag_id": senior, "field": "position"}],
+        }).json()["id"]
+        for i in range(3)
+    ]
+    counts = usage()
+    assert counts[remote]["active"] == 3 and counts[remote]["deleted"] == 0
+    assert counts[remote]["fields"] == {"location": {"active": 3, "deleted": 0}}
+
+    # Move a tag to another field and drop one
+    client.patch(f"/applications/{ids[0]}", json={"tags": [{"tag_id": remote, "field": "company"}]})
+    counts = usage()
+    assert counts[remote]["fields"] == {"location": {"active": 2, "deleted": 0}, "company": {"active": 1, "deleted": 0}}
+    assert counts[senior]["active"] == 2
+
+    # Soft delete, restore and purge move counts between columns
+    client.delete(f"/applications/{ids[1]}")
+    client.post("/applications/bulk/delete", json={"ids": [ids[2]]})
+    counts = usage()
+    assert counts[remote]["fields"]["location"] == {"active": 0, "deleted": 2}
+    assert (counts[senior]["active"], counts[senior]["deleted"]) == (0, 2)
+
+    client.patch(f"/applications/{ids[1]}/restore")
+    client.delete(f"/applications/{ids[2]}/permanent")
+    counts = usage()
+    assert counts[remote]["fields"]["location"] == {"active": 1, "deleted": 0}
+    assert (counts[senior]["active"], counts[senior]["deleted"]) == (1, 0)
+
+    # The repair command finds nothing to fix, then undoes manual drift
+    db = SessionLocal()
+    try:
+        assert repair_tag_usage(db, FAKE_USER_ID) == 0
+        db.query(TagUsage).filter(TagUsage.tag_id == UUID(senior)).update({"active_count": 40})
+        assert repair_tag_usage(db, FAKE_USER_ID) == 1
+        db.commit()
+    finally:
+        db.close()
+    assert usage()[senior]["active"] == 1
+
 
 # ---------- DELETE /tags/{id} ---------- (ECP)
 def test_delete_tag_ecp(client):
@@ -180,7 +687,38 @@ def test_admin_get_all_users(client):
 
     res = client.get("/admin/users")
     assert res.status_code == 200
-    assert isinstance(res.json(), list)
+    assert isinstance(res.json()["users"], list)
+    assert res.json()["totals"]["users"] >= len(res.json()["users"])
+
+    # Three users sharing a search prefix, one with applications and a tag
+    prefix = f"page-{uuid4().hex[:8]}"
+    db = SessionLocal()
+    users = [User(id=uuid4(), email=f"{prefix}-{i}@example.com", hashed_password="temp", is_admin=False) for i in range(3)]
+    db.add_all(users)
+    db.commit()
+    busy_id = users[1].id
+    db.close()
+    app.dependency_overrides[get_current_user] = lambda: User(
+        id=busy_id, email=f"{prefix}-1@example.com", hashed_password="temp", is_admin=False
+    )
+    client.post("/tags/", json={"name": "AdminListTag"})
+    app_ids = [client.post("/applications/", json={"company": f"Co{i}", "position": "Dev"}).json()["id"] for i in range(2)]
+    client.delete(f"/applications/{app_ids[0]}")
+    app.dependency_overrides[get_current_user] = lambda: User(
+        id=FAKE_USER_ID, email="admin@example.com", hashed_password="fakehashed", is_admin=True
+    )
+
+    first = client.get("/admin/users", params={"q": prefix.upper(), "limit": 2}).json()
+    second = client.get("/admin/users", params={"q": prefix, "limit": 2, "cursor": first["next_cursor"]}).json()
+    listed = first["users"] + second["users"]
+    assert [user["email"] for user in listed] == [f"{prefix}-{i}@example.com" for i in range(3)]
+    assert second["next_cursor"] is None
+    busy = listed[1]
+    assert (busy["active_applications"], busy["deleted_applications"], busy["tags"]) == (1, 1, 1)
+    assert busy["last_activity_at"] is not None
+    assert (listed[0]["active_applications"], listed[0]["tags"], listed[0]["last_activity_at"]) == (0, 0, None)
+
+    assert client.get("/admin/users", params={"cursor": "not-a-cursor"}).status_code == 400
 
     app.dependency_overrides.clear()
 
@@ -206,6 +744,238 @@ def test_admin_delete_user(client):
 
     app.dependency_overrides.clear()
 
+def drain_jobs():
+    """Run every due job, the way a worker would; returns how many ran."""
+    from app.core.jobs import work_once
+
+    ran = 0
+    while work_once("test-worker"):
+        ran += 1
+    return ran
+
+def test_admin_delete_user_cascades_ecp(client):
+    from app.core.config import settings
+    from app.models.application import Application
+    from app.models.application_activity import ApplicationActivity
+    from app.models.application_tag import ApplicationTag
+    from app.models.tag import Tag
+    from app.models.tag_usage import TagUsage
+
+    app.dependency_overrides[get_current_user] = lambda: User(
+        id=FAKE_USER_ID, email="admin@example.com", hashed_password="fakehashed", is_admin=True
+    )
+
+    def make_account(email):
+        db = SessionLocal()
+        user = User(id=uuid4(), email=email, hashed_password="temp", is_admin=False)
+        tag = Tag(id=uuid4(), user_id=user.id, name="Remote")
+        apps = [Application(id=uuid4(), user_id=user.id, company=f"C{i}", position="Dev") for i in range(5)]
+        db.add(user)
+        db.flush()
+        db.add_all([tag, *apps])
+        db.flush()
+        db.add_all([ApplicationTag(application_id=a.id, tag_id=tag.id, field="location") for a in apps])
+        db.add(TagUsage(tag_id=tag.id, field="location", active_count=5, deleted_count=0))
+        db.add_all([
+            ApplicationActivity(application_id=a.id, user_id=user.id, action="created", changes={"company": [None, a.company]})
+            for a in apps
+        ])
+        db.commit()
+        ids = (user.id, tag.id, [a.id for a in apps])
+        db.close()
+        return ids
+
+    def leftovers(user_id, tag_id, app_ids):
+        db = SessionLocal()
+        try:
+            return {
+                "users": db.query(User).filter(User.id == user_id).count(),
+                "applications": db.query(Application).filter(Application.user_id == user_id).count(),
+                "tags": db.query(Tag).filter(Tag.user_id == user_id).count(),
+                "application_tags": db.query(ApplicationTag).filter(ApplicationTag.application_id.in_(app_ids)).count(),
+                "tag_usage": db.query(TagUsage).filter(TagUsage.tag_id == tag_id).count(),
+                "activity": db.query(ApplicationActivity).filter(ApplicationActivity.user_id == user_id).count(),
+            }
+        finally:
+            db.close()
+
+    gone = {"users": 0, "applications": 0, "tags": 0, "application_tags": 0, "tag_usage": 0, "activity": 0}
+
+    # Inline: one transaction, the database cascades to the children
+    user_id, tag_id, app_ids = make_account("cascade-inline@example.com")
+    assert client.delete(f"/admin/users/{user_id}").status_code == 204
+    assert leftovers(user_id, tag_id, app_ids) == gone
+
+    # Background: 202 now, chunked deletion after the response
+    user_id, tag_id, app_ids = make_account("cascade-background@example.com")
+    chunk_size = settings.ACCOUNT_DELETE_CHUNK_SIZE
+    settings.ACCOUNT_DELETE_CHUNK_SIZE = 2
+    try:
+        res = client.delete(f"/admin/users/{user_id}", params={"background": True})
+    finally:
+        settings.ACCOUNT_DELETE_CHUNK_SIZE = chunk_size
+    assert res.status_code == 202
+    job = res.json()
+    assert job["kind"] == "account.purge" and job["status"] == "queued"
+    assert job["payload"] == {"user_id": str(user_id), "chunk_size": 2}
+    assert drain_jobs() >= 1
+    job = client.get(f"/admin/jobs/{job['id']}").json()
+    assert job["status"] == "succeeded"
+    assert job["result"]["rows_deleted"] == 5 + 5 + 1  # activity, applications, tag
+    assert leftovers(user_id, tag_id, app_ids) == gone
+
+    assert client.delete(f"/admin/users/{uuid4()}").status_code == 404
+
+    # A purge job only empties accounts that were flagged for deletion
+    from app.core.jobs import enqueue_job
+    db = SessionLocal()
+    job_id = enqueue_job(db, "account.purge", {"user_id": str(FAKE_USER_ID)}).id
+    db.commit()
+    db.close()
+    drain_jobs()
+    assert client.get(f"/admin/jobs/{job_id}").json()["result"]["skipped"]
+    db = SessionLocal()
+    assert db.get(User, FAKE_USER_ID) is not None
+    db.close()
+
+    # Deleting a tag cascades to its associations and usage counts
+    tag_res = client.post("/tags/", json={"name": "CascadeTag"})
+    assert tag_res.status_code == 201
+    tag_id = UUID(tag_res.json()["id"])
+    create_res = client.post("/applications/", json={
+        "company": "CascadeCo", "position": "Dev", "status": "wishlist",
+        "tags": [{"tag_id": str(tag_id), "field": "company"}],
+    })
+    assert create_res.status_code == 201
+    assert client.delete(f"/tags/{tag_id}").status_code == 204
+    db = SessionLocal()
+    assert db.query(ApplicationTag).filter(ApplicationTag.tag_id == tag_id).count() == 0
+    assert db.query(TagUsage).filter(TagUsage.tag_id == tag_id).count() == 0
+    db.close()
+
+    app.dependency_overrides.clear()
+
+# ---------- /admin/jobs ---------- (ECP)
+def test_admin_jobs_retry_with_backoff_ecp(client):
+    from datetime import timedelta
+    from app.core.jobs import JOB_HANDLERS, enqueue_job, job_handler
+    from app.models.application import utcnow
+    from app.models.job import Job
+
+    app.dependency_overrides[get_current_user] = lambda: User(
+        id=FAKE_USER_ID, email="admin@example.com", hashed_password="fakehashed", is_admin=True
+    )
+    calls = []
+
+    @job_handler("test.flaky")
+    def flaky(db, payload):
+        calls.append(payload)
+        if len(calls) < payload["succeed_on"]:
+            raise RuntimeError("transient failure")
+        return {"calls": len(calls)}
+
+    def queue(payload, max_attempts=None):
+        db = SessionLocal()
+        job_id = str(enqueue_job(db, "test.flaky", payload, max_attempts=max_attempts).id)
+        db.commit()
+        db.close()
+        return job_id
+
+    def make_due(job_id):
+        db = SessionLocal()
+        db.query(Job).filter(Job.id == UUID(job_id)).update({"run_at": utcnow() - timedelta(seconds=1)})
+        db.commit()
+        db.close()
+
+    try:
+        job_id = queue({"succeed_on": 2})
+
+        # First attempt fails: back in the queue, not due until the backoff has passed
+        assert drain_jobs() == 1
+        job = client.get(f"/admin/jobs/{job_id}").json()
+        assert job["status"] == "queued" and job["attempts"] == 1
+        assert "transient failure" in job["last_error"]
+        assert drain_jobs() == 0
+
+        make_due(job_id)
+        assert drain_jobs() == 1
+        job = client.get(f"/admin/jobs/{job_id}").json()
+        assert job["status"] == "succeeded" and job["attempts"] == 2
+        assert job["result"] == {"calls": 2}
+
+        # Out of attempts: failed for good, until an admin retries it
+        calls.clear()
+        failed_id = queue({"succeed_on": 2}, max_attempts=1)
+        drain_jobs()
+        assert client.get(f"/admin/jobs/{failed_id}").json()["status"] == "failed"
+        listed = client.get("/admin/jobs", params={"status": "failed", "kind": "test.flaky"}).json()
+        assert [job["id"] for job in listed] == [failed_id]
+
+        retried = client.post(f"/admin/jobs/{failed_id}/retry")
+        assert retried.status_code == 200
+        assert retried.json()["status"] == "queued" and retried.json()["attempts"] == 0
+        drain_jobs()
+        assert client.get(f"/admin/jobs/{failed_id}").json()["status"] == "succeeded"
+
+        assert client.post(f"/admin/jobs/{failed_id}/retry").status_code == 409
+        assert client.post("/admin/jobs", json={"kind": "no.such.job"}).status_code == 400
+        # Only maintenance kinds, with validated payloads, can be queued directly
+        assert client.post("/admin/jobs", json={"kind": "account.purge", "payload": {"user_id": str(FAKE_USER_ID)}}).status_code == 400
+        assert client.post("/admin/jobs", json={"kind": "tag_usage.repair", "payload": {"user_id": "nope"}}).status_code == 422
+        assert client.post("/admin/jobs", json={"kind": "tag_usage.repair", "payload": {"chunk_size": 1}}).status_code == 422
+        repair = client.post("/admin/jobs", json={"kind": "tag_usage.repair", "payload": {"user_id": str(FAKE_USER_ID)}})
+        assert repair.status_code == 202
+        assert repair.json()["payload"] == {"user_id": str(FAKE_USER_ID)}
+        drain_jobs()
+        assert client.get(f"/admin/jobs/{repair.json()['id']}").json()["status"] == "succeeded"
+        assert client.get(f"/admin/jobs/{uuid4()}").status_code == 404
+        assert client.get("/admin/jobs", params={"status": "bogus"}).status_code == 422
+    finally:
+        JOB_HANDLERS.pop("test.flaky", None)
+        app.dependency_overrides.clear()
+
+def test_job_lock_heartbeat_and_takeover_ecp(client):
+    import time
+    from app.core.config import settings
+    from app.core.jobs import JOB_HANDLERS, claim_job, enqueue_job, finish_job, job_handler, run_job
+    from app.models.job import Job
+
+    @job_handler("test.slow")
+    def slow(db, payload):
+        time.sleep(1.5)
+        job = db.get(Job, UUID(payload["id"]))
+        return {"heartbeat": job.locked_at > job.started_at}
+
+    lock_timeout = settings.JOB_LOCK_TIMEOUT_SECONDS
+    settings.JOB_LOCK_TIMEOUT_SECONDS = 4  # heartbeat every second
+    db = SessionLocal()
+    try:
+        job = enqueue_job(db, "test.slow", {})
+        job.payload = {"id": str(job.id)}
+        db.commit()
+        claimed = claim_job(db, "worker-a")
+        db.expunge(claimed)
+        run_job(claimed)
+        db.expire_all()
+        job = db.get(Job, claimed.id)
+        assert job.status == "succeeded"
+        assert job.result == {"heartbeat": True}
+
+        # A worker whose job was taken over can't finish it
+        job = enqueue_job(db, "test.slow", {})
+        db.commit()
+        claimed = claim_job(db, "worker-a")
+        db.query(Job).filter(Job.id == claimed.id).update({"locked_by": "worker-b"})
+        db.commit()
+        assert finish_job(db, claimed.id, "worker-a", {}) is False
+        db.expire_all()
+        assert db.get(Job, claimed.id).status == "running"
+        assert finish_job(db, claimed.id, "worker-b", {}) is True
+    finally:
+        settings.JOB_LOCK_TIMEOUT_SECONDS = lock_timeout
+        JOB_HANDLERS.pop("test.slow", None)
+        db.close()
+
 # --- POST /admin-tools/promote/{user_id} ---
 def test_secret_promote_user(client):
     # Create non-admin user
@@ -49,3 +49,55 @@ def test_me_valid_cookie(client):
     res = client.get("/auth/me")
     assert res.status_code == 200
     assert res.json()["email"] == "me@test.com"
+
+# ----- Principal cache -----
+
+def test_principal_cache_skips_user_lookup(client, count_queries):
+    from app.core.principal_cache import principal_cache
+
+    signup_res = client.post("/auth/signup", json={"email": "cached@test.com", "password": "cachedpass"})
+    assert signup_res.status_code == 200
+    client.cookies.set("access_token", signup_res.cookies.get("access_token"))
+
+    # First request populates the cache
+    assert client.get("/tags/").status_code == 200
+
+    with count_queries() as statements:
+        assert client.get("/tags/").status_code == 200
+    # Conditional-GET checks still read users.data_version; the principal
+    # lookup is the one that loads the full row.
+    assert not any("users.hashed_password" in statement for statement in statements)
+
+    # Invalidation forces the next request back to the database
+    principal_cache.clear()
+    with count_queries() as statements:
+        assert client.get("/tags/").status_code == 200
+    assert any("users.hashed_password" in statement for statement in statements)
+
+# ----- Password hashing pool -----
+
+def test_login_rehashes_outdated_bcrypt_cost(client):
+    from app.core.security import make_crypt_context, pwd_context
+    from app.database import SessionLocal
+    from app.models.user import User
+
+    email = "rehash@test.com"
+    assert client.post("/auth/signup", json={"email": email, "password": "rehashpass"}).status_code == 200
+
+    current_rounds = pwd_context.to_dict()["bcrypt__rounds"]
+    outdated_rounds = 4 if current_rounds != 4 else 5
+    db = SessionLocal()
+    user = db.query(User).filter(User.email == email).first()
+    user.hashed_password = make_crypt_context(outdated_rounds).hash("rehashpass")
+    db.commit()
+    db.close()
+
+    assert client.post("/auth/login", json={"email": email, "password": "rehashpass"}).status_code == 200
+
+    db = SessionLocal()
+    user = db.query(User).filter(User.email == email).first()
+    assert pwd_context.verify("rehashpass", user.hashed_password)
+    assert not pwd_context.needs_update(user.hashed_password)
+    db.close()
+
+    assert client.post("/auth/login", json={"email": email, "password": "wrongpass"}).status_code == 401
@@ -0,0 +1,73 @@
+import gzip
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.core.compression import CompressionMiddleware, choose_encoding, compression_stats, brotli
+
+BIG = '{"applications": [' + ",".join('{"company": "Acme", "status": "applied"}' for _ in range(200)) + "]}"
+
+def make_client():
+    mini = FastAPI()
+
+    @mini.get("/big")
+    def big():
+        return PlainTextResponse(BIG, media_type="application/json")
+
+    @mini.get("/small")
+    def small():
+        return {"ok": True}
+
+    @mini.get("/stream")
+    def stream():
+        return StreamingResponse(iter([BIG, BIG]), media_type="text/event-stream")
+
+    @mini.get("/png")
+    def png():
+        return PlainTextResponse("x" * 5000, media_type="image/png")
+
+    mini.add_middleware(CompressionMiddleware, minimum_size=500, gzip_level=6)
+    return TestClient(mini)
+
+# ---------- Accept-Encoding negotiation ---------- (ECP)
+@pytest.mark.parametrize("header, expected", [
+    ("gzip", "gzip"),
+    ("gzip, deflate", "gzip"),
+    ("", None),
+    ("identity", None),
+    ("gzip;q=0", None),
+    ("*", "br" if brotli else "gzip"),
+    ("br;q=0.5, gzip;q=0.8", "gzip"),
+    ("br, gzip", "br" if brotli else "gzip"),
+])
+def test_choose_encoding(header, expected):
+    assert choose_encoding(header) == expected
+
+# ---------- Compression middleware ---------- (ECP)
+def test_large_json_is_gzipped_and_counted():
+    client = make_client()
+    before = compression_stats.snapshot()
+
+    res = client.get("/big", headers={"Accept-Encoding": "gzip"})
+    assert res.status_code == 200
+    assert res.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in res.headers["vary"]
+    assert res.text == BIG
+    assert int(res.headers["content-length"]) == len(gzip.compress(BIG.encode(), compresslevel=6, mtime=0))
+
+    after = compression_stats.snapshot()
+    assert after["compressed"] == before["compressed"] + 1
+    assert after["bytes_in"] - before["bytes_in"] == len(BIG)
+    assert after["bytes_out"] - before["bytes_out"] < len(BIG) / 5
+
+@pytest.mark.parametrize("path, headers", [
+    ("/big", {"Accept-Encoding": "identity"}),
+    ("/small", {"Accept-Encoding": "gzip"}),
+    ("/stream", {"Accept-Encoding": "gzip"}),
+    ("/png", {"Accept-Encoding": "gzip"}),
+])
+def test_responses_left_uncompressed(path, headers):
+    res = make_client().get(path, headers=headers)
+    assert res.status_code == 200
+    assert "content-encoding" not in res.headers
@@ -0,0 +1,126 @@
+import asyncio
+import pytest
+from unittest.mock import patch
+from uuid import UUID
+from fastapi import HTTPException
+
+from app.main import app
+from app.models.user import User
+from app.core.auth import get_current_user
+from app.core.events import EventBroker, broker
+from app.routes.events import format_sse
+
+FAKE_USER_ID = UUID("123e4567-e89b-12d3-a456-426614174000")
+
+@pytest.fixture(scope="module", autouse=True)
+def override_auth():
+    app.dependency_overrides[get_current_user] = lambda: User(
+        id=FAKE_USER_ID, email="fakeuser@example.com", hashed_password="fakehashed", is_admin=False
+    )
+    yield
+    app.dependency_overrides.clear()
+
+def run(coro):
+    return asyncio.run(coro)
+
+# ---------- Broker: connection cap and backpressure ----------
+def test_broker_caps_connections_per_user():
+    async def scenario():
+        local = EventBroker(max_connections_per_user=2, queue_size=4)
+        first = local.subscribe("u1")
+        local.subscribe("u1")
+        with pytest.raises(HTTPException) as exc:
+            local.subscribe("u1")
+        assert exc.value.status_code == 429
+        local.subscribe("u2")
+
+        local.unsubscribe(first)
+        local.subscribe("u1")
+        assert local.stats()["connections"] == 3
+
+    run(scenario())
+
+def test_slow_subscriber_gets_single_resync():
+    async def scenario():
+        local = EventBroker(max_connections_per_user=1, queue_size=3)
+        slow = local.subscribe("u1")
+        for i in range(10):
+            local.dispatch("u1", {"type": "application.updated", "version": i})
+        await asyncio.sleep(0)
+
+        assert slow.queue.qsize() == 1
+        assert (await slow.get())["type"] == "resync"
+        assert slow.dropped == 10
+
+        local.dispatch("u1", {"type": "application.updated", "version": 11})
+        await asyncio.sleep(0)
+        assert (await slow.get())["version"] == 11
+
+    run(scenario())
+
+def test_stream_releases_subscription_without_body():
+    from app.routes.events import event_stream, stream_events
+
+    class ConnectedRequest:
+        async def is_disconnected(self):
+            return False
+
+    user = User(id=FAKE_USER_ID, email="fakeuser@example.com", hashed_password="fakehashed", is_admin=False)
+
+    async def scenario():
+        local = EventBroker(max_connections_per_user=1, queue_size=4)
+        with patch("app.routes.events.broker", local):
+            # The cap is enforced before the response starts
+            response = await stream_events(ConnectedRequest(), user)
+            assert local.stats()["connections"] == 1
+            with pytest.raises(HTTPException) as exc:
+                await stream_events(ConnectedRequest(), user)
+            assert exc.value.status_code == 429
+
+            # A response whose body is never sent is released by its background task
+            await response.background()
+            assert local.stats()["connections"] == 0
+
+            # A stream that ran releases its subscription when it closes
+            stream = event_stream(ConnectedRequest(), local.subscribe(FAKE_USER_ID))
+            assert await stream.__anext__() == "retry: 3000\n\n"
+            await stream.aclose()
+            assert local.stats()["connections"] == 0
+
+    run(scenario())
+
+def test_format_sse():
+    frame = format_sse({"type": "application.moved", "version": 3, "ids": ["a"], "status": "offer"})
+    assert frame == 'event: application.moved\ndata: {"version":3,"ids":["a"],"status":"offer"}\n\n'
+
+# ---------- Mutation handlers publish after commit ----------
+def test_mutations_publish_events(client):
+    async def scenario():
+        subscription = broker.subscribe(FAKE_USER_ID)
+        try:
+            res = await asyncio.to_thread(
+                client.post, "/applications/", json={"company": "LiveCo", "position": "Dev", "status": "applied"}
+            )
+            app_id = res.json()["id"]
+            created = await asyncio.wait_for(subscription.get(), timeout=5)
+            assert created["type"] == "application.created"
+            assert created["ids"] == [app_id]
+
+            await asyncio.to_thread(client.patch, f"/applications/{app_id}", json={"status": "offer"})
+            moved = await asyncio.wait_for(subscription.get(), timeout=5)
+            assert (moved["type"], moved["status"]) == ("application.moved", "offer")
+            assert moved["version"] > created["version"]
+
+            # A rejected mutation rolls back and publishes nothing
+            bad = await asyncio.to_thread(
+                client.patch, f"/applications/{app_id}",
+                json={"tags": [{"tag_id": "00000000-0000-0000-0000-000000000000", "field": "company"}]}
+            )
+            assert bad.status_code == 400
+            await asyncio.to_thread(client.delete, f"/applications/{app_id}")
+            deleted = await asyncio.wait_for(subscription.get(), timeout=5)
+            assert deleted["type"] == "application.deleted"
+        finally:
+            broker.unsubscribe(subscription)
+
+    run(scenario())
@@ -0,0 +1,133 @@
+import json
+import pytest
+from uuid import UUID, uuid4
+
+from app.main import app
+from app.database import SessionLocal
+from app.models.user import User
+from app.core.auth import get_current_user
+
+FAKE_USER_ID = UUID("123e4567-e89b-12d3-a456-426614174000")
+
+@pytest.fixture(scope="module", autouse=True)
+def override_auth():
+    app.dependency_overrides[get_current_user] = lambda: User(
+        id=FAKE_USER_ID, email="fakeuser@example.com", hashed_password="fakehashed", is_admin=False
+    )
+    yield
+    app.dependency_overrides.clear()
+
+# ---------- POST /applications/import ---------- (ECP)
+def test_import_csv_reports_row_errors(client):
+    tag_id = client.post("/tags/", json={"name": "ImportRemote"}).json()["id"]
+    body = (
+        "company,position,status,location,tags_location,tags_company\n"
+        f"ImportCo,Dev,applied,Berlin,{tag_id},\n"  # tag by id
+        "ImportCo2,QA,,,ImportRemote,\n"  # tag by name, default status
+        "ImportCoShort\n"  # missing position
+        "ImportCo3,Dev,hired,,,\n"  # any status POST /applications/ accepts
+        "ImportCo4,Dev,applied,,,NoSuchTag\n"  # unknown tag
+    )
+    res = client.post("/applications/import", content=body, headers={"Content-Type": "text/csv"})
+    assert res.status_code == 200
+    report = res.json()
+    assert (report["total"], report["imported"], report["failed"]) == (5, 3, 2)
+    assert [error["row"] for error in report["errors"]] == [3, 5]
+    assert "position" in report["errors"][0]["error"]
+    assert "NoSuchTag" in report["errors"][1]["error"]
+
+    imported = client.get("/applications/search", params={"q": "ImportCo2"}).json()["applications"]
+    assert imported[0]["status"] == "wishlist"
+    assert imported[0]["tag_ids"] == [tag_id]
+    assert client.get("/applications/search", params={"q": "ImportCo3"}).json()["applications"][0]["status"] == "hired"
+
+def test_import_ndjson_creates_missing_tags(client):
+    lines = [
+        {"company": "NdCo", "position": "Dev", "tags": {"company": ["NdFreshTag"]}},
+        {"company": "NdCo2", "position": "Dev", "tags": [{"name": "NdFreshTag", "field": "position"}]},
+        "not an object",
+    ]
+    body = "\n".join(json.dumps(line) for line in lines) + "\n{broken"
+    res = client.post(
+        "/applications/import", params={"create_tags": True}, content=body,
+        headers={"Content-Type": "application/x-ndjson"}
+    )
+    report = res.json()
+    assert (report["imported"], report["failed"]) == (2, 2)
+    assert [tag["name"] for tag in client.get("/tags/").json()].count("NdFreshTag") == 1
+
+def test_import_round_trips_export(client):
+    # An account of its own, so the export holds only the rows seeded here
+    db = SessionLocal()
+    user = User(id=uuid4(), email=f"roundtrip-{uuid4().hex[:8]}@example.com", hashed_password="temp", is_admin=False)
+    db.add(user)
+    db.commit()
+    user_id, email = user.id, user.email
+    db.close()
+    app.dependency_overrides[get_current_user] = lambda: User(
+        id=user_id, email=email, hashed_password="temp", is_admin=False
+    )
+    try:
+        tag_id = client.post("/tags/", json={"name": "RoundTripTag"}).json()["id"]
+        client.post("/applications/", json={
+            "company": "RoundTripActive", "position": "Dev", "status": "hired", "notes": "line one\nline two",
+            "tags": [{"tag_id": tag_id, "field": "location"}],
+        })
+        trashed = client.post("/applications/", json={"company": "RoundTripTrashed", "position": "Dev"}).json()["id"]
+        client.delete(f"/applications/{trashed}")
+        # PATCH accepts an empty company, so an export can contain one
+        blank = client.post("/applications/", json={"company": "RoundTripBlank", "position": "Dev"}).json()["id"]
+        assert client.patch(f"/applications/{blank}", json={"company": ""}).status_code == 200
+
+        def export(fmt):
+            return client.get("/applications/export", params={"format": fmt, "include_deleted": True}).text
+
+        def rows():
+            return sorted(
+                tuple(json.dumps(record[key], sort_keys=True) for key in (
+                    "company", "position", "status", "location", "url", "notes", "is_deleted", "tags"
+                ))
+                for record in map(json.loads, export("ndjson").splitlines())
+            )
+
+        for fmt in ("ndjson", "csv"):
+            before = rows()
+            report = client.post("/applications/import", params={"format": fmt}, content=export(fmt)).json()
+            assert report["failed"] == 0, report["errors"]
+            # Every row comes back once more, trashed ones still in the trash
+            assert rows() == sorted(before * 2)
+    finally:
+        app.dependency_overrides[get_current_user] = lambda: User(
+            id=FAKE_USER_ID, email="fakeuser@example.com", hashed_password="fakehashed", is_admin=False
+        )
+
+def test_import_runs_off_the_event_loop(client):
+    import asyncio
+    from unittest.mock import patch
+    import app.utils.importer as importer
+
+    loops = []
+    real_import = importer.import_applications
+
+    def spy(*args):
+        try:
+            loops.append(asyncio.get_running_loop())
+        except RuntimeError:
+            loops.append(None)
+        return real_import(*args)
+
+    with patch.object(importer, "import_applications", spy):
+        res = client.post("/applications/import", content="company,position\nThreadCo,Dev\n", headers={"Content-Type": "text/csv"})
+    assert res.json()["imported"] == 1
+    # In either DB_MODE the rows are parsed and written in the thread pool
+    assert loops == [None]
+
+def test_import_10k_rows_is_fast(client, count_queries):
+    body = "company,position,status\n" + "".join(f"BulkCo{i},Engineer,applied\n" for i in range(10_000))
+    with count_queries() as statements:
+        res = client.post("/applications/import", content=body, headers={"Content-Type": "text/csv"})
+
+    assert res.json()["imported"] == 10_000
+    assert res.json()["batches"] == 10
+    # A handful of statements per batch, not per row
+    assert len(statements) < 100
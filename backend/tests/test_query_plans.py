@@ -0,0 +1,159 @@
+import json
+import pytest
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+from sqlalchemy import event, insert
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.database import SessionLocal, engine, DB_MODE
+from app.models.user import User
+from app.models.application import Application
+from app.models.application_tag import ApplicationTag
+from app.models.tag import Tag
+from app.core.auth import get_current_user
+from app.constants.tag_fields import TaggableField
+
+pytestmark = pytest.mark.skipif(
+    engine.dialect.name != "postgresql" or DB_MODE != "sync",
+    reason="query plan checks need the Postgres planner and psycopg2-style statements"
+)
+
+HOT_TABLES = {"applications", "application_tags", "tags"}
+SEED_USERS = 20
+APPS_PER_USER = 200
+TAGS_PER_USER = 10
+
+# --- Seeded dataset: many users so a single user's rows are a small slice ---
+@pytest.fixture(scope="module")
+def seeded_user():
+    db = SessionLocal()
+    now = datetime.now(timezone.utc)
+    user_ids = [uuid4() for _ in range(SEED_USERS)]
+    db.execute(insert(User), [
+        {"id": uid, "email": f"plan-{uid}@example.com", "hashed_password": "x", "is_admin": "false"}
+        for uid in user_ids
+    ])
+
+    for uid in user_ids:
+        tag_rows = [{"id": uuid4(), "user_id": uid, "name": f"tag{i}"} for i in range(TAGS_PER_USER)]
+        app_rows = [
+            {
+                "id": uuid4(),
+                "user_id": uid,
+                "company": f"Co{i}",
+                "position": "Dev",
+                "status": ("wishlist", "applied", "interviewed", "offer", "declined")[i % 5],
+                "is_deleted": i % 7 == 0,
+                "created_at": now - timedelta(minutes=i),
+                "updated_at": now - timedelta(minutes=i),
+            }
+            for i in range(APPS_PER_USER)
+        ]
+        db.execute(insert(Tag), tag_rows)
+        db.execute(insert(Application), app_rows)
+        db.execute(insert(ApplicationTag), [
+            {"application_id": row["id"], "tag_id": tag_rows[i % TAGS_PER_USER]["id"], "field": TaggableField.COMPANY}
+            for i, row in enumerate(app_rows)
+        ])
+    db.commit()
+
+    with engine.connect() as conn:
+        conn.exec_driver_sql("ANALYZE applications")
+        conn.exec_driver_sql("ANALYZE application_tags")
+        conn.exec_driver_sql("ANALYZE tags")
+
+    target = db.query(User).filter(User.id == user_ids[0]).first()
+    tag_id = db.query(Tag.id).filter(Tag.user_id == target.id).first()[0]
+    db.close()
+    return target, tag_id
+
+@pytest.fixture
+def plan_client(seeded_user):
+    user, _ = seeded_user
+    app.dependency_overrides[get_current_user] = lambda: user
+    with TestClient(app) as c:
+        yield c
+    app.dependency_overrides.clear()
+
+def capture_selects(fn):
+    captured = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        fn()
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    return captured
+
+def seq_scans(plan):
+    found = []
+    if plan.get("Node Type") == "Seq Scan" and plan.get("Relation Name") in HOT_TABLES:
+        found.append(plan["Relation Name"])
+    for child in plan.get("Plans", []):
+        found.extend(seq_scans(child))
+    return found
+
+def index_names(plan):
+    found = {plan["Index Name"]} if "Index Name" in plan else set()
+    for child in plan.get("Plans", []):
+        found |= index_names(child)
+    return found
+
+def assert_uses_index(statements, index_name):
+    """
+    EXPLAIN every captured statement: none may read a hot table sequentially,
+    and at least one must go through `index_name`. Sequential scans are
+    priced out so the small seeded tables don't tip the planner towards them;
+    naming the index keeps that from passing on any index at all, such as a
+    full scan of a primary key.
+    """
+    assert statements, "no SELECT statements were captured"
+    used = set()
+    with engine.connect() as conn:
+        conn.exec_driver_sql("SET enable_seqscan = off")
+        for statement, parameters in statements:
+            raw = conn.exec_driver_sql("EXPLAIN (FORMAT JSON) " + statement, parameters).scalar()
+            plan = (raw if isinstance(raw, list) else json.loads(raw))[0]["Plan"]
+            scans = seq_scans(plan)
+            assert not scans, f"Sequential scan on {scans} for:\n{statement}"
+            used |= index_names(plan)
+    assert index_name in used, f"{index_name} not used; plans went through {sorted(used)}"
+
+@pytest.mark.parametrize("path, params, index_name", [
+    ("/applications/", {}, "ix_applications_user_active_created"),
+    ("/applications/", {"status": "applied"}, "ix_applications_user_active_status_created"),
+    ("/applications/", {"limit": 10, "include_total": False}, "ix_applications_user_active_created"),
+    ("/applications/deleted", {}, "ix_applications_user_deleted_updated"),
+    ("/tags/", {}, "ix_tags_user_id"),
+])
+def test_endpoint_queries_use_indexes(plan_client, path, params, index_name):
+    statements = capture_selects(lambda: plan_client.get(path, params=params))
+    assert_uses_index(statements, index_name)
+
+def test_cursor_page_uses_index(plan_client):
+    first = plan_client.get("/applications/", params={"limit": 10, "include_total": False}).json()
+    statements = capture_selects(
+        lambda: plan_client.get("/applications/", params={"limit": 10, "cursor": first["next_cursor"]})
+    )
+    assert_uses_index(statements, "ix_applications_user_active_created")
+
+def test_tag_reverse_lookup_uses_index(seeded_user):
+    _, tag_id = seeded_user
+    db = SessionLocal()
+    statements = capture_selects(
+        lambda: db.query(ApplicationTag).filter(ApplicationTag.tag_id == tag_id).all()
+    )
+    db.close()
+    assert_uses_index(statements, "ix_application_tags_tag_field_app")
+
+def test_tag_filter_uses_index(plan_client, seeded_user, param):
+    _, tag_id = seeded_user
+    statements = capture_selects(
+        lambda: plan_client.get("/applications/", params={param: [str(tag_id), f"company:{tag_id}"]})
+    )
+    assert_uses_index(statements, "ix_application_tags_tag_field_app")
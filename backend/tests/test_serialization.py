@@ -0,0 +1,17 @@
+import json
+import pytest
+
+from benchmarks.serialization import fast_render, legacy_render, make_rows
+
+# ---------- Fast path matches the legacy response path (10 / 100 / 1000 applications) ----------
+# Timings live in benchmarks/serialization.py.
+@pytest.mark.parametrize("count", [10, 100, 1000])
+def test_fast_serialization_matches_legacy(count):
+    rows = make_rows(count)
+    assert json.loads(fast_render(rows)) == json.loads(legacy_render(rows))
+
+def test_render_rejects_invalid_rows():
+    rows = make_rows(1)
+    del rows[0]["company"]
+    with pytest.raises(ValueError):
+        fast_render(rows)
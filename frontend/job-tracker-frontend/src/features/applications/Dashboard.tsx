@@ -42,6 +42,7 @@ const Dashboard = () => {
   const location = useLocation();
   const query = new URLSearchParams(location.search);
   const refreshKey = query.get("refresh");
+  const [liveVersion, setLiveVersion] = useState(0);
 
 
 
@@ -113,7 +114,7 @@ const Dashboard = () => {
     if (dropTarget === "trash") {
       setApps((prev) => prev.filter((app) => !group.includes(app.id)));
       try {
-        await Promise.all(group.map((id) => api.delete(`/applications/${id}`)));
+        await api.post("/applications/bulk/delete", { ids: group });
         const trashSound = new Audio("/sounds/trash.mp3");
         await trashSound.play();
       } catch (err) {
@@ -131,8 +132,21 @@ const Dashboard = () => {
     setApps(updatedApps);
 
     try {
-      await Promise.all(
-        group.map((id) => api.patch(`/applications/${id}`, { status: dropTarget }))
+      const res = await api.post("/applications/bulk/status", {
+        ids: group,
+        status: dropTarget,
+      });
+      const results: { id: string; result: string; updated_at: string | null }[] =
+        res.data.results ?? [];
+      const updated = new Map(
+        results.filter((r) => r.result === "updated").map((r) => [r.id, r.updated_at])
+      );
+      setApps((prev) =>
+        prev
+          .filter((app) => !group.includes(app.id) || updated.has(app.id))
+          .map((app) =>
+            updated.has(app.id) ? { ...app, updated_at: updated.get(app.id) ?? app.updated_at } : app
+          )
       );
     } catch (err) {
       console.error("Failed to update status", err);
@@ -154,7 +168,39 @@ const Dashboard = () => {
       }
     };
     fetchData();
-  }, [refreshKey]);
+  }, [refreshKey, liveVersion]);
+
+  // Live updates from other tabs and devices: refetch when the server says
+  // something changed. EventSource reconnects on its own after drops.
+  useEffect(() => {
+    const source = new EventSource(`${import.meta.env.VITE_API_URL}/events/stream`, {
+      withCredentials: true,
+    });
+    let pending: number | null = null;
+    const refresh = () => {
+      // Coalesce bursts (bulk moves, several tabs) into one refetch
+      if (pending !== null) return;
+      pending = window.setTimeout(() => {
+        pending = null;
+        setLiveVersion((v) => v + 1);
+      }, 250);
+    };
+    [
+      "application.created",
+      "application.updated",
+      "application.moved",
+      "application.deleted",
+      "application.restored",
+      "application.purged",
+      "tag.created",
+      "tag.deleted",
+      "resync",
+    ].forEach((type) => source.addEventListener(type, refresh));
+    return () => {
+      if (pending !== null) window.clearTimeout(pending);
+      source.close();
+    };
+  }, []);
 
   return (
     <DndContext
@@ -7,18 +7,35 @@ type User = {
   id: string;
   email: string;
   is_admin: boolean;
+  active_applications: number;
+  deleted_applications: number;
+  tags: number;
+  last_activity_at: string | null;
+};
+
+type UserPage = {
+  users: User[];
+  next_cursor: string | null;
+  totals: { users: number; applications: number; tags: number; estimated: boolean };
 };
 
 const AdminDashboard = () => {
   const [users, setUsers] = useState<User[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [totals, setTotals] = useState<UserPage["totals"] | null>(null);
+  const [search, setSearch] = useState("");
   const [loading, setLoading] = useState(true);
   const [confirmingId, setConfirmingId] = useState<string | null>(null);
   const [error, setError] = useState<string | null>(null);
 
-  const fetchUsers = async () => {
+  const fetchUsers = async (cursor?: string) => {
     try {
-      const res = await api.get("/admin/users");
-      setUsers(res.data);
+      const res = await api.get<UserPage>("/admin/users", {
+        params: { q: search || undefined, cursor },
+      });
+      setUsers((prev) => (cursor ? [...prev, ...res.data.users] : res.data.users));
+      setNextCursor(res.data.next_cursor);
+      setTotals(res.data.totals);
     } catch (err) {
       console.error("Failed to fetch users", err);
       setError("Could not load users.");
@@ -28,8 +45,9 @@ const AdminDashboard = () => {
   };
 
   useEffect(() => {
-    fetchUsers();
-  }, []);
+    const timer = setTimeout(() => fetchUsers(), 250);
+    return () => clearTimeout(timer);
+  }, [search]);
 
   const handleDelete = async (id: string) => {
     setConfirmingId(null);
@@ -66,10 +84,31 @@ const AdminDashboard = () => {
 
       {error && <p className="text-red-500 mb-4">{error}</p>}
 
+      <div className="flex items-center justify-between mb-4 gap-4">
+        <input
+          type="search"
+          value={search}
+          onChange={(e) => setSearch(e.target.value)}
+          placeholder="Search by email"
+          className="border border-gray-300 rounded-md px-3 py-1.5 text-sm w-64"
+        />
+        {totals && (
+          <p className="text-xs text-gray-500">
+            {totals.estimated ? "~" : ""}
+            {totals.users} users · {totals.estimated ? "~" : ""}
+            {totals.applications} applications · {totals.estimated ? "~" : ""}
+            {totals.tags} tags
+          </p>
+        )}
+      </div>
+
       <table className="w-full text-sm table-auto border-collapse">
         <thead>
           <tr className="text-left border-b border-gray-300">
             <th className="py-2">User</th>
+            <th className="py-2">Applications</th>
+            <th className="py-2">Tags</th>
+            <th className="py-2">Last activity</th>
             <th className="py-2">Admin</th>
             <th className="py-2">Actions</th>
           </tr>
@@ -78,6 +117,16 @@ const AdminDashboard = () => {
           {users.map((u) => (
             <tr key={u.id} className="border-b border-gray-100 hover:bg-gray-50">
               <td className="py-2">{u.email || "—"}</td>
+              <td className="py-2">
+                {u.active_applications}
+                {u.deleted_applications > 0 && (
+                  <span className="text-gray-400"> (+{u.deleted_applications} deleted)</span>
+                )}
+              </td>
+              <td className="py-2">{u.tags}</td>
+              <td className="py-2">
+                {u.last_activity_at ? new Date(u.last_activity_at).toLocaleDateString() : "—"}
+              </td>
               <td className="py-2">{u.is_admin ? "Yes" : "No"}</td>
               <td className="py-2 flex items-center gap-2">
                 <button
@@ -125,6 +174,15 @@ const AdminDashboard = () => {
           ))}
         </tbody>
       </table>
+
+      {nextCursor && (
+        <button
+          onClick={() => fetchUsers(nextCursor)}
+          className="mt-4 text-sm text-blue-600 hover:text-blue-800"
+        >
+          Load more
+        </button>
+      )}
     </div>
   );
 };
@@ -35,16 +35,37 @@ const TrashPage = () => {
     }
   };
 
+  const handleEmptyTrash = async () => {
+    if (!confirm("Permanently delete everything in the trash?")) return;
+    try {
+      await api.post("/applications/bulk/purge", { all: true });
+      setDeletedApps([]);
+    } catch (err) {
+      alert("Failed to empty trash.");
+      fetchDeletedApps();
+    }
+  };
+
   useEffect(() => {
     fetchDeletedApps();
   }, []);
 
   return (
     <div className="p-6 max-w-5xl mx-auto">
-      <h1 className="text-2xl font-semibold mb-4 flex items-center gap-2">
-        <Trash2 className="w-6 h-6 text-red-500" />
-        Trash Bin
-      </h1>
+      <div className="flex items-center justify-between mb-4">
+        <h1 className="text-2xl font-semibold flex items-center gap-2">
+          <Trash2 className="w-6 h-6 text-red-500" />
+          Trash Bin
+        </h1>
+        {deletedApps.length > 0 && (
+          <button
+            onClick={handleEmptyTrash}
+            className="text-sm text-red-600 border border-red-200 rounded px-3 py-1 hover:bg-red-50"
+          >
+            Empty Trash
+          </button>
+        )}
+      </div>
   
       {deletedApps.length === 0 ? (
         <p className="text-gray-500">No deleted applications.</p>